@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""
+Benchmark endpoint baca API di bawah WSGI dan ASGI: request/detik dan
+latency p50/p99 pada sejumlah request bersamaan.
+
+Usage:
+    python benchmarks/asgi.py --requests 2000 --concurrency 32
+    python benchmarks/asgi.py --no-cache          # tanpa response cache API
+    python benchmarks/asgi.py --url http://127.0.0.1:8000 --concurrency 64
+
+Mode default (in-process, tanpa socket) menjalankan handler Django langsung:
+- wsgi:       WSGIHandler dari thread pool (seperti server WSGI ber-thread),
+              ViewSet DRF
+- asgi-sync:  ASGIHandler di event loop, ViewSet DRF (sync_to_async per request)
+- asgi-async: ASGIHandler di event loop, view async products/async_views.py
+              (seperti PRODUCT_API_ASYNC = True)
+
+--url mengukur server yang sudah berjalan, mis.
+    gunicorn -w 4 --threads 8 fastprint_project.wsgi
+    uvicorn --workers 4 fastprint_project.asgi:application
+dengan client HTTP ber-thread (gunakan --concurrency yang sama untuk keduanya).
+
+Data: produk yang sudah ada di database; jalankan benchmarks/listing_indexes.py
+atau import_products terlebih dahulu untuk data yang besar.
+"""
+
+import argparse
+import asyncio
+import http.client
+import io
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import override_settings
+from django.urls import include, path
+
+from products import lookups
+from products import urls as product_urls
+from products.models import Product
+
+HOST = 'testserver'
+
+
+class AsyncURLConf:
+    """URLconf dengan PRODUCT_API_ASYNC aktif."""
+    urlpatterns = product_urls.async_api_urlpatterns + [path('', include(settings.ROOT_URLCONF))]
+
+
+def targets():
+    """(path, query string) endpoint yang diukur, bergiliran per request."""
+    sellable = Product.objects.filter(status_id=lookups.sellable_status_id())
+    pks = list(sellable.order_by('-created_at').values_list('pk', flat=True)[:50])
+    kategori_id = sellable.values_list('kategori_id', flat=True).first()
+    if not pks:
+        sys.exit('Tidak ada produk "bisa dijual" di database')
+    return [
+        ('/api/products/', urlencode({'limit': 20})),
+        ('/api/products/', urlencode({'limit': 20, 'ordering': 'harga'})),
+        ('/api/products/by_kategori/', urlencode({'kategori_id': kategori_id, 'limit': 20})),
+        ('/api/kategoris/', ''),
+        ('/api/statuses/', ''),
+    ] + [(f'/api/products/{pk}/', '') for pk in pks[:5]]
+
+
+def report(label, latencies, elapsed):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<12} {len(latencies) / elapsed:9.0f} req/s   p50 {statistics.median(latencies) * 1000:7.2f} ms"
+          f"   p99 {p99 * 1000:7.2f} ms")
+
+
+def run_wsgi(urls, count, concurrency):
+    handler = WSGIHandler()
+
+    def call(i):
+        url, query = urls[i % len(urls)]
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': url, 'QUERY_STRING': query, 'SCRIPT_NAME': '',
+            'SERVER_NAME': HOST, 'SERVER_PORT': '80', 'HTTP_HOST': HOST, 'SERVER_PROTOCOL': 'HTTP/1.1',
+            'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+        }
+        start = time.perf_counter()
+        body = handler(environ, lambda status, headers, exc_info=None: None)
+        b''.join(body)
+        body.close()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(call, range(concurrency)))  # warm-up
+        start = time.perf_counter()
+        latencies = list(pool.map(call, range(count)))
+    return latencies, time.perf_counter() - start
+
+
+async def _asgi_call(handler, url, query):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+        'path': url, 'raw_path': url.encode(), 'query_string': query.encode(), 'root_path': '',
+        'headers': [(b'host', HOST.encode())], 'server': (HOST, 80), 'client': ('127.0.0.1', 50000),
+    }
+    disconnect = asyncio.Event()
+    sent = {'body': False}
+
+    async def receive():
+        if not sent['body']:
+            sent['body'] = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnect.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.body' and not message.get('more_body'):
+            disconnect.set()
+
+    start = time.perf_counter()
+    await handler(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def run_asgi(urls, count, concurrency):
+    handler = ASGIHandler()
+
+    async def worker(indexes, latencies):
+        for i in indexes:
+            url, query = urls[i % len(urls)]
+            latencies.append(await _asgi_call(handler, url, query))
+
+    async def main():
+        await asyncio.gather(*(worker(range(w, concurrency, concurrency), []) for w in range(concurrency)))
+        latencies = []
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(range(w, count, concurrency), latencies) for w in range(concurrency)))
+        return latencies, time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+def run_remote(base_url, urls, count, concurrency):
+    parts = urlsplit(base_url)
+    local = threading.local()
+
+    def call(i):
+        url, query = urls[i % len(urls)]
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        start = time.perf_counter()
+        conn.request('GET', f'{url}?{query}' if query else url)
+        conn.getresponse().read()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(call, range(concurrency)))
+        start = time.perf_counter()
+        latencies = list(pool.map(call, range(count)))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--no-cache', action='store_true', help='Matikan response cache API')
+    parser.add_argument('--url', help='Ukur server yang sudah berjalan di URL ini')
+    args = parser.parse_args()
+
+    urls = targets()
+    print(f"{args.requests} request, concurrency {args.concurrency}, {len(urls)} URL bergiliran")
+
+    if args.url:
+        report('remote', *run_remote(args.url, urls, args.requests, args.concurrency))
+        return
+
+    cache_settings = {**getattr(settings, 'PRODUCT_API_CACHE', {}), 'ENABLED': not args.no_cache}
+    with override_settings(PRODUCT_API_CACHE=cache_settings, ALLOWED_HOSTS=[HOST, *settings.ALLOWED_HOSTS]):
+        report('wsgi', *run_wsgi(urls, args.requests, args.concurrency))
+        report('asgi-sync', *run_asgi(urls, args.requests, args.concurrency))
+        with override_settings(ROOT_URLCONF=AsyncURLConf):
+            report('asgi-async', *run_asgi(urls, args.requests, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmark index autocomplete (products/autocomplete.PrefixIndex) tanpa database.
+
+Usage:
+    python benchmarks/autocomplete.py --products 200000 --queries 10000
+
+Nama produk sintetis: jenis + merek + 1-2 atribut + kode, mirip katalog ATK.
+Menampilkan waktu build, perkiraan memori, dan latensi query (median/p99)
+untuk query satu kata dan dua kata (prefix).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from products.autocomplete import PrefixIndex
+
+TYPES = [
+    'kertas', 'tinta', 'printer', 'pulpen', 'spidol', 'map', 'amplop', 'buku', 'stapler', 'label',
+    'cartridge', 'toner', 'pensil', 'penghapus', 'penggaris', 'gunting', 'lem', 'isolasi', 'binder', 'klip',
+]
+BRANDS = [f'{prefix}{suffix}' for prefix in ('sinar', 'fast', 'joy', 'king', 'pro', 'max', 'star', 'nusa')
+          for suffix in ('dunia', 'print', 'ko', 'tech', 'jaya')]
+ATTRIBUTES = [
+    'a4', 'f4', 'a3', 'folio', 'hvs', 'hitam', 'biru', 'merah', 'hijau', 'kuning', 'putih', 'refill',
+    'plastik', 'besar', 'kecil', 'sedang', '70gsm', '80gsm', 'glossy', 'doff', 'warna', 'original',
+    'isi', 'ulang', 'premium', 'ekonomis', 'pack', 'lusin', 'rim', 'box',
+]
+
+
+def synthetic_names(count, seed=42):
+    rng = random.Random(seed)
+    for i in range(count):
+        words = [rng.choice(TYPES), rng.choice(BRANDS)] + rng.sample(ATTRIBUTES, rng.randint(1, 2))
+        yield i + 1, f"{' '.join(words).title()} {i:06d}"
+
+
+def prefix(rng, word):
+    return word[:rng.randint(2, len(word))]
+
+
+def run(index, queries, label):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, 10)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"{label}: median {timings[len(timings) // 2]:.3f} ms, "
+          f"p99 {timings[int(len(timings) * 0.99)]:.3f} ms, max {timings[-1]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--products', type=int, default=200_000)
+    parser.add_argument('--queries', type=int, default=10_000)
+    args = parser.parse_args()
+
+    index = PrefixIndex(max_products=args.products)
+    start = time.perf_counter()
+    index.load(synthetic_names(args.products))
+    print(f"Build {len(index)} products / {len(index.vocab)} distinct words: {time.perf_counter() - start:.2f}s")
+    print(f"Memory (approx): {index.memory_bytes() / 1024 / 1024:.1f} MB")
+
+    rng = random.Random(7)
+    vocabulary = TYPES + BRANDS + ATTRIBUTES
+    run(index, [prefix(rng, rng.choice(vocabulary)) for _ in range(args.queries)], 'Satu kata')
+    run(index, [
+        f"{rng.choice(TYPES)} {prefix(rng, rng.choice(BRANDS + ATTRIBUTES))}" for _ in range(args.queries)
+    ], 'Dua kata ')
+
+    start = time.perf_counter()
+    index.add(args.products + 1, 'Kertas Baru Sekali')
+    index.remove(args.products + 1)
+    print(f"Incremental add+remove: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Benchmark query plan listing "bisa dijual" sebelum dan sesudah index
+listing (migration 0007/0008: product_status_created_id_idx,
+product_status_kat_crtd_id_idx, product_nama_trgm_idx), termasuk halaman
+ke-10.000 dengan OFFSET vs keyset pagination.
+
+Usage:
+    python benchmarks/listing_indexes.py --rows 1000000
+    python benchmarks/listing_indexes.py --skip-seed      # pakai data yang sudah ada
+    python benchmarks/listing_indexes.py --cleanup        # hapus data benchmark
+
+Mode "before" men-drop index di dalam transaksi lalu di-rollback, jadi
+database tidak berubah. Gunakan PostgreSQL untuk hasil yang representatif
+(EXPLAIN ANALYZE); di SQLite yang ditampilkan EXPLAIN QUERY PLAN.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from django.db import connection, transaction
+
+from products.models import Product, Kategori, Status
+from products.pagination import DEFAULT_ORDERING, keyset_filter
+
+PREFIX = 'Bench Produk'
+SELLABLE = 'bisa dijual'
+INDEXES = ['product_status_created_id_idx', 'product_status_kat_crtd_id_idx', 'product_nama_trgm_idx']
+DEEP_PAGE = 10_000
+PAGE_SIZE = 10
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(rows, batch_size=10000):
+    """Isi tabel produk sampai ada `rows` produk benchmark."""
+    kategoris = [Kategori.objects.get_or_create(nama_kategori=f'Bench Kategori {i}')[0] for i in range(50)]
+    sellable, _ = Status.objects.get_or_create(nama_status=SELLABLE)
+    other, _ = Status.objects.get_or_create(nama_status='tidak bisa dijual')
+
+    existing = Product.objects.filter(nama_produk__startswith=PREFIX).count()
+    print(f"Seeding {max(rows - existing, 0)} products ({existing} already present)...")
+    start = time.perf_counter()
+
+    for offset in range(existing, rows, batch_size):
+        Product.objects.bulk_create([
+            Product(
+                nama_produk=f'{PREFIX} {i:07d}',
+                harga=1000 + (i * 37) % 500000,
+                kategori=kategoris[i % len(kategoris)],
+                status=sellable if i % 4 else other,
+                content_hash='',
+            )
+            for i in range(offset, min(offset + batch_size, rows))
+        ])
+
+    print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+
+def hot_queries():
+    """Query dari ProductViewSet.get_queryset, product_list, dan by_kategori."""
+    kategori = Kategori.objects.filter(nama_kategori='Bench Kategori 7').first()
+    base = Product.objects.filter(status__nama_status=SELLABLE).select_related('kategori', 'status')
+    ordered = base.order_by(*DEFAULT_ORDERING)
+
+    # Baris terakhir halaman sebelum DEEP_PAGE, sebagai posisi cursor keyset
+    offset = (DEEP_PAGE - 1) * PAGE_SIZE
+    boundary = ordered.values_list('created_at', 'id_produk')[offset - 1:offset].first()
+
+    queries = {
+        'list terbaru (page 1)': ordered[:PAGE_SIZE],
+        f'list OFFSET (page {DEEP_PAGE})': ordered[offset:offset + PAGE_SIZE],
+    }
+    if boundary is not None:
+        queries[f'list keyset (page {DEEP_PAGE})'] = ordered.filter(
+            keyset_filter(DEFAULT_ORDERING, boundary)
+        )[:PAGE_SIZE]
+
+    return {
+        **queries,
+        'by_kategori terbaru': base.filter(kategori=kategori).order_by(*DEFAULT_ORDERING)[:PAGE_SIZE],
+        'search icontains': base.filter(nama_produk__icontains='produk 00123').order_by(*DEFAULT_ORDERING)[:PAGE_SIZE],
+        'sync lookup nama_produk': Product.objects.filter(nama_produk__in=[f'{PREFIX} 0000042', f'{PREFIX} 0999999']),
+    }
+
+
+def explain_all(label):
+    print(f"\n{'=' * 70}\n{label}\n{'=' * 70}")
+    analyze = connection.vendor == 'postgresql'
+
+    for name, queryset in hot_queries().items():
+        start = time.perf_counter()
+        list(queryset)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"\n--- {name}: {elapsed:.2f} ms")
+        print(queryset.explain(analyze=True) if analyze else queryset.explain())
+
+
+def drop_indexes():
+    with connection.cursor() as cursor:
+        for name in INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--skip-seed', action='store_true')
+    parser.add_argument('--cleanup', action='store_true')
+    args = parser.parse_args()
+
+    if args.cleanup:
+        deleted, _ = Product.objects.filter(nama_produk__startswith=PREFIX).delete()
+        print(f"Deleted {deleted} benchmark rows")
+        return
+
+    if not args.skip_seed:
+        seed(args.rows)
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE' if connection.vendor != 'postgresql' else 'ANALYZE products_product')
+
+    try:
+        with transaction.atomic():
+            drop_indexes()
+            explain_all('BEFORE (tanpa index listing/trigram)')
+            raise Rollback
+    except Rollback:
+        pass
+
+    explain_all('AFTER (dengan index listing)')
+
+
+if __name__ == '__main__':
+    main()
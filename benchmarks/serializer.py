@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Benchmark serialisasi list produk: ProductSerializer + JSONRenderer DRF vs
+products/fast_serializers.py + FastJSONRenderer, tanpa database.
+
+Usage:
+    python benchmarks/serializer.py --rows 10000 --repeat 5
+
+Produk sintetis dibuat di memori (instance model untuk jalur DRF, dict
+.values() untuk jalur cepat). Menampilkan rows/detik untuk serialisasi saja
+dan serialisasi + render JSON, serta memastikan byte output keduanya sama.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from products.fast_serializers import PRODUCT_COLUMNS, serialize_rows
+from products.models import Kategori, Product, Status
+from products.renderers import FastJSONRenderer, orjson
+from products.serializers import KategoriSerializer, ProductSerializer, StatusSerializer
+
+
+def synthetic(rows):
+    now = timezone.now()
+    kategoris = [Kategori(id_kategori=i, nama_kategori=f'Kategori {i}', created_at=now, updated_at=now)
+                 for i in range(1, 21)]
+    statuses = [Status(id_status=i, nama_status=name, created_at=now, updated_at=now)
+                for i, name in enumerate(['bisa dijual', 'tidak bisa dijual'], start=1)]
+    products = []
+    for i in range(rows):
+        created = now - timedelta(minutes=i)
+        products.append(Product(
+            id_produk=i + 1,
+            nama_produk=f'Kertas HVS A4 {i:06d}',
+            harga=Decimal(1000 + (i * 37) % 500000),
+            kategori=kategoris[i % len(kategoris)],
+            status=statuses[0],
+            deskripsi='Kertas putih 70gsm isi 500 lembar' if i % 3 else None,
+            created_at=created,
+            updated_at=created,
+        ))
+    return kategoris, statuses, products
+
+
+def measure(label, func, rows, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:9.1f} ms  {rows / best:12,.0f} rows/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    kategoris, statuses, products = synthetic(args.rows)
+    kategori_data = {item['id_kategori']: item for item in KategoriSerializer(kategoris, many=True).data}
+    status_data = {item['id_status']: item for item in StatusSerializer(statuses, many=True).data}
+    values = [
+        {column: getattr(product, column) for column in PRODUCT_COLUMNS}
+        for product in products
+    ]
+
+    print(f"{args.rows} rows, orjson {'aktif' if orjson else 'tidak terpasang'}")
+    drf = measure('ProductSerializer', lambda: ProductSerializer(products, many=True).data, args.rows, args.repeat)
+    fast = measure('fast_serializers', lambda: serialize_rows(values, kategori_data, status_data), args.rows,
+                   args.repeat)
+
+    drf_bytes = measure('ProductSerializer + render', lambda: JSONRenderer().render(
+        ProductSerializer(products, many=True).data), args.rows, args.repeat)
+    fast_bytes = measure('fast + FastJSONRenderer', lambda: FastJSONRenderer().render(
+        serialize_rows(values, kategori_data, status_data)), args.rows, args.repeat)
+
+    assert list(drf) == fast, 'data berbeda'
+    assert drf_bytes == fast_bytes, 'output JSON berbeda'
+    print(f"Output identik ({len(fast_bytes) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
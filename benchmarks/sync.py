@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmark sinkronisasi API offline: fixture sintetis N produk diputar ulang
+lewat FASTPRINT_API['TRANSPORT'] = 'replay' (tanpa jaringan) atau lewat stub
+server HTTP lokal (--http), lalu dijalankan dengan pipeline yang sama dengan
+worker (enqueue_sync + claim_job + run_job).
+
+Usage:
+    python benchmarks/sync.py --products 100000
+    python benchmarks/sync.py --products 100000 --http
+    python benchmarks/sync.py --fixture fixtures/api_feed.json   # fixture rekaman
+    python benchmarks/sync.py --cleanup                          # hapus data benchmark
+
+Tiga skenario: import pertama (semua baris baru), import ulang paksa (diff
+tanpa perubahan), dan fetch conditional (304, parse+import dilewati).
+Catalogue memakai URL khusus benchmark, jadi deteksi produk yang hilang
+tidak menyentuh produk dari API sungguhan.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.test.utils import override_settings
+
+from products import stats
+from products.jobs import claim_job, enqueue_sync, run_job
+from products.models import APIFetchState, Product, SyncJob, SyncSnapshot
+from products.services import reset_session
+from products.transports import SYNTHETIC_PREFIX, fixture_server, write_synthetic_feed
+
+REPLAY_URL = 'http://fixture.invalid/api_tes_programmer'
+
+
+def run(label, force):
+    enqueue_sync(username='bench', force=force)
+    job = claim_job(worker='bench')
+    start = time.perf_counter()
+    job = run_job(job)
+    elapsed = time.perf_counter() - start
+
+    if job.status != SyncJob.STATUS_SUCCESS:
+        raise SystemExit(f"{label}: gagal - {job.error}")
+    if job.not_modified:
+        print(f"{label:<26} {elapsed * 1000:9.1f} ms  not modified")
+    else:
+        rate = job.processed / elapsed if elapsed else 0
+        print(f"{label:<26} {elapsed * 1000:9.1f} ms  {rate:>10,.0f} baris/detik  "
+              f"({job.created} baru, {job.updated} diperbarui, {job.unchanged} tidak berubah)")
+
+
+def benchmark(fixture, http):
+    base = {**getattr(settings, 'FASTPRINT_API', {}), 'FIXTURE': fixture, 'MAX_RETRIES': 0}
+    server = None
+    if http:
+        server = fixture_server(fixture)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = {**base, 'TRANSPORT': 'live', 'URL': f'http://127.0.0.1:{server.server_port}/'}
+    else:
+        config = {**base, 'TRANSPORT': 'replay', 'URL': REPLAY_URL}
+
+    print(f"Transport: {'HTTP stub server ' + config['URL'] if http else 'replay (in-process)'}")
+    reset_session()
+    try:
+        with override_settings(FASTPRINT_API=config):
+            APIFetchState.objects.filter(url=config['URL']).delete()
+            run('import pertama', force=True)
+            run('import ulang (paksa)', force=True)
+            run('conditional (304)', force=False)
+    finally:
+        reset_session()
+        if server:
+            server.shutdown()
+            server.server_close()
+
+
+def cleanup():
+    with transaction.atomic(), stats.bulk_changes():
+        deleted = Product.objects.filter(nama_produk__startswith=SYNTHETIC_PREFIX).delete()[0]
+    print(f"Deleted {deleted} benchmark products")
+    for model, field in ((APIFetchState, 'url'), (SyncSnapshot, 'source'), (SyncJob, 'catalogue')):
+        benchmark_feed = Q(**{field: REPLAY_URL}) | Q(**{f'{field}__startswith': 'http://127.0.0.1:'})
+        model.objects.filter(benchmark_feed).delete()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--products', type=int, default=100_000, help='Jumlah produk fixture sintetis')
+    parser.add_argument('--fixture', help='Pakai fixture yang sudah ada (rekaman api_fixture record)')
+    parser.add_argument('--http', action='store_true', help='Lewat stub server HTTP lokal, bukan replay in-process')
+    parser.add_argument('--cleanup', action='store_true', help='Hapus produk dan job benchmark')
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = args.fixture
+        if not fixture:
+            fixture = os.path.join(tmp, 'feed.json')
+            start = time.perf_counter()
+            write_synthetic_feed(args.products, fixture)
+            print(f"Fixture sintetis {args.products:,} produk "
+                  f"({os.path.getsize(fixture):,} bytes) dalam {time.perf_counter() - start:.1f}s")
+        benchmark(os.path.abspath(fixture), args.http)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmark render halaman product_list dan product_detail tanpa dan dengan
+cache fragment template (products/fragments.py).
+
+Usage:
+    python benchmarks/templates.py --rows 5000 --page-size 50 --repeat 20
+    python benchmarks/templates.py --cleanup      # hapus data benchmark
+
+"before" = PRODUCT_TEMPLATE_CACHE_TIMEOUT = 0: setiap kartu produk dan
+dropdown kategori dirender ulang dan facet dihitung setiap request.
+"after" = fragment sudah ada di cache (request pertama dibuang). Waktu
+per render mencakup query view, jadi angka ini adalah waktu respons halaman
+tanpa middleware. Output HTML kedua mode dipastikan sama.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fastprint_project.settings')
+
+import django
+
+django.setup()
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from products import stats, views
+from products.models import Kategori, Product, Status
+
+PREFIX = 'Template Bench'
+SELLABLE = 'bisa dijual'
+
+
+def seed(rows, batch_size=5000):
+    """Isi tabel produk sampai ada `rows` produk benchmark."""
+    kategoris = [Kategori.objects.get_or_create(nama_kategori=f'{PREFIX} Kategori {i}')[0] for i in range(20)]
+    sellable, _ = Status.objects.get_or_create(nama_status=SELLABLE)
+
+    existing = Product.objects.filter(nama_produk__startswith=PREFIX).count()
+    for offset in range(existing, rows, batch_size):
+        Product.objects.bulk_create([
+            Product(
+                nama_produk=f'{PREFIX} {i:06d}',
+                harga=1000 + (i * 37) % 500000,
+                kategori=kategoris[i % len(kategoris)],
+                status=sellable,
+                deskripsi='Kertas putih 70gsm isi 500 lembar',
+            )
+            for i in range(offset, min(offset + batch_size, rows))
+        ])
+    stats.refresh([kategori.pk for kategori in kategoris])
+    print(f"{max(rows, existing)} produk benchmark")
+
+
+def cleanup():
+    with transaction.atomic(), stats.bulk_changes():
+        deleted, _ = Product.objects.filter(nama_produk__startswith=PREFIX).delete()
+        Kategori.objects.filter(nama_kategori__startswith=PREFIX).delete()
+    print(f"Deleted {deleted} rows")
+
+
+def measure(label, view, request, repeat, **kwargs):
+    view(request, **kwargs)  # warm-up: template ter-compile, fragment (jika aktif) tersimpan
+    best = float('inf')
+    total = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = view(request, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+    print(f"{label:<34} {total / repeat * 1000:8.2f} ms/render  (best {best * 1000:.2f} ms)")
+    return response.content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--cleanup', action='store_true')
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+
+    seed(args.rows)
+    factory = RequestFactory()
+    pages = [
+        ('product_list', views.product_list, factory.get('/'), {}),
+        ('product_list ?search=', views.product_list, factory.get('/', {'search': f'{PREFIX} 000042'}), {}),
+        ('product_detail', views.product_detail, factory.get('/'),
+         {'pk': Product.objects.filter(nama_produk__startswith=PREFIX).values_list('pk', flat=True).first()}),
+    ]
+
+    with override_settings(PRODUCT_LIST_PAGE_SIZE=args.page_size):
+        for name, view, request, kwargs in pages:
+            cache.clear()
+            with override_settings(PRODUCT_TEMPLATE_CACHE_TIMEOUT=0):
+                before = measure(f'{name} (before)', view, request, args.repeat, **kwargs)
+            after = measure(f'{name} (after)', view, request, args.repeat, **kwargs)
+            assert before == after, f'output {name} berbeda'
+
+
+if __name__ == '__main__':
+    main()
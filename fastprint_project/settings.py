@@ -68,6 +68,18 @@ TEMPLATES = [
     },
 ]
 
+# Production: cached template loader secara eksplisit (template di-compile
+# sekali per proses, tanpa cek perubahan file). Saat DEBUG Django memakai
+# loader default yang me-reload template yang berubah.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'fastprint_project.wsgi.application'
 
 
@@ -86,6 +98,56 @@ DATABASES = {
 }
 
 
+# Cache
+# 'default': cache lookup, progress job, version key (lokal per proses).
+# 'api': response cache endpoint API read-only (products/response_cache.py).
+# Pilih backend 'api' lewat PRODUCT_API_CACHE_BACKEND:
+#   'locmem'  - per proses (development)
+#   'file'    - dibagi antar proses di satu host
+#   'redis'   - dibagi antar host (butuh paket redis dan server Redis)
+#   'memory-redis' - stand-in Redis in-process (products/cache_backends.py)
+# Generation counter invalidasi disimpan di cache 'api': worker sync
+# (run_sync_worker) menulis dari proses lain, jadi di luar development pakai
+# backend bersama. `manage.py check --deploy` memperingatkan (products.W001)
+# jika backend masih per proses.
+PRODUCT_API_CACHE_BACKEND = 'locmem' if DEBUG else 'file'
+API_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'products.cache_backends.AsyncLocMemCache',
+        'LOCATION': 'product-api',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'api',
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+    },
+    'memory-redis': {
+        'BACKEND': 'products.cache_backends.InMemoryRedisCache',
+        'LOCATION': 'memory://product-api',
+    },
+}
+
+CACHES = {
+    'default': {
+        # LocMemCache dengan aget/aset langsung untuk view async (products/async_views.py)
+        'BACKEND': 'products.cache_backends.AsyncLocMemCache',
+    },
+    'api': {
+        **API_CACHE_BACKENDS[PRODUCT_API_CACHE_BACKEND],
+        'KEY_PREFIX': 'fastprint',
+    },
+}
+
+PRODUCT_API_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'api',
+    'TIMEOUT': 300,     # detik; invalidasi utama lewat generation counter
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -137,3 +199,76 @@ REST_FRAMEWORK = {
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+
+# FastPrint API Sync
+# Jumlah baris per batch untuk bulk_create/bulk_update saat sinkronisasi
+FASTPRINT_SYNC_BATCH_SIZE = 500
+
+# Ukuran chunk (bytes) saat membaca response API secara streaming
+FASTPRINT_STREAM_CHUNK_SIZE = 64 * 1024
+# Body di-spool hanya jika perlu dibandingkan dengan body_hash import terakhir;
+# body lebih besar dari ini di-spool ke file sementara, bukan memori
+FASTPRINT_SPOOL_MAX_SIZE = 5 * 1024 * 1024
+
+# Sync Job Worker (manage.py run_sync_worker)
+# True: job langsung dijalankan di dalam request (development tanpa worker)
+FASTPRINT_SYNC_INLINE = False
+# Job running tanpa heartbeat lebih lama dari ini (detik) dianggap gagal
+FASTPRINT_SYNC_JOB_TIMEOUT = 30 * 60
+# Interval (detik) worker menulis heartbeat selama job berjalan; harus jauh di bawah timeout
+FASTPRINT_SYNC_HEARTBEAT_INTERVAL = 60
+
+# FastPrint API HTTP client (products/services.py)
+FASTPRINT_API = {
+    'URL': 'https://recruitment.fastprint.co.id/tes/api_tes_programmer',
+    'CONNECT_TIMEOUT': 3.05,    # detik untuk membuka koneksi TCP/TLS
+    'READ_TIMEOUT': 10,         # detik menunggu data dari server
+    'POOL_CONNECTIONS': 1,      # jumlah host yang di-cache pool-nya
+    'POOL_MAXSIZE': 10,         # koneksi keep-alive maksimal per host
+    'MAX_RETRIES': 3,           # retry untuk timeout, connection error, dan 5xx
+    'BACKOFF_FACTOR': 0.5,      # delay retry: factor * 2^attempt detik
+    'BACKOFF_MAX': 10,          # batas atas delay retry (detik)
+    'VERIFY_SSL': True,
+    'TIME_ZONE': 'Asia/Jakarta',  # zona tanggal untuk password/username harian
+    # 'live': API sungguhan, 'record': API sungguhan + simpan response ke FIXTURE,
+    # 'replay': layani dari FIXTURE tanpa jaringan (benchmark/test offline)
+    'TRANSPORT': 'live',
+    'FIXTURE': 'fixtures/api_feed.json',  # relatif terhadap BASE_DIR
+}
+
+# Cache lookup Status/Kategori (products/lookups.py): umur maksimal map
+# in-process (detik) walaupun version key di cache tidak berubah
+LOOKUP_CACHE_TTL = 60
+
+# Pagination listing produk (products/pagination.py)
+# 'seek': keyset pagination + jumlah perkiraan (tanpa COUNT/OFFSET), 'page': Paginator biasa
+PRODUCT_LIST_PAGINATION = 'seek'
+PRODUCT_LIST_PAGE_SIZE = 10
+# Umur cache fragment template (kartu produk, dropdown kategori, detail) dalam
+# detik di cache 'default' (products/fragments.py); 0 = tanpa cache fragment
+PRODUCT_TEMPLATE_CACHE_TIMEOUT = 600
+# API: page size default/maksimal untuk ?limit= atau ?page_size=
+PRODUCT_API_PAGE_SIZE = 10
+PRODUCT_API_MAX_PAGE_SIZE = 100
+# List/by_kategori API lewat serializer cepat (.values() + data lookup, products/fast_serializers.py);
+# JSON ditulis dengan orjson jika terpasang (products/renderers.py)
+PRODUCT_API_FAST_SERIALIZER = True
+# Endpoint baca API (list, detail, by_kategori, kategoris, statuses) sebagai view
+# async (products/async_views.py). Aktifkan untuk deployment ASGI
+# (fastprint_project.asgi:application); di WSGI biarkan False.
+PRODUCT_API_ASYNC = False
+# Jumlah baris per fetch server-side cursor untuk /api/products/export/
+PRODUCT_EXPORT_CHUNK_SIZE = 2000
+# Jumlah item maksimal per request /api/products/bulk/ (batch SQL memakai FASTPRINT_SYNC_BATCH_SIZE)
+PRODUCT_BULK_MAX_ITEMS = 10_000
+
+# Full-text search produk (products/search.py): 'auto', 'postgres', 'sqlite',
+# 'simple' (icontains), atau dotted path ke subclass SearchBackend
+PRODUCT_SEARCH_BACKEND = 'auto'
+
+# Autocomplete nama produk in-memory (products/autocomplete.py): jumlah
+# produk maksimal di index per proses (produk terbaru diutamakan)
+AUTOCOMPLETE_MAX_PRODUCTS = 200_000
+# Interval (detik) setiap proses membaca ProductChange dan menerapkan perubahan
+# dari proses lain (worker sync, bulk API) ke index-nya
+AUTOCOMPLETE_REFRESH_INTERVAL = 5
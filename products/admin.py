@@ -3,7 +3,7 @@ Django Admin Configuration untuk app products.
 """
 
 from django.contrib import admin
-from .models import Product, Kategori, Status
+from .models import Product, Kategori, Status, SyncSnapshot, SyncJob, APIFetchState, PriceAdjustment, KategoriStats
 
 
 @admin.register(Kategori)
@@ -44,3 +44,43 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
     ordering = ['-created_at']
+
+
+@admin.register(SyncSnapshot)
+class SyncSnapshotAdmin(admin.ModelAdmin):
+    """Admin untuk snapshot feed sinkronisasi (read only)."""
+    list_display = ['source', 'product_count', 'feed_hash', 'applied_at']
+    readonly_fields = ['source', 'entries', 'product_count', 'feed_hash', 'applied_at']
+
+
+@admin.register(SyncJob)
+class SyncJobAdmin(admin.ModelAdmin):
+    """Admin untuk antrian SyncJob."""
+    list_display = ['id', 'catalogue', 'status', 'processed', 'created', 'updated', 'created_at', 'finished_at']
+    list_filter = ['status', 'catalogue']
+    readonly_fields = ['created_at', 'started_at', 'finished_at', 'heartbeat_at']
+
+
+@admin.register(APIFetchState)
+class APIFetchStateAdmin(admin.ModelAdmin):
+    """Admin untuk validator conditional fetch API."""
+    list_display = ['url', 'etag', 'last_modified', 'body_hash', 'updated_at']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(PriceAdjustment)
+class PriceAdjustmentAdmin(admin.ModelAdmin):
+    """Admin untuk audit penyesuaian harga massal (read only)."""
+    list_display = ['id', 'operation', 'value', 'affected', 'total_before', 'total_after', 'performed_by', 'created_at']
+    list_filter = ['operation']
+    readonly_fields = [
+        'operation', 'value', 'filters', 'affected', 'total_before', 'total_after', 'performed_by', 'created_at'
+    ]
+
+
+@admin.register(KategoriStats)
+class KategoriStatsAdmin(admin.ModelAdmin):
+    """Admin untuk ringkasan statistik kategori (read only, dipelihara otomatis)."""
+    list_display = ['kategori', 'status', 'product_count', 'min_harga', 'max_harga', 'total_harga', 'updated_at']
+    list_filter = ['status']
+    readonly_fields = ['kategori', 'status', 'product_count', 'total_harga', 'min_harga', 'max_harga', 'updated_at']
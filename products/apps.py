@@ -12,3 +12,10 @@ class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products'
     verbose_name = 'Manajemen Produk'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        from . import checks, search, signals  # noqa: F401
+
+        post_migrate.connect(search.ensure_installed, sender=self)
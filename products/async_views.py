@@ -0,0 +1,213 @@
+"""
+View async (ASGI) untuk endpoint baca API produk yang paling sering dipanggil.
+
+Aktif jika PRODUCT_API_ASYNC = True (products/urls.py memasang URL ini di
+depan router DRF). DRF 3.14 belum mendukung view async, sehingga di bawah
+server ASGI setiap request ke ViewSet dijalankan lewat sync_to_async. View di
+sini memakai ORM async (async for / afirst), method cache async (aget/aset)
+dan serializer cepat (products/fast_serializers.py), tanpa pindah thread per
+request:
+
+- GET /api/products/               list (filter, search, keyset, ?facets=1)
+- GET /api/products/<pk>/          detail
+- GET /api/products/by_kategori/   list per kategori
+- GET /api/kategoris/              list kategori (cache lookup)
+- GET /api/statuses/               list status (cache lookup)
+
+Body response identik dengan ViewSet DRF, dan entry response cache dipakai
+bersama (products/response_cache.py). Request lain tetap dilayani ViewSet
+DRF: method selain GET/HEAD, browsable API / ?format= selain json, detail
+dengan query params, dan PRODUCT_API_FAST_SERIALIZER = False. Jalur sync
+(WSGI) tidak berubah.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import NotFound
+
+from . import conditional, facets, fast_serializers, filters, lookups
+from .pagination import KeysetPagination
+from .renderers import json_response
+from .response_cache import acached_response, normalize_params
+from .views import KategoriViewSet, ProductViewSet, StatusViewSet, product_queryset
+
+READ_METHODS = ('GET', 'HEAD')
+
+# ViewSet DRF untuk request yang tidak dilayani jalur async (sama dengan router)
+_product_list = ProductViewSet.as_view({'get': 'list', 'post': 'create'}, basename='api-product', detail=False)
+_product_detail = ProductViewSet.as_view(
+    {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'},
+    basename='api-product', detail=True,
+)
+_product_by_kategori = ProductViewSet.as_view({'get': 'by_kategori'}, basename='api-product', detail=False)
+_kategori_list = KategoriViewSet.as_view({'get': 'list'}, basename='api-kategori', detail=False)
+_status_list = StatusViewSet.as_view({'get': 'list'}, basename='api-status', detail=False)
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'PRODUCT_API_ASYNC', False)
+
+
+def _serves(request) -> bool:
+    """True jika request bisa dijawab jalur async (GET/HEAD, output JSON compact)."""
+    if request.method not in READ_METHODS:
+        return False
+    if request.GET.get('format', 'json') != 'json':
+        return False
+    accept = request.headers.get('Accept', '')
+    return 'text/html' not in accept and 'indent' not in accept
+
+
+async def _delegate(view, request, *args, **kwargs):
+    return await sync_to_async(view)(request, *args, **kwargs)
+
+
+async def _list_validators(request, kategori_id=None):
+    """Validator list (lihat views._list_validators); None jika parameter tidak valid."""
+    try:
+        queryset, _, _ = await _listing(request)
+    except filters.ListingFilterError:
+        return None, None
+    if kategori_id is not None:
+        queryset = queryset.filter(kategori_id=kategori_id)
+    return await conditional.alist_validators(queryset, normalize_params(request.GET), 'json')
+
+
+async def _by_kategori_validators(request):
+    kategori_id = request.GET.get('kategori_id')
+    if not kategori_id:
+        return None, None
+    return await _list_validators(request, kategori_id)
+
+
+async def _product_rows(request, queryset, ordering):
+    """
+    Data list produk (dengan keyset pagination jika diminta).
+
+    Returns:
+        tuple: (data, paginator atau None jika tanpa pagination)
+
+    Raises:
+        NotFound: Jika cursor tidak valid
+    """
+    rows = fast_serializers.product_values(queryset)
+    paginator = KeysetPagination()
+    page = await paginator.apaginate_queryset(rows, request, ordering)
+    items = [row async for row in rows] if page is None else page
+    data = await fast_serializers.aserialize_products(items, request.GET.get('search'))
+    return data, (paginator if page is not None else None)
+
+
+async def _listing(request):
+    """(queryset, ordering, listing) list produk; ListingFilterError jika parameter tidak valid."""
+    listing = filters.parse(request.GET)
+    queryset, ordering = product_queryset(request.GET, await lookups.asellable_status_id(), listing)
+    return queryset, ordering, listing
+
+
+@acached_response('api-product:list', validators=_list_validators)
+async def _list(request):
+    try:
+        queryset, ordering, listing = await _listing(request)
+        data, paginator = await _product_rows(request, queryset, ordering)
+    except filters.ListingFilterError as e:
+        return json_response(e.errors, status=400)
+    except NotFound as e:
+        return json_response({'detail': str(e.detail)}, status=404)
+
+    with_facets = facets.is_requested(request.GET)
+    if paginator is not None:
+        body = paginator.get_paginated_data(data)
+    else:
+        body = {'results': data} if with_facets else data
+    if with_facets:
+        # Satu query GROUP BY / tabel ringkasan; dihitung di thread terpisah
+        body['facets'] = await sync_to_async(facets.facet_counts)(
+            request.GET.get('search', ''),
+            kategori=request.GET.get('kategori'),
+            status=await lookups.asellable_status_id(),
+            listing=listing,
+        )
+    return json_response(body)
+
+
+@csrf_exempt
+async def product_list(request):
+    """GET /api/products/ (lihat ProductViewSet.list)."""
+    if not _serves(request) or not fast_serializers.is_enabled():
+        return await _delegate(_product_list, request)
+    return await _list(request)
+
+
+@csrf_exempt
+async def product_detail(request, pk):
+    """GET /api/products/<pk>/ dengan conditional GET (lihat ProductViewSet.retrieve)."""
+    if not _serves(request) or request.GET or not fast_serializers.is_enabled():
+        return await _delegate(_product_detail, request, pk=pk)
+
+    queryset, _ = product_queryset(request.GET, await lookups.asellable_status_id(), filters.ListingFilters())
+    row = await fast_serializers.product_values(queryset.filter(pk=pk)).afirst()
+    if row is None:
+        return json_response({'detail': str(NotFound.default_detail)}, status=404)
+
+    etag, last_modified = await conditional.aobject_validators(pk, row['updated_at'])
+    not_modified = conditional.conditional_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    data, = await fast_serializers.aserialize_products([row])
+    return conditional.set_validators(json_response(data), etag, last_modified)
+
+
+@acached_response('api-product:by_kategori', validators=_by_kategori_validators)
+async def _by_kategori(request):
+    kategori_id = request.GET.get('kategori_id')
+    if not kategori_id:
+        return json_response({'error': 'kategori_id parameter required'}, status=400)
+
+    try:
+        queryset, ordering, _ = await _listing(request)
+        data, paginator = await _product_rows(request, queryset.filter(kategori_id=kategori_id), ordering)
+    except filters.ListingFilterError as e:
+        return json_response(e.errors, status=400)
+    except NotFound as e:
+        return json_response({'detail': str(e.detail)}, status=404)
+
+    if paginator is not None:
+        return json_response(paginator.get_paginated_data(data))
+    return json_response({'count': len(data), 'results': data})
+
+
+@csrf_exempt
+async def product_by_kategori(request):
+    """GET /api/products/by_kategori/?kategori_id= (lihat ProductViewSet.by_kategori)."""
+    if not _serves(request) or not fast_serializers.is_enabled():
+        return await _delegate(_product_by_kategori, request)
+    return await _by_kategori(request)
+
+
+@acached_response('api-kategori:list')
+async def _kategoris(request):
+    return json_response(await lookups.akategori_data())
+
+
+@csrf_exempt
+async def kategori_list(request):
+    """GET /api/kategoris/ dari cache lookup."""
+    if not _serves(request):
+        return await _delegate(_kategori_list, request)
+    return await _kategoris(request)
+
+
+@acached_response('api-status:list')
+async def _statuses(request):
+    return json_response(await lookups.astatus_data())
+
+
+@csrf_exempt
+async def status_list(request):
+    """GET /api/statuses/ dari cache lookup."""
+    if not _serves(request):
+        return await _delegate(_status_list, request)
+    return await _statuses(request)
@@ -0,0 +1,444 @@
+"""
+Index prefix in-process untuk autocomplete nama produk "bisa dijual".
+
+Setiap kata di nama_produk punya posting list produk (inverted index), dan
+daftar kata unik disimpan terurut sehingga pencarian prefix cukup satu bisect
++ merge lazy tanpa query ke database. Query beberapa kata: setiap kata harus
+cocok sebagai prefix salah satu kata di nama.
+
+Siklus hidup:
+- Index dibangun saat pertama dipakai (query di AppConfig.ready() tidak
+  diizinkan Django) dan bisa dibangun ulang dengan rebuild(). Baris dibaca
+  dari database tanpa memegang lock; index baru dipasang sekaligus, jadi
+  suggest() tetap dilayani index lama selama build.
+- Signal post_save/post_delete Product memperbarui index proses ini secara
+  inkremental (products/signals.py) dan, setelah commit, mencatat
+  ProductChange. Perubahan massal tanpa signal (sync, bulk API, import)
+  mencatat ProductChange lewat products/invalidation.py.
+- Setiap proses membaca ProductChange baru paling sering sekali per
+  AUTOCOMPLETE_REFRESH_INTERVAL detik lalu menerapkannya secara inkremental:
+  produk dengan updated_at >= since dibaca ulang (tambah/hapus sesuai status)
+  dan id yang dihapus dibuang. Build penuh hanya untuk rebuild(), perubahan
+  yang terlalu besar, atau log yang sudah dipangkas (proses lama idle).
+- AUTOCOMPLETE_MAX_PRODUCTS membatasi jumlah produk di index (produk terbaru
+  diutamakan saat build), sehingga memori tetap terbatas.
+"""
+
+import heapq
+import logging
+import sys
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import lookups
+from .search import terms
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PRODUCTS = 200_000
+DEFAULT_MAX_SCAN = 2_000
+DEFAULT_REFRESH_INTERVAL = 5
+# Entry ProductChange dibaca ulang dengan jendela ini: transaksi lain yang
+# commit sedikit terlambat dan selisih jam antar host tetap terbaca
+CHANGE_LAG = timedelta(seconds=30)
+# Entry lebih tua dari ini dipangkas; proses yang belum refresh selama ini build penuh
+CHANGE_RETENTION = timedelta(days=1)
+
+
+class PrefixIndex:
+    """
+    Inverted index kata -> produk untuk pencarian prefix (tanpa akses database).
+
+    - vocab: daftar kata unik terurut; prefix query = satu bisect ke rentang kata
+    - postings: per kata, list key produk terurut (panjang nama, nama, id)
+      sehingga nama terpendek selalu di depan
+
+    Query menggabungkan postings secara lazy (heapq.merge) dan berhenti setelah
+    `limit` hasil, jadi biayanya tidak bergantung pada jumlah produk yang cocok.
+    Tidak thread-safe; pemanggil bertanggung jawab atas locking.
+    """
+
+    def __init__(self, max_products: int = DEFAULT_MAX_PRODUCTS):
+        self.max_products = max_products
+        self.names: Dict[int, str] = {}
+        self.vocab: List[str] = []
+        self.postings: Dict[str, List[Tuple]] = {}
+        self.full = False
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def _key(pk: int, name: str) -> Tuple:
+        # Urut (panjang, nama, id); kata-kata nama ikut disimpan untuk cek
+        # kata lain di query tanpa tokenisasi ulang (tidak pernah dibandingkan
+        # karena id unik)
+        return (len(name), name.lower(), pk, tuple(sys.intern(t) for t in set(terms(name))))
+
+    def add(self, pk: int, name: str) -> bool:
+        """
+        Tambah atau perbarui produk.
+
+        Returns:
+            bool: False jika index sudah penuh dan produk tidak ditambahkan
+        """
+        if pk in self.names:
+            if self.names[pk] == name:
+                return True
+            self.remove(pk)
+        elif len(self.names) >= self.max_products:
+            self.full = True
+            return False
+
+        name = sys.intern(name)
+        self.names[pk] = name
+        key = self._key(pk, name)
+        for token in key[3]:
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = []
+                insort(self.vocab, token)
+            insort(posting, key)
+        return True
+
+    def remove(self, pk: int):
+        """Hapus produk dari index (tidak error jika tidak ada)."""
+        name = self.names.pop(pk, None)
+        if name is None:
+            return
+        key = self._key(pk, name)
+        for token in key[3]:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            i = bisect_left(posting, key)
+            if i < len(posting) and posting[i] == key:
+                del posting[i]
+            if not posting:
+                del self.postings[token]
+                del self.vocab[bisect_left(self.vocab, token)]
+
+    def load(self, rows):
+        """Bangun ulang dari iterable (id_produk, nama_produk), sort sekali di akhir."""
+        self.names = {}
+        self.postings = {}
+        self.full = False
+        postings = self.postings
+        for pk, name in rows:
+            if len(self.names) >= self.max_products:
+                self.full = True
+                break
+            name = sys.intern(name)
+            self.names[pk] = name
+            key = self._key(pk, name)
+            for token in key[3]:
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = []
+                posting.append(key)
+        for posting in postings.values():
+            posting.sort()
+        self.vocab = sorted(postings)
+
+    def _prefix_lists(self, prefix: str) -> List[List[Tuple]]:
+        """Posting list semua kata berawalan `prefix`."""
+        start = bisect_left(self.vocab, prefix)
+        end = bisect_left(self.vocab, prefix + '\U0010ffff', start)
+        return [self.postings[token] for token in self.vocab[start:end]]
+
+    @staticmethod
+    def _stream(lists: List[List[Tuple]]) -> Iterator[Tuple]:
+        """Gabungan posting list, urut key, tanpa duplikat."""
+        if not lists:
+            return
+        stream = lists[0] if len(lists) == 1 else heapq.merge(*lists)
+        previous = None
+        for key in stream:
+            if key != previous:
+                yield key
+                previous = key
+
+    def search(self, query: str, limit: int = 10, max_scan: int = DEFAULT_MAX_SCAN) -> List[Tuple[int, str]]:
+        """
+        Produk yang setiap kata query-nya cocok sebagai prefix kata di nama.
+
+        Diambil `limit` nama terpendek yang cocok, lalu nama yang diawali
+        query ditaruh di depan. Query beberapa kata berhenti setelah memeriksa
+        `max_scan` kandidat, sehingga latensi terburuk tetap terbatas (hasil
+        bisa kurang dari `limit` untuk kombinasi kata yang sangat jarang).
+
+        Returns:
+            List[Tuple[int, str]]: Pasangan (id_produk, nama_produk)
+        """
+        words = terms(query)
+        if not words:
+            return []
+
+        # Kata dengan posting paling sedikit sebagai penggerak; kata lain dicek
+        # terhadap kata-kata yang tersimpan di key
+        candidates = sorted(
+            ((sum(len(posting) for posting in lists), word, lists)
+             for word, lists in ((word, self._prefix_lists(word)) for word in set(words))),
+            key=lambda candidate: candidate[0],
+        )
+        driver = candidates[0][2]
+        others = [word for _, word, _ in candidates[1:]]
+
+        matches = []
+        for scanned, key in enumerate(self._stream(driver)):
+            if scanned >= max_scan:
+                break
+            tokens = key[3]
+            if all(any(token.startswith(word) for token in tokens) for word in others):
+                matches.append((key[2], self.names[key[2]]))
+                if len(matches) >= limit:
+                    break
+
+        lowered = query.strip().lower()
+        matches.sort(key=lambda match: not match[1].lower().startswith(lowered))
+        return matches
+
+    def memory_bytes(self) -> int:
+        """Perkiraan kasar memori index (struktur list/dict, key, dan string)."""
+        size = sys.getsizeof(self.names) + sys.getsizeof(self.vocab) + sys.getsizeof(self.postings)
+        size += sum(sys.getsizeof(name) for name in self.names.values())
+        size += sum(sys.getsizeof(token) for token in self.vocab)
+        size += sum(sys.getsizeof(posting) for posting in self.postings.values())
+        # Key tuple dibuat sekali per produk dan dipakai bersama oleh semua posting-nya
+        size += len(self.names) * (sys.getsizeof((0, '', 0, ())) + sys.getsizeof(''))
+        size += sum(len(posting) for posting in self.postings.values()) * 8  # pointer di tuple kata
+        return size
+
+
+_lock = threading.RLock()
+# Hanya satu thread yang membangun/me-refresh index; thread lain tetap memakai index lama
+_build_lock = threading.Lock()
+_state = {'index': None, 'checked_at': None, 'next_check': 0.0, 'next_prune': 0.0}
+
+
+def _max_products() -> int:
+    return getattr(settings, 'AUTOCOMPLETE_MAX_PRODUCTS', DEFAULT_MAX_PRODUCTS)
+
+
+def _refresh_interval() -> float:
+    return getattr(settings, 'AUTOCOMPLETE_REFRESH_INTERVAL', DEFAULT_REFRESH_INTERVAL)
+
+
+def _install(index: Optional[PrefixIndex], checked_at):
+    with _lock:
+        _state['index'] = index
+        _state['checked_at'] = checked_at
+        _state['next_check'] = time.monotonic() + _refresh_interval()
+
+
+def _build() -> PrefixIndex:
+    """Bangun index baru dari database (tanpa _lock) lalu pasang."""
+    from .models import Product
+
+    checked_at = timezone.now()
+    max_products = _max_products()
+    index = PrefixIndex(max_products)
+
+    sellable_id = lookups.sellable_status_id()
+    if sellable_id is not None:
+        rows = Product.objects.filter(status_id=sellable_id).order_by(
+            '-created_at', '-id_produk'
+        ).values_list('id_produk', 'nama_produk')
+        index.load(rows[:max_products + 1].iterator(chunk_size=5000))
+
+    if index.full:
+        logger.warning(f"Autocomplete index penuh: hanya {max_products} produk terbaru yang diindeks")
+
+    _install(index, checked_at)
+    return index
+
+
+def _refresh(index: PrefixIndex) -> PrefixIndex:
+    """
+    Terapkan ProductChange sejak refresh terakhir ke `index`.
+
+    Baris dibaca tanpa _lock; hanya penerapan ke index yang memegang lock.
+    Kembali ke build penuh jika ada rebuild(), log sudah dipangkas, atau
+    produk yang berubah lebih dari 10% index.
+    """
+    from .models import Product, ProductChange
+
+    checked_at = timezone.now()
+    previous = _state['checked_at']
+    window_start = previous - CHANGE_LAG
+    if window_start < checked_at - CHANGE_RETENTION:
+        return _build()
+
+    since, deleted = None, set()
+    for change_since, change_deleted, full, created_at in ProductChange.objects.filter(
+        created_at__gte=window_start
+    ).values_list('since', 'deleted', 'full', 'created_at'):
+        if full:
+            # rebuild() sebelum index ini dibangun sudah tercakup
+            if created_at >= previous:
+                return _build()
+            continue
+        if change_since is not None:
+            since = change_since if since is None else min(since, change_since)
+        deleted.update(change_deleted)
+
+    rows = []
+    if since is not None:
+        limit = max(1000, len(index) // 10)
+        rows = list(Product.objects.filter(updated_at__gte=since - CHANGE_LAG).values_list(
+            'id_produk', 'nama_produk', 'status_id'
+        )[:limit + 1])
+        if len(rows) > limit:
+            return _build()
+
+    sellable_id = lookups.sellable_status_id()
+    with _lock:
+        for pk in deleted:
+            index.remove(pk)
+        for pk, name, status_id in rows:
+            if status_id == sellable_id:
+                index.add(pk, name)
+            else:
+                index.remove(pk)
+    _install(index, checked_at)
+    return index
+
+
+def get_index() -> PrefixIndex:
+    """
+    Index proses ini; dibangun jika belum ada dan di-refresh dari
+    ProductChange jika sudah lewat AUTOCOMPLETE_REFRESH_INTERVAL.
+    """
+    with _lock:
+        index = _state['index']
+        if index is not None and time.monotonic() < _state['next_check']:
+            return index
+
+    # Selama thread lain sedang build/refresh, pakai index yang ada
+    if not _build_lock.acquire(blocking=index is None):
+        return index
+    try:
+        index = _state['index']
+        if index is None:
+            return _build()
+        if time.monotonic() < _state['next_check']:
+            return index
+        return _refresh(index)
+    finally:
+        _build_lock.release()
+
+
+def suggest(query: str, limit: int = 10) -> List[Dict]:
+    """
+    Saran nama produk untuk autocomplete.
+
+    Args:
+        query (str): Teks yang sedang diketik user
+        limit (int): Jumlah saran maksimal
+
+    Returns:
+        List[Dict]: [{'id_produk': ..., 'nama_produk': ...}, ...]
+    """
+    index = get_index()
+    with _lock:
+        matches = index.search(query, limit)
+    return [{'id_produk': pk, 'nama_produk': name} for pk, name in matches]
+
+
+def record_change(since=None, deleted: Iterable[int] = (), full: bool = False):
+    """
+    Catat perubahan produk untuk proses lain (panggil setelah commit).
+
+    Entry yang lebih tua dari CHANGE_RETENTION dipangkas di sini, paling
+    sering sekali per AUTOCOMPLETE_REFRESH_INTERVAL per proses, sehingga log
+    tetap terbatas walaupun produk hanya diubah satu per satu.
+
+    Args:
+        since (datetime): Produk dengan updated_at >= since berubah
+        deleted (Iterable[int]): id_produk yang dihapus
+        full (bool): Semua proses membangun ulang index
+    """
+    from .models import ProductChange
+
+    ProductChange.objects.create(since=since, deleted=sorted(deleted), full=full)
+
+    now = time.monotonic()
+    with _lock:
+        prune = now >= _state['next_prune']
+        if prune:
+            _state['next_prune'] = now + _refresh_interval()
+    if prune:
+        ProductChange.objects.filter(created_at__lt=timezone.now() - CHANGE_RETENTION).delete()
+
+
+def products_changed(since=None, deleted: Iterable[int] = ()):
+    """
+    Perubahan massal tanpa signal sudah commit: catat untuk semua proses dan
+    refresh index proses ini pada query berikutnya. Tanpa `since` maupun
+    `deleted`, index dibangun ulang.
+    """
+    deleted = list(deleted)
+    record_change(since, deleted, full=since is None and not deleted)
+    with _lock:
+        _state['next_check'] = 0.0
+
+
+def invalidate():
+    """Bangun ulang index di semua proses (dan proses ini) pada query berikutnya."""
+    record_change(full=True)
+    with _lock:
+        _state['index'] = None
+
+
+def rebuild() -> Dict:
+    """Invalidasi di semua proses lalu bangun ulang index proses ini."""
+    invalidate()
+    get_index()
+    return stats()
+
+
+def stats() -> Dict:
+    """Ringkasan index proses ini (jumlah produk, token, memori)."""
+    with _lock:
+        index = _state['index']
+        if index is None:
+            return {'built': False, 'products': 0, 'tokens': 0, 'memory_bytes': 0, 'full': False}
+        return {
+            'built': True,
+            'products': len(index),
+            'tokens': len(index.vocab),
+            'memory_bytes': index.memory_bytes(),
+            'full': index.full,
+        }
+
+
+def _apply(update):
+    """Terapkan perubahan inkremental ke index proses ini (jika sudah dibangun)."""
+    with _lock:
+        index: Optional[PrefixIndex] = _state['index']
+        if index is not None:
+            update(index)
+
+
+def product_saved(pk: int, nama_produk: str, status_id: int, updated_at=None):
+    """
+    Perubahan Product sudah commit: tambah/perbarui/hapus sesuai status di
+    index proses ini, dan catat untuk proses lain.
+    """
+    if status_id == lookups.sellable_status_id():
+        _apply(lambda index: index.add(pk, nama_produk))
+    else:
+        _apply(lambda index: index.remove(pk))
+    record_change(since=updated_at or timezone.now())
+
+
+def product_deleted(pk: int):
+    """Product dihapus (sudah commit)."""
+    _apply(lambda index: index.remove(pk))
+    record_change(deleted=[pk])
@@ -0,0 +1,376 @@
+"""
+Bulk write produk (create, partial update, delete) untuk /api/products/bulk/.
+
+Semua item divalidasi dalam satu pass sebelum ada yang ditulis:
+- kategori/status (id atau nama) di-resolve dengan satu query per tabel,
+- produk yang di-update/delete diambil dengan satu query,
+- bentrok nama_produk dicek dengan satu query.
+
+Jika ada item yang tidak valid tidak ada yang ditulis, dan error dilaporkan
+per item beserta index-nya. Jika semua valid, perubahan ditulis dalam satu
+transaksi dengan bulk_create/bulk_update/DELETE ... IN per batch, tanpa
+signal per produk: statistik kategori dihitung ulang sekali dan cache/index
+autocomplete diberi tahu sekali lewat invalidation.products_changed().
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import invalidation, lookups, stats
+from .models import Kategori, Product, Status
+from .sync import DEFAULT_BATCH_SIZE, chunked
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ('create', 'update', 'delete')
+WRITABLE_FIELDS = ('nama_produk', 'harga', 'kategori', 'status', 'deskripsi')
+REQUIRED_CREATE_FIELDS = ('nama_produk', 'harga', 'kategori', 'status')
+DEFAULT_MAX_ITEMS = 10_000
+
+_harga = Product._meta.get_field('harga')
+_nama = Product._meta.get_field('nama_produk')
+
+
+class BulkValidationError(Exception):
+    """Satu atau lebih item tidak valid; `errors` berisi {'index', 'errors'} per item."""
+
+    def __init__(self, errors: List[Dict]):
+        super().__init__(f'{len(errors)} item tidak valid')
+        self.errors = errors
+
+
+@dataclass
+class BulkResult:
+    """
+    Ringkasan bulk write.
+
+    Fields:
+    - created/updated/deleted: Jumlah produk per operasi
+    - results: {'index', 'op', 'id_produk'} per item, urut sesuai request
+    """
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    results: List[Dict] = field(default_factory=list)
+
+    def as_dict(self) -> Dict:
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'deleted': self.deleted,
+            'results': self.results,
+        }
+
+
+def max_items() -> int:
+    return getattr(settings, 'PRODUCT_BULK_MAX_ITEMS', DEFAULT_MAX_ITEMS)
+
+
+class BulkProductWriter:
+    """
+    Validasi lalu terapkan list operasi produk.
+
+    Format item:
+    - {"op": "create", "nama_produk", "harga", "kategori", "status", "deskripsi"?}
+    - {"op": "update", "id_produk", <field yang diubah saja>}
+    - {"op": "delete", "id_produk"}
+
+    kategori/status boleh berupa id (integer) atau nama (string, walaupun
+    hanya berisi angka; lihat lookups.is_reference_id). Aturan validasi sama dengan
+    ProductCreateUpdateSerializer (nama minimal 3 karakter, harga > 0).
+    """
+
+    def __init__(self, batch_size: int = None):
+        self.batch_size = batch_size or getattr(settings, 'FASTPRINT_SYNC_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+
+    def run(self, items: List) -> BulkResult:
+        """
+        Validasi semua item lalu tulis dalam satu transaksi.
+
+        Raises:
+            BulkValidationError: Jika ada item yang tidak valid (tidak ada yang ditulis)
+        """
+        operations = self.validate(items)
+        result = BulkResult()
+        started_at = timezone.now()
+
+        with transaction.atomic(), stats.bulk_changes():
+            self._delete(operations['delete'], result)
+            self._update(operations['update'], result)
+            self._create(operations['create'], result)
+
+            if result.created or result.updated or result.deleted:
+                invalidation.products_changed(
+                    since=started_at, deleted=[data['id_produk'] for _, data in operations['delete']]
+                )
+
+        result.results.sort(key=lambda item: item['index'])
+        logger.info(
+            f"Bulk write selesai: {result.created} dibuat, {result.updated} diperbarui, "
+            f"{result.deleted} dihapus"
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Validasi
+    # ------------------------------------------------------------------
+
+    def validate(self, items: List) -> Dict[str, List]:
+        """
+        Validasi dan normalisasi semua item.
+
+        Returns:
+            Dict[str, List]: (index, item ternormalisasi) per operasi
+
+        Raises:
+            BulkValidationError: Jika ada item yang tidak valid
+        """
+        if not isinstance(items, list):
+            raise BulkValidationError([{'index': None, 'errors': {'non_field_errors': ['Body harus berupa list.']}}])
+        if len(items) > max_items():
+            raise BulkValidationError([{
+                'index': None, 'errors': {'non_field_errors': [f'Maksimal {max_items()} item per request.']},
+            }])
+
+        errors: Dict[int, Dict[str, List[str]]] = {}
+
+        def error(index, name, message):
+            errors.setdefault(index, {}).setdefault(name, []).append(message)
+
+        cleaned = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                error(index, 'non_field_errors', 'Item harus berupa object.')
+                continue
+            op = item.get('op')
+            if op not in OPERATIONS:
+                error(index, 'op', f"Harus salah satu dari: {', '.join(OPERATIONS)}.")
+                continue
+            data = self._clean_fields(index, op, item, error)
+            cleaned.append((index, op, data))
+
+        kategoris = self._resolve(Kategori, 'nama_kategori', cleaned, 'kategori')
+        statuses = self._resolve(Status, 'nama_status', cleaned, 'status')
+        ids = {data['id_produk'] for _, op, data in cleaned if op != 'create' and 'id_produk' in data}
+        existing = Product.objects.in_bulk(ids) if ids else {}
+        deleted_ids = {data.get('id_produk') for _, op, data in cleaned if op == 'delete'}
+
+        names = {data['nama_produk'] for _, _, data in cleaned if 'nama_produk' in data}
+        owners = dict(
+            Product.objects.filter(nama_produk__in=names).values_list('nama_produk', 'id_produk')
+        ) if names else {}
+
+        operations = {op: [] for op in OPERATIONS}
+        seen_ids = set()
+        seen_names = set()
+        for index, op, data in cleaned:
+            if op != 'create':
+                pk = data.get('id_produk')
+                if pk is not None and pk not in existing:
+                    error(index, 'id_produk', 'Produk tidak ditemukan.')
+                elif pk is not None and pk in seen_ids:
+                    error(index, 'id_produk', 'Produk muncul lebih dari sekali dalam request.')
+                seen_ids.add(pk)
+
+            for name, resolved, label in (('kategori', kategoris, 'Kategori'), ('status', statuses, 'Status')):
+                if name in data:
+                    data[name] = resolved.get(data[name])
+                    if data[name] is None:
+                        error(index, name, f'{label} tidak ditemukan.')
+
+            nama = data.get('nama_produk')
+            if nama is not None:
+                owner = owners.get(nama)
+                if nama in seen_names:
+                    error(index, 'nama_produk', 'Nama produk muncul lebih dari sekali dalam request.')
+                elif owner is not None and owner != data.get('id_produk') and owner not in deleted_ids:
+                    error(index, 'nama_produk', 'Produk dengan nama ini sudah ada.')
+                seen_names.add(nama)
+
+            if index not in errors:
+                if op != 'create':
+                    data['instance'] = existing[data['id_produk']]
+                operations[op].append((index, data))
+
+        if errors:
+            raise BulkValidationError([
+                {'index': index, 'errors': errors[index]} for index in sorted(errors)
+            ])
+        return operations
+
+    @staticmethod
+    def _clean_fields(index: int, op: str, item: Dict, error) -> Dict:
+        data = {}
+
+        if op != 'create':
+            pk = item.get('id_produk')
+            if isinstance(pk, bool) or not isinstance(pk, int):
+                error(index, 'id_produk', 'id_produk (integer) wajib diisi.')
+            else:
+                data['id_produk'] = pk
+            if op == 'delete':
+                return data
+
+        unknown = set(item) - set(WRITABLE_FIELDS) - {'op', 'id_produk'}
+        for name in sorted(unknown):
+            error(index, name, 'Field tidak dikenal.')
+
+        if op == 'create':
+            for name in REQUIRED_CREATE_FIELDS:
+                if item.get(name) in (None, ''):
+                    error(index, name, 'Field ini wajib diisi.')
+        elif not any(name in item for name in WRITABLE_FIELDS):
+            error(index, 'non_field_errors', 'Tidak ada field yang diubah.')
+
+        if item.get('nama_produk') not in (None, ''):
+            nama = item['nama_produk']
+            if not isinstance(nama, str) or not nama.strip():
+                error(index, 'nama_produk', 'Nama produk harus diisi.')
+            elif len(nama) < 3:
+                error(index, 'nama_produk', 'Nama produk minimal 3 karakter.')
+            elif len(nama) > _nama.max_length:
+                error(index, 'nama_produk', f'Nama produk maksimal {_nama.max_length} karakter.')
+            else:
+                data['nama_produk'] = nama
+        elif 'nama_produk' in item and op == 'update':
+            error(index, 'nama_produk', 'Nama produk harus diisi.')
+
+        if item.get('harga') is not None:
+            harga = BulkProductWriter._clean_harga(item['harga'])
+            if harga is None:
+                error(index, 'harga', 'Harga harus berupa angka.')
+            elif harga <= 0:
+                error(index, 'harga', 'Harga harus lebih besar dari 0.')
+            else:
+                data['harga'] = harga
+        elif 'harga' in item and op == 'update':
+            error(index, 'harga', 'Harga harus berupa angka.')
+
+        for name in ('kategori', 'status'):
+            value = item.get(name)
+            if value is None or value == '':
+                if name in item and op == 'update':
+                    error(index, name, 'Field ini tidak boleh kosong.')
+            elif isinstance(value, bool) or not isinstance(value, (int, str)):
+                error(index, name, 'Harus berupa id atau nama.')
+            else:
+                data[name] = value
+
+        if 'deskripsi' in item:
+            deskripsi = item['deskripsi']
+            if deskripsi is not None and not isinstance(deskripsi, str):
+                error(index, 'deskripsi', 'Deskripsi harus berupa teks.')
+            else:
+                data['deskripsi'] = deskripsi
+
+        return data
+
+    @staticmethod
+    def _clean_harga(value) -> Optional[Decimal]:
+        """Decimal 2 digit desimal yang muat di kolom harga, atau None jika tidak valid."""
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            return None
+        try:
+            harga = Decimal(str(value).strip()).quantize(Decimal('0.01'))
+        except (InvalidOperation, ValueError):
+            return None
+        if not harga.is_finite() or len(harga.as_tuple().digits) > _harga.max_digits:
+            return None
+        return harga
+
+    @staticmethod
+    def _resolve(model, name_field: str, cleaned: List, key: str) -> Dict:
+        """Map nilai item (id atau nama) -> primary key, satu query untuk semua item."""
+        values = {data[key] for _, _, data in cleaned if key in data}
+        if not values:
+            return {}
+        ids = {value for value in values if lookups.is_reference_id(value)}
+        names = values - ids
+        resolved = {}
+        for pk, name in model.objects.filter(
+            Q(pk__in=ids) | Q(**{f'{name_field}__in': names})
+        ).values_list('pk', name_field):
+            if pk in ids:
+                resolved[pk] = pk
+            if name in names:
+                resolved[name] = pk
+        return resolved
+
+    # ------------------------------------------------------------------
+    # Penulisan
+    # ------------------------------------------------------------------
+
+    def _delete(self, operations: List, result: BulkResult):
+        if not operations:
+            return
+
+        # DELETE langsung tanpa collector/signal per objek (tidak ada FK ke
+        # Product); statistik dan cache diperbarui sekali oleh run()
+        table = connection.ops.quote_name(Product._meta.db_table)
+        pk_column = connection.ops.quote_name(Product._meta.pk.column)
+        with connection.cursor() as cursor:
+            for batch in chunked(operations, self.batch_size):
+                ids = [data['id_produk'] for _, data in batch]
+                placeholders = ', '.join(['%s'] * len(ids))
+                cursor.execute(f"DELETE FROM {table} WHERE {pk_column} IN ({placeholders})", ids)
+                for index, data in batch:
+                    result.results.append({'index': index, 'op': 'delete', 'id_produk': data['id_produk']})
+        stats.touch(data['instance'].kategori_id for _, data in operations)
+        result.deleted += len(operations)
+
+    def _update(self, operations: List, result: BulkResult):
+        if not operations:
+            return
+
+        now = timezone.now()
+        fields = {'content_hash', 'updated_at'}
+        products = []
+        touched = set()
+        for index, data in operations:
+            product = data['instance']
+            touched.add(product.kategori_id)
+            for name in WRITABLE_FIELDS:
+                if name in data:
+                    setattr(product, f'{name}_id' if name in ('kategori', 'status') else name, data[name])
+                    fields.add(name)
+            product.content_hash = Product.compute_content_hash(
+                product.nama_produk, product.harga, product.kategori_id, product.status_id
+            )
+            product.updated_at = now
+            products.append(product)
+            touched.add(product.kategori_id)
+            result.results.append({'index': index, 'op': 'update', 'id_produk': product.pk})
+
+        Product.objects.bulk_update(products, sorted(fields), batch_size=self.batch_size)
+        stats.touch(touched)
+        result.updated += len(products)
+
+    def _create(self, operations: List, result: BulkResult):
+        if not operations:
+            return
+
+        products = [
+            Product(
+                nama_produk=data['nama_produk'],
+                harga=data['harga'],
+                kategori_id=data['kategori'],
+                status_id=data['status'],
+                deskripsi=data.get('deskripsi'),
+                content_hash=Product.compute_content_hash(
+                    data['nama_produk'], data['harga'], data['kategori'], data['status']
+                ),
+            )
+            for _, data in operations
+        ]
+        Product.objects.bulk_create(products, batch_size=self.batch_size)
+        stats.touch(product.kategori_id for product in products)
+        for (index, _), product in zip(operations, products):
+            result.results.append({'index': index, 'op': 'create', 'id_produk': product.pk})
+        result.created += len(products)
@@ -0,0 +1,203 @@
+"""
+Backend cache tambahan.
+
+InProcessAsyncMixin: method async (aget, aset, ...) memanggil method sync
+secara langsung. Bawaan Django menjalankan setiap method async lewat
+sync_to_async (pindah thread per panggilan); untuk backend in-process yang
+hanya berisi dict + lock tanpa I/O, hal itu murni overhead bagi view async
+(products/async_views.py). Dipakai AsyncLocMemCache dan InMemoryRedisCache.
+
+InMemoryRedisCache memakai RedisCache bawaan Django (serializer, timeout,
+incr, key handling yang sama), tetapi client-nya diganti InMemoryRedis:
+implementasi in-process dari subset perintah redis-py yang dipakai
+RedisCacheClient. Dipakai untuk test dan development tanpa server Redis;
+production cukup mengganti BACKEND ke django.core.cache.backends.redis.RedisCache.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache, RedisCacheClient, RedisSerializer
+from django.utils.module_loading import import_string
+
+
+class InProcessAsyncMixin:
+    """Method async backend cache in-process tanpa sync_to_async (tidak ada I/O yang memblokir)."""
+
+    async def aget(self, key, default=None, version=None):
+        return self.get(key, default, version)
+
+    async def aget_many(self, keys, version=None):
+        return self.get_many(keys, version)
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.set(key, value, timeout, version)
+
+    async def aadd(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.add(key, value, timeout, version)
+
+    async def adelete(self, key, version=None):
+        return self.delete(key, version)
+
+    async def aincr(self, key, delta=1, version=None):
+        return self.incr(key, delta, version)
+
+
+class AsyncLocMemCache(InProcessAsyncMixin, LocMemCache):
+    """
+    LocMemCache dengan method async langsung (lihat InProcessAsyncMixin).
+
+    CACHES = {'default': {'BACKEND': 'products.cache_backends.AsyncLocMemCache'}}
+    """
+
+
+class InMemoryRedis:
+    """
+    Subset perintah Redis di memori: GET, SET (NX/EX), DEL, EXISTS, INCRBY,
+    MGET, MSET, EXPIRE, PERSIST, FLUSHDB, dan pipeline.
+
+    Instance dengan URL yang sama berbagi data (seperti satu database Redis).
+    """
+
+    _databases: Dict[str, Dict] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, url: str):
+        with self._lock:
+            self._data = self._databases.setdefault(url, {})
+
+    def _alive(self, key) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _encode(value) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def get(self, key):
+        with self._lock:
+            return self._alive(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        with self._lock:
+            if nx and self._alive(key) is not None:
+                return None
+            expires_at = time.monotonic() + ex if ex is not None else None
+            self._data[key] = (self._encode(value), expires_at)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                if self._alive(key) is not None:
+                    del self._data[key]
+                    deleted += 1
+            return deleted
+
+    def exists(self, key):
+        with self._lock:
+            return int(self._alive(key) is not None)
+
+    def incr(self, key, amount=1):
+        with self._lock:
+            current = self._alive(key)
+            expires_at = self._data[key][1] if current is not None else None
+            value = int(current or 0) + amount
+            self._data[key] = (self._encode(value), expires_at)
+            return value
+
+    def mget(self, keys):
+        with self._lock:
+            return [self._alive(key) for key in keys]
+
+    def mset(self, mapping):
+        with self._lock:
+            for key, value in mapping.items():
+                self._data[key] = (self._encode(value), None)
+            return True
+
+    def expire(self, key, seconds):
+        with self._lock:
+            value = self._alive(key)
+            if value is None:
+                return False
+            self._data[key] = (value, time.monotonic() + seconds)
+            return True
+
+    def persist(self, key):
+        with self._lock:
+            value = self._alive(key)
+            if value is None:
+                return False
+            self._data[key] = (value, None)
+            return True
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+            return True
+
+    def pipeline(self):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    """Pipeline sederhana: perintah dijalankan berurutan saat execute()."""
+
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        results = [method(*args, **kwargs) for method, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class InMemoryRedisCacheClient(RedisCacheClient):
+    """RedisCacheClient tanpa library redis; semua server diarahkan ke InMemoryRedis."""
+
+    def __init__(self, servers, serializer=None, **options):
+        self._servers = servers
+        if isinstance(serializer, str):
+            serializer = import_string(serializer)
+        if callable(serializer):
+            serializer = serializer()
+        self._serializer = serializer or RedisSerializer()
+
+    def get_client(self, key=None, *, write=False):
+        return InMemoryRedis(self._servers[0])
+
+
+class InMemoryRedisCache(InProcessAsyncMixin, RedisCache):
+    """
+    Stand-in RedisCache untuk test/development.
+
+    CACHES = {'api': {'BACKEND': 'products.cache_backends.InMemoryRedisCache',
+                      'LOCATION': 'memory://api'}}
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._class = InMemoryRedisCacheClient
@@ -0,0 +1,31 @@
+"""
+System check untuk konfigurasi cache products.
+
+Jalankan dengan `python manage.py check --deploy`.
+"""
+
+from django.core.checks import Tags, Warning, register
+
+from . import response_cache
+
+
+def api_cache_warning():
+    """Warning jika generation counter response cache API hanya ada di memori proses."""
+    if not response_cache.cache_setting('ENABLED') or not response_cache.is_process_local():
+        return None
+    return Warning(
+        'Cache API (PRODUCT_API_CACHE) memakai backend per proses.',
+        hint=(
+            'Penulisan dari worker sync (run_sync_worker) dan proses web lain tidak '
+            'menaikkan generation counter proses ini, sehingga response lama terus '
+            'dilayani sampai TIMEOUT. Gunakan PRODUCT_API_CACHE_BACKEND = "file" '
+            '(satu host) atau "redis".'
+        ),
+        id='products.W001',
+    )
+
+
+@register(Tags.caches, deploy=True)
+def check_api_cache(app_configs, **kwargs):
+    warning = api_cache_warning()
+    return [warning] if warning else []
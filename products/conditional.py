@@ -0,0 +1,119 @@
+"""
+Validator HTTP conditional GET (ETag/Last-Modified) untuk produk.
+
+- Satu objek: dari Product.updated_at (plus versi cache lookup, karena nama
+  kategori/status ikut tampil tetapi tidak mengubah updated_at produk).
+- List: satu query agregat atas queryset yang sudah difilter, max(updated_at)
+  dan jumlah baris (jumlah ikut berubah saat produk dihapus atau keluar dari
+  filter), plus format renderer dan query params. Dibaca dari database, jadi
+  tetap benar walaupun penulisan terjadi di proses lain (worker sync).
+
+Request dengan If-None-Match/If-Modified-Since yang cocok dijawab 304 lewat
+django.utils.cache.get_conditional_response, tanpa serializer/template.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from . import lookups
+from .models import Product
+
+Validators = Tuple[Optional[str], Optional[datetime]]
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def object_validators(pk, updated_at: Optional[datetime]) -> Validators:
+    """ETag dan Last-Modified untuk satu produk (None jika produk tidak ada)."""
+    if updated_at is None:
+        return None, None
+    return _etag('product', pk, updated_at.isoformat(), lookups.version()), updated_at
+
+
+async def aobject_validators(pk, updated_at: Optional[datetime]) -> Validators:
+    """object_validators() untuk view async."""
+    if updated_at is None:
+        return None, None
+    return _etag('product', pk, updated_at.isoformat(), await lookups.aversion()), updated_at
+
+
+def product_validators(request, pk) -> Validators:
+    """
+    Validator produk `pk` dengan satu query kecil (hanya updated_at).
+
+    Hasil disimpan di request, karena decorator condition() memanggil fungsi
+    ETag dan Last-Modified secara terpisah.
+    """
+    cached = getattr(request, '_product_validators', None)
+    if cached is not None and cached[0] == pk:
+        return cached[1]
+
+    updated_at = Product.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    validators = object_validators(pk, updated_at)
+    request._product_validators = (pk, validators)
+    return validators
+
+
+def _aggregate(queryset):
+    return queryset.order_by().aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+
+
+def _list_etag(aggregate, params: str, renderer_format: str, lookups_version) -> Validators:
+    # Tanpa Last-Modified: delete dan rename Kategori/Status tidak menggeser
+    # max(updated_at), jadi list hanya divalidasi ulang lewat ETag
+    last_modified = aggregate['last_modified']
+    etag = _etag(
+        'list', renderer_format, params,
+        last_modified.isoformat() if last_modified else '', aggregate['count'], lookups_version,
+    )
+    return etag, None
+
+
+def list_validators(queryset, params: str = '', renderer_format: str = '') -> Validators:
+    """
+    Validator list dari agregat max(updated_at) + count queryset, satu query.
+    Hanya ETag; Last-Modified selalu None (If-Modified-Since diabaikan).
+
+    Args:
+        queryset: Queryset list setelah filter (sebelum pagination)
+        params (str): Query string ternormalisasi, membedakan URL berbeda
+        renderer_format (str): Format renderer hasil content negotiation
+    """
+    return _list_etag(_aggregate(queryset), params, renderer_format, lookups.version())
+
+
+async def alist_validators(queryset, params: str = '', renderer_format: str = '') -> Validators:
+    """list_validators() untuk view async."""
+    aggregate = await queryset.order_by().aaggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    return _list_etag(aggregate, params, renderer_format, await lookups.aversion())
+
+
+def has_conditional_headers(request) -> bool:
+    return 'If-None-Match' in request.headers or 'If-Modified-Since' in request.headers
+
+
+def conditional_response(request, etag: Optional[str], last_modified: Optional[datetime]):
+    """Response 304 (atau 412) jika precondition request terpenuhi, selain itu None."""
+    if etag is None and last_modified is None:
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: Optional[str], last_modified: Optional[datetime]):
+    if etag:
+        response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,111 @@
+"""
+Export katalog produk secara streaming (JSON, NDJSON, CSV).
+
+Baris dibaca dengan QuerySet.iterator(chunk_size=...) (server-side cursor di
+PostgreSQL), diserialisasi per chunk dengan products/fast_serializers.py, lalu
+ditulis ke StreamingHttpResponse. Memori Python dan database tetap konstan
+berapa pun jumlah produknya.
+
+- json: array JSON, isi sama dengan GET /api/products/ (tanpa pagination)
+- ndjson: satu objek JSON per baris
+- csv: kolom datar, nama kategori/status dari cache lookup
+"""
+
+import csv
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from django.conf import settings
+
+from . import fast_serializers
+from .renderers import FastJSONRenderer
+
+CSV_COLUMNS = [
+    'id_produk', 'nama_produk', 'harga', 'kategori', 'nama_kategori', 'status', 'nama_status', 'deskripsi',
+    'created_at', 'updated_at',
+]
+
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def chunk_size() -> int:
+    return getattr(settings, 'PRODUCT_EXPORT_CHUNK_SIZE', 2000)
+
+
+def iter_chunks(queryset, query: str = None) -> Iterator[List[dict]]:
+    """Data produk (format ProductSerializer) per chunk, lewat server-side cursor."""
+    size = chunk_size()
+    rows = fast_serializers.product_values(queryset).iterator(chunk_size=size)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield fast_serializers.serialize_products(chunk, query)
+
+
+def iter_json(chunks: Iterable[List[dict]]) -> Iterator[bytes]:
+    renderer = FastJSONRenderer()
+    yield b'['
+    first = True
+    for chunk in chunks:
+        body = renderer.render(chunk)[1:-1]
+        yield body if first else b',' + body
+        first = False
+    yield b']'
+
+
+def iter_ndjson(chunks: Iterable[List[dict]]) -> Iterator[bytes]:
+    renderer = FastJSONRenderer()
+    for chunk in chunks:
+        yield b''.join(renderer.render(item) + b'\n' for item in chunk)
+
+
+class _Echo:
+    """File-like untuk csv.writer: write() mengembalikan teks yang ditulis."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(chunks: Iterable[List[dict]]) -> Iterator[bytes]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS).encode()
+    for chunk in chunks:
+        yield ''.join(
+            writer.writerow([
+                item['id_produk'],
+                item['nama_produk'],
+                item['harga'],
+                item['kategori'],
+                item['kategori_detail']['nama_kategori'],
+                item['status'],
+                item['status_detail']['nama_status'],
+                item['deskripsi'] or '',
+                item['created_at'],
+                item['updated_at'],
+            ])
+            for item in chunk
+        ).encode()
+
+
+WRITERS = {
+    'json': iter_json,
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+}
+
+
+def stream(queryset, export_format: str, query: str = None) -> Iterator[bytes]:
+    """
+    Byte export `queryset` dalam format `export_format` ('json', 'ndjson', 'csv').
+
+    Args:
+        queryset: QuerySet produk yang sudah difilter dan diurutkan
+        export_format (str): Kunci WRITERS
+        query (str): Query ?search= (menambah search_rank/highlight di JSON)
+    """
+    return WRITERS[export_format](iter_chunks(queryset, query))
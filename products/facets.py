@@ -0,0 +1,94 @@
+"""
+Facet jumlah produk per kategori dan per status untuk filter listing.
+
+Satu query untuk kedua facet:
+- Dengan ?search= atau rentang harga: GROUP BY (kategori_id, status_id) atas
+  baris yang cocok dengan index pencarian (products/search.py) / index harga,
+  tanpa filter kategori/status.
+- Tanpa keduanya: dibaca dari tabel ringkasan KategoriStats
+  (products/stats.py), jadi tidak men-scan tabel produk.
+
+Facet kategori dihitung dengan filter status yang aktif dan facet status
+dengan filter kategori yang aktif, sehingga setiap opsi menunjukkan jumlah
+hasil jika opsi itu dipilih. Nama diambil dari cache lookup.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Count
+
+from . import lookups, search
+from .filters import ListingFilters
+from .models import KategoriStats, Product
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def is_requested(params) -> bool:
+    """True jika query param ?facets= bernilai benar."""
+    return str(params.get('facets', '')).lower() in TRUE_VALUES
+
+
+def _to_id(value) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def group_counts(search_query: str = '', listing: ListingFilters = None) -> Iterable[Tuple[int, int, int]]:
+    """(kategori_id, status_id, jumlah) untuk semua kelompok yang punya produk."""
+    has_price_range = listing is not None and listing.has_price_range
+    if search_query or has_price_range:
+        queryset = Product.objects.all()
+        if search_query:
+            queryset = search.search(queryset, search_query)
+        if has_price_range:
+            queryset = ListingFilters(listing.min_harga, listing.max_harga).apply(queryset)
+        return queryset.order_by().values_list('kategori_id', 'status_id').annotate(total=Count('pk'))
+    return KategoriStats.objects.filter(product_count__gt=0).values_list('kategori_id', 'status_id', 'product_count')
+
+
+def facet_counts(search_query: str = '', kategori=None, status=None,
+                 listing: ListingFilters = None) -> Dict[str, List[Dict]]:
+    """
+    Facet kategori dan status untuk filter yang sedang aktif.
+
+    Args:
+        search_query (str): Query pencarian (kosong = tanpa search)
+        kategori: id kategori yang dipilih (atau None)
+        status: id status yang dipilih (atau None)
+        listing (ListingFilters): Rentang harga yang aktif (ordering diabaikan)
+
+    Returns:
+        Dict: {'kategori': [{'id_kategori', 'nama_kategori', 'count'}],
+               'status': [{'id_status', 'nama_status', 'count'}]}, urut nama.
+               Opsi tanpa hasil tidak disertakan, kecuali yang sedang dipilih.
+    """
+    kategori_id = _to_id(kategori)
+    status_id = _to_id(status)
+
+    kategori_counts: Dict[int, int] = {}
+    status_counts: Dict[int, int] = {}
+    for row_kategori, row_status, total in group_counts(search_query, listing):
+        if status_id is None or row_status == status_id:
+            kategori_counts[row_kategori] = kategori_counts.get(row_kategori, 0) + total
+        if kategori_id is None or row_kategori == kategori_id:
+            status_counts[row_status] = status_counts.get(row_status, 0) + total
+
+    return {
+        'kategori': _facet(kategori_counts, kategori_id, lookups.kategori_data_by_id(), 'kategori'),
+        'status': _facet(status_counts, status_id, lookups.status_data_by_id(), 'status'),
+    }
+
+
+def _facet(counts: Dict[int, int], selected: Optional[int], names: Dict[int, Dict], field: str) -> List[Dict]:
+    if selected is not None and selected in names:
+        counts.setdefault(selected, 0)
+    facet = [
+        {f'id_{field}': pk, f'nama_{field}': names[pk][f'nama_{field}'], 'count': count}
+        for pk, count in counts.items()
+        if pk in names
+    ]
+    facet.sort(key=lambda item: item[f'nama_{field}'])
+    return facet
@@ -0,0 +1,150 @@
+"""
+Jalur serialisasi cepat (read-only) untuk list produk di API.
+
+ProductSerializer membuat field DRF per baris dan menserialisasi nested
+KategoriSerializer/StatusSerializer untuk setiap produk. Di sini:
+- baris diambil dengan .values() (tanpa instance model),
+- kategori_detail/status_detail memakai dict yang sudah diserialisasi di
+  cache lookup (products/lookups.py), dibagi antar baris,
+- harga dan tanggal diformat persis seperti DecimalField/DateTimeField DRF,
+- JSON ditulis oleh FastJSONRenderer (products/renderers.py).
+
+Output harus identik byte-per-byte dengan ProductSerializer (dijaga test).
+Aktif jika PRODUCT_API_FAST_SERIALIZER = True.
+"""
+
+import decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import lookups, search
+from .models import Kategori, Product, Status
+from .serializers import KategoriSerializer, StatusSerializer
+
+PRODUCT_COLUMNS = (
+    'id_produk', 'nama_produk', 'harga', 'kategori_id', 'status_id', 'deskripsi', 'created_at', 'updated_at',
+)
+SEARCH_COLUMNS = ('search_rank', 'search_highlight')
+
+_harga = Product._meta.get_field('harga')
+_HARGA_EXPONENT = decimal.Decimal('.1') ** _harga.decimal_places
+_HARGA_CONTEXT = decimal.Context(prec=_harga.max_digits)
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'PRODUCT_API_FAST_SERIALIZER', True)
+
+
+def product_values(queryset):
+    """
+    Queryset .values() dengan kolom yang dibutuhkan ProductSerializer.
+
+    Anotasi search_rank/search_highlight (products/search.py) ikut diambil
+    jika ada, untuk field tambahan dan cursor keyset pencarian.
+    """
+    columns = PRODUCT_COLUMNS + tuple(c for c in SEARCH_COLUMNS if c in queryset.query.annotations)
+    return queryset.values(*columns)
+
+
+def format_harga(value) -> Optional[str]:
+    """Sama dengan serializers.DecimalField(max_digits=15, decimal_places=2).to_representation."""
+    if value is None:
+        return None
+    if not isinstance(value, decimal.Decimal):
+        value = decimal.Decimal(str(value).strip())
+    return '{:f}'.format(value.quantize(_HARGA_EXPONENT, context=_HARGA_CONTEXT))
+
+
+def format_datetime(value, tz) -> Optional[str]:
+    """Sama dengan serializers.DateTimeField().to_representation (ISO 8601)."""
+    if value is None:
+        return None
+    if tz is not None and timezone.is_aware(value):
+        value = value.astimezone(tz)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _details(rows: List[Dict], key: str, cached: Dict, model, serializer_class) -> Dict:
+    """Data nested per id dari cache lookup; id yang belum ada di cache diambil dari database."""
+    missing = {row[key] for row in rows} - cached.keys()
+    if not missing:
+        return cached
+    details = dict(cached)
+    for item in serializer_class(model.objects.filter(pk__in=missing), many=True).data:
+        details[item[model._meta.pk.name]] = item
+    return details
+
+
+async def _adetails(rows: List[Dict], key: str, cached: Dict, model, serializer_class) -> Dict:
+    """_details() dengan ORM async."""
+    missing = {row[key] for row in rows} - cached.keys()
+    if not missing:
+        return cached
+    details = dict(cached)
+    objects = [obj async for obj in model.objects.filter(pk__in=missing)]
+    for item in serializer_class(objects, many=True).data:
+        details[item[model._meta.pk.name]] = item
+    return details
+
+
+def serialize_products(rows: Iterable[Dict], query: Optional[str] = None) -> List[Dict]:
+    """
+    Ubah baris product_values() menjadi data ProductSerializer(many=True).
+
+    Args:
+        rows: Dict dari product_values()
+        query (str): Query ?search=, untuk field search_rank dan highlight
+
+    Returns:
+        List[Dict]: Urutan key sama dengan ProductSerializer
+    """
+    rows = list(rows)
+    kategoris = _details(rows, 'kategori_id', lookups.kategori_data_by_id(), Kategori, KategoriSerializer)
+    statuses = _details(rows, 'status_id', lookups.status_data_by_id(), Status, StatusSerializer)
+    return serialize_rows(rows, kategoris, statuses, query)
+
+
+async def aserialize_products(rows: List[Dict], query: Optional[str] = None) -> List[Dict]:
+    """serialize_products() untuk view async (cache lookup dan ORM async)."""
+    kategoris = await _adetails(rows, 'kategori_id', await lookups.akategori_data_by_id(), Kategori, KategoriSerializer)
+    statuses = await _adetails(rows, 'status_id', await lookups.astatus_data_by_id(), Status, StatusSerializer)
+    return serialize_rows(rows, kategoris, statuses, query)
+
+
+def serialize_rows(rows: Iterable[Dict], kategoris: Dict, statuses: Dict, query: Optional[str] = None) -> List[Dict]:
+    """
+    Seperti serialize_products(), dengan data nested kategori/status yang diberikan.
+
+    Args:
+        rows: Dict dari product_values()
+        kategoris (Dict): Data KategoriSerializer per id_kategori
+        statuses (Dict): Data StatusSerializer per id_status
+        query (str): Query ?search=
+    """
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    words = search.terms(query) if query else None
+
+    data = []
+    for row in rows:
+        item = {
+            'id_produk': row['id_produk'],
+            'nama_produk': row['nama_produk'],
+            'harga': format_harga(row['harga']),
+            'kategori': row['kategori_id'],
+            'kategori_detail': kategoris[row['kategori_id']],
+            'status': row['status_id'],
+            'status_detail': statuses[row['status_id']],
+            'deskripsi': row['deskripsi'],
+            'created_at': format_datetime(row['created_at'], tz),
+            'updated_at': format_datetime(row['updated_at'], tz),
+        }
+        if words is not None:
+            item['search_rank'] = row.get('search_rank')
+            item['highlight'] = str(search.highlight(row.get('search_highlight') or row['nama_produk'], words))
+        data.append(item)
+    return data
@@ -0,0 +1,116 @@
+"""
+Filter harga dan ordering listing produk (ProductViewSet, product_list, export).
+
+Query param:
+- min_harga / max_harga: rentang harga (inklusif)
+- ordering: harga, -harga, nama_produk, -nama_produk, created_at, -created_at
+
+Setiap ordering diakhiri field unik sehingga bisa dipakai keyset pagination
+(products/pagination.py), dan masing-masing punya index (status[, kategori],
+field urut, id_produk) di Product.Meta.indexes: rentang harga dan halaman
+terurut dibaca sebagai range scan index, tanpa sort penuh. Arah sebaliknya
+memakai index yang sama (backward scan).
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import MAX_HARGA
+from .pagination import DEFAULT_ORDERING
+
+ORDERINGS: Dict[str, Tuple[str, ...]] = {
+    'harga': ('harga', 'id_produk'),
+    '-harga': ('-harga', '-id_produk'),
+    'nama_produk': ('nama_produk', 'id_produk'),
+    '-nama_produk': ('-nama_produk', '-id_produk'),
+    'created_at': ('created_at', 'id_produk'),
+    '-created_at': DEFAULT_ORDERING,
+}
+ORDERING_LABELS = {
+    '-created_at': 'Terbaru',
+    'created_at': 'Terlama',
+    'harga': 'Harga terendah',
+    '-harga': 'Harga tertinggi',
+    'nama_produk': 'Nama A-Z',
+    '-nama_produk': 'Nama Z-A',
+}
+
+
+class ListingFilterError(ValueError):
+    """Parameter filter/ordering tidak valid; `errors` berformat {param: [pesan]}."""
+
+    def __init__(self, errors: Dict[str, List[str]]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+@dataclass
+class ListingFilters:
+    """Filter listing hasil parse(); ordering None berarti urutan default/relevansi."""
+    min_harga: Optional[Decimal] = None
+    max_harga: Optional[Decimal] = None
+    ordering: Optional[Sequence[str]] = None
+    ordering_param: str = ''
+
+    @property
+    def has_price_range(self) -> bool:
+        return self.min_harga is not None or self.max_harga is not None
+
+    def apply(self, queryset):
+        """Terapkan rentang harga dan ordering ke queryset."""
+        if self.min_harga is not None:
+            queryset = queryset.filter(harga__gte=self.min_harga)
+        if self.max_harga is not None:
+            queryset = queryset.filter(harga__lte=self.max_harga)
+        if self.ordering:
+            queryset = queryset.order_by(*self.ordering)
+        return queryset
+
+
+def _price(params, name: str, errors: Dict) -> Optional[Decimal]:
+    value = (params.get(name) or '').strip()
+    if not value:
+        return None
+    try:
+        price = Decimal(value)
+    except InvalidOperation:
+        price = None
+    if price is None or not price.is_finite() or price < 0 or price > MAX_HARGA:
+        errors[name] = [f'Harus berupa angka antara 0 dan {MAX_HARGA}.']
+        return None
+    return price
+
+
+def parse(params, strict: bool = True) -> ListingFilters:
+    """
+    Baca min_harga, max_harga, dan ordering dari query params.
+
+    Args:
+        params: request.query_params / request.GET
+        strict (bool): False untuk mengabaikan nilai tidak valid (halaman web)
+
+    Raises:
+        ListingFilterError: Jika strict dan ada parameter tidak valid
+    """
+    errors: Dict[str, List[str]] = {}
+    filters = ListingFilters(
+        min_harga=_price(params, 'min_harga', errors),
+        max_harga=_price(params, 'max_harga', errors),
+    )
+
+    ordering = (params.get('ordering') or '').strip()
+    if ordering:
+        if ordering in ORDERINGS:
+            filters.ordering = ORDERINGS[ordering]
+            filters.ordering_param = ordering
+        else:
+            errors['ordering'] = [f"Harus salah satu dari: {', '.join(ORDERINGS)}."]
+
+    if filters.min_harga is not None and filters.max_harga is not None and filters.min_harga > filters.max_harga:
+        errors['max_harga'] = ['Harus lebih besar atau sama dengan min_harga.']
+        filters.max_harga = None
+
+    if errors and strict:
+        raise ListingFilterError(errors)
+    return filters
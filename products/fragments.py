@@ -0,0 +1,35 @@
+"""
+Cache fragment template halaman produk ({% cache %} di product_list.html
+dan product_detail.html).
+
+- Kartu produk / detail: key id_produk + updated_at + versi lookup (+ highlight
+  pencarian), jadi perubahan produk atau nama Kategori/Status otomatis memakai
+  key baru; entry lama kedaluwarsa sendiri.
+- Dropdown kategori: key generation data produk (products/response_cache.py)
+  + filter aktif. Jumlah facet dihitung lazy, sehingga saat fragment cache
+  hit query facet tidak dijalankan sama sekali.
+
+PRODUCT_TEMPLATE_CACHE_TIMEOUT = 0 mematikan cache fragment.
+"""
+
+from typing import Dict
+
+from django.conf import settings
+
+from . import lookups, response_cache
+
+DEFAULT_TIMEOUT = 600
+
+
+def timeout() -> int:
+    """Umur fragment (detik) dari PRODUCT_TEMPLATE_CACHE_TIMEOUT."""
+    return getattr(settings, 'PRODUCT_TEMPLATE_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def context() -> Dict:
+    """Variabel template untuk key {% cache %}: timeout dan versi data."""
+    return {
+        'fragment_timeout': timeout(),
+        'lookups_version': lookups.version(),
+        'data_generation': response_cache.generation(),
+    }
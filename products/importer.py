@@ -0,0 +1,334 @@
+"""
+Import produk offline dari file (CSV, NDJSON, atau dump JSON response API).
+
+File dibaca secara streaming dan setiap baris dinormalisasi ke format
+ProductSyncEngine (nama_produk, harga, kategori, status). Hasil akhir sama
+dengan sinkronisasi API: upsert berdasarkan nama_produk, baris terakhir menang,
+baris yang content_hash-nya tidak berubah tidak ditulis.
+
+Engine:
+- copy (PostgreSQL): COPY ke tabel staging sementara, lalu merge set-based
+  (kategori/status baru, INSERT ... ON CONFLICT DO UPDATE) dengan content_hash
+  dihitung di SQL. Satu transaksi, beberapa statement untuk seluruh file.
+- batch (backend lain): ProductSyncEngine per batch.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import TextField
+from django.db.models.expressions import RawSQL
+from django.db.models.sql import Query
+from django.utils import timezone
+
+from . import invalidation, stats
+from .models import MAX_HARGA, Kategori, Product, Status
+from .streaming import iter_json_array
+from .sync import DEFAULT_BATCH_SIZE, ProductSyncEngine, SyncResult
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('csv', 'ndjson', 'json')
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.json': 'json',
+}
+READ_CHUNK_SIZE = 1024 * 1024
+STAGING_TABLE = 'products_import_staging'
+_MAX_LENGTHS = {
+    'nama_produk': Product._meta.get_field('nama_produk').max_length,
+    'kategori': Kategori._meta.get_field('nama_kategori').max_length,
+    'status': Status._meta.get_field('nama_status').max_length,
+}
+
+
+def detect_format(path: str) -> str:
+    """Format file dari ekstensinya.
+
+    Raises:
+        ValueError: Jika ekstensi tidak dikenal
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Format file {path} tidak dikenal, gunakan --format ({', '.join(FORMATS)})")
+    return EXTENSIONS[extension]
+
+
+def iter_file(path: str, file_format: str) -> Iterator[Dict]:
+    """
+    Record mentah dari file secara streaming.
+
+    - csv: header minimal nama_produk, harga, kategori, status
+    - ndjson: satu objek per baris
+    - json: dump response API ({"data": [...]}), dibaca dengan iter_json_array
+    """
+    if file_format == 'csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.DictReader(f)
+    elif file_format == 'ndjson':
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"NDJSON tidak valid di baris {number}: {e}")
+    elif file_format == 'json':
+        with open(path, 'rb') as f:
+            yield from iter_json_array(iter(lambda: f.read(READ_CHUNK_SIZE), b''))
+    else:
+        raise ValueError(f"Format tidak dikenal: {file_format}")
+
+
+def _text(value, max_length: int) -> Optional[str]:
+    """Nilai teks (string atau integer) yang sudah di-strip, atau None jika kosong/tidak valid/terlalu panjang."""
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        return None
+    value = str(value).strip()
+    if not value or len(value) > max_length:
+        return None
+    return value
+
+
+def normalize_record(item) -> Optional[Dict]:
+    """
+    Record file -> format ProductSyncEngine, atau None jika tidak valid
+    (nama/kategori/status kosong, bukan teks, atau melebihi panjang kolom;
+    harga bukan angka, <= 0, atau melebihi MAX_HARGA).
+    """
+    if not isinstance(item, dict):
+        return None
+    nama_produk = _text(item.get('nama_produk'), _MAX_LENGTHS['nama_produk'])
+    kategori = _text(item.get('kategori'), _MAX_LENGTHS['kategori'])
+    status = _text(item.get('status'), _MAX_LENGTHS['status'])
+    harga = item.get('harga', '')
+    if isinstance(harga, bool) or not isinstance(harga, (str, int, float, Decimal)):
+        return None
+    try:
+        harga = Decimal(str(harga).strip()).quantize(Decimal('0.01'))
+    except (InvalidOperation, ValueError):
+        return None
+
+    if not (nama_produk and kategori and status) or not harga.is_finite() or not 0 < harga <= MAX_HARGA:
+        return None
+    return {'nama_produk': nama_produk, 'harga': harga, 'kategori': kategori, 'status': status}
+
+
+class ProductImporter:
+    """
+    Import record produk dengan engine copy (PostgreSQL) atau batch.
+
+    `progress_callback(processed)` dipanggil secara berkala dengan jumlah
+    baris valid yang sudah dibaca. Baris tidak valid dihitung di `skipped`.
+    """
+
+    def __init__(self, batch_size: int = None, engine: str = 'auto',
+                 progress_callback: Optional[Callable[[int], None]] = None):
+        self.batch_size = batch_size or getattr(settings, 'FASTPRINT_SYNC_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        if engine == 'auto':
+            engine = 'copy' if connection.vendor == 'postgresql' else 'batch'
+        if engine == 'copy' and connection.vendor != 'postgresql':
+            raise ValueError('Engine copy hanya tersedia untuk PostgreSQL')
+        self.engine = engine
+        self.progress_callback = progress_callback
+        self.skipped = 0
+
+    def _records(self, items: Iterable) -> Iterator[Dict]:
+        processed = 0
+        for item in items:
+            record = normalize_record(item)
+            if record is None:
+                self.skipped += 1
+                continue
+            processed += 1
+            if self.progress_callback and processed % self.batch_size == 0:
+                self.progress_callback(processed)
+            yield record
+
+    def run(self, items: Iterable) -> SyncResult:
+        """
+        Import semua record dalam satu transaksi.
+
+        Args:
+            items (Iterable): Record mentah (mis. dari iter_file)
+
+        Returns:
+            SyncResult: Jumlah produk created/updated/unchanged
+        """
+        records = self._records(items)
+        if self.engine == 'copy':
+            result = self._run_copy(records)
+        else:
+            result = ProductSyncEngine(batch_size=self.batch_size).run(records)
+
+        if self.progress_callback and result.processed % self.batch_size:
+            self.progress_callback(result.processed)
+        return result
+
+    # ------------------------------------------------------------------
+    # PostgreSQL: COPY + merge
+    # ------------------------------------------------------------------
+
+    def _run_copy(self, records: Iterator[Dict]) -> SyncResult:
+        result = SyncResult()
+        product_table = Product._meta.db_table
+        kategori_table = Kategori._meta.db_table
+        status_table = Status._meta.db_table
+        started_at = timezone.now()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TEMPORARY TABLE {STAGING_TABLE} (
+                    seq bigserial,
+                    nama_produk text NOT NULL,
+                    harga numeric(15, 2) NOT NULL,
+                    kategori text NOT NULL,
+                    status text NOT NULL
+                ) ON COMMIT DROP
+            """)
+            result.processed = self._copy(
+                cursor,
+                f"COPY {STAGING_TABLE} (nama_produk, harga, kategori, status) FROM STDIN WITH (FORMAT csv)",
+                ((r['nama_produk'], r['harga'], r['kategori'], r['status']) for r in records),
+            )
+
+            # Baris terakhir per nama_produk menang, seperti ProductSyncEngine
+            cursor.execute(f"""
+                CREATE TEMPORARY TABLE {STAGING_TABLE}_latest ON COMMIT DROP AS
+                SELECT DISTINCT ON (nama_produk) nama_produk, harga, kategori, status
+                FROM {STAGING_TABLE}
+                ORDER BY nama_produk, seq DESC
+            """)
+
+            new_lookups = 0
+            for table, column, source in (
+                (kategori_table, 'nama_kategori', 'kategori'),
+                (status_table, 'nama_status', 'status'),
+            ):
+                cursor.execute(f"""
+                    INSERT INTO {table} ({column}, created_at, updated_at)
+                    SELECT DISTINCT {source}, now(), now() FROM {STAGING_TABLE}_latest
+                    ON CONFLICT ({column}) DO NOTHING
+                """)
+                new_lookups += cursor.rowcount
+
+            content_hash, params = self._content_hash_sql()
+            cursor.execute(f"""
+                WITH upserted AS (
+                    INSERT INTO {product_table}
+                        (nama_produk, harga, kategori_id, status_id, content_hash, created_at, updated_at)
+                    SELECT s.nama_produk, s.harga, k.id_kategori, st.id_status, {content_hash}, now(), now()
+                    FROM {STAGING_TABLE}_latest s
+                    JOIN {kategori_table} k ON k.nama_kategori = s.kategori
+                    JOIN {status_table} st ON st.nama_status = s.status
+                    ON CONFLICT (nama_produk) DO UPDATE SET
+                        harga = EXCLUDED.harga,
+                        kategori_id = EXCLUDED.kategori_id,
+                        status_id = EXCLUDED.status_id,
+                        content_hash = EXCLUDED.content_hash,
+                        updated_at = EXCLUDED.updated_at
+                    WHERE {product_table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted),
+                       (SELECT count(*) FROM {STAGING_TABLE}_latest)
+                FROM upserted
+            """, params)
+            result.created, result.updated, distinct = cursor.fetchone()
+            result.unchanged = distinct - result.created - result.updated
+
+            if new_lookups:
+                invalidation.lookups_changed()
+            if result.created or result.updated:
+                # Kategori lama produk yang pindah tidak diketahui di sini: hitung ulang semua
+                stats.refresh()
+                invalidation.products_changed(since=started_at)
+
+        logger.info(
+            f"Import (COPY) selesai: {result.created} dibuat, {result.updated} diperbarui, "
+            f"{result.unchanged} tidak berubah ({result.processed} baris)"
+        )
+        return result
+
+    @staticmethod
+    def _content_hash_sql():
+        """
+        SQL Product.content_hash_expression() atas kolom staging (alias s, k,
+        st di query merge), supaya hash sama persis dengan jalur lain.
+
+        Returns:
+            Tuple[str, tuple]: SQL dan parameternya
+        """
+        def column(sql):
+            return RawSQL(sql, (), output_field=TextField())
+
+        expression = Product.content_hash_expression(
+            harga=column('s.harga'),
+            nama_produk=column('s.nama_produk'),
+            kategori_id=column('k.id_kategori'),
+            status_id=column('st.id_status'),
+        )
+        query = Query(Product)
+        return query.get_compiler(connection=connection).compile(expression.resolve_expression(query))
+
+    @staticmethod
+    def _copy(cursor, sql: str, rows: Iterable) -> int:
+        """Kirim `rows` ke COPY ... FROM STDIN (psycopg 3 atau psycopg2). Return jumlah baris."""
+        count = 0
+
+        def lines():
+            nonlocal count
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+                if buffer.tell() >= READ_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+
+        raw = cursor.cursor
+        if hasattr(raw, 'copy'):
+            with raw.copy(sql) as copy:
+                for data in lines():
+                    copy.write(data)
+        else:
+            raw.copy_expert(sql, _IteratorFile(lines()))
+        return count
+
+
+class _IteratorFile(io.TextIOBase):
+    """File-like read() di atas iterator string, untuk psycopg2 copy_expert."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buffer = ''
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
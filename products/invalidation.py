@@ -0,0 +1,51 @@
+"""
+Titik pusat invalidasi cache turunan data produk.
+
+Signal menangani perubahan per baris (save/delete). Operasi massal yang
+melewati signal (bulk_create, bulk_update, QuerySet.update/delete) harus
+memanggil fungsi di sini agar cache lookup, index autocomplete, dan response
+cache API ikut diperbarui.
+"""
+
+from functools import partial
+from typing import Iterable
+
+from django.db import transaction
+
+from . import autocomplete, lookups, response_cache
+
+
+def _now_and_on_commit(func):
+    """
+    Jalankan sekarang dan sekali lagi setelah commit.
+
+    Panggilan pertama mencegah pembaca memakai entry lama; panggilan kedua
+    membuang entry yang mungkin dibuat pembaca lain sebelum commit.
+    """
+    func()
+    transaction.on_commit(func)
+
+
+def responses_changed():
+    """Data yang tampil di response API berubah (mis. satu produk disimpan)."""
+    _now_and_on_commit(response_cache.invalidate)
+
+
+def products_changed(since=None, deleted: Iterable[int] = ()):
+    """
+    Produk dibuat/diubah/dihapus secara massal.
+
+    Args:
+        since (datetime): Waktu sebelum penulisan dimulai; produk dengan
+            updated_at >= since dibaca ulang oleh index autocomplete di semua
+            proses. None (tanpa `deleted`) = index dibangun ulang.
+        deleted (Iterable[int]): id_produk yang dihapus
+    """
+    transaction.on_commit(partial(autocomplete.products_changed, since, list(deleted)))
+    responses_changed()
+
+
+def lookups_changed():
+    """Kategori/Status dibuat/diubah/dihapus."""
+    transaction.on_commit(lookups.invalidate)
+    responses_changed()
@@ -0,0 +1,248 @@
+"""
+Job queue sinkronisasi API berbasis database (tanpa broker eksternal).
+
+Endpoint web/API hanya meng-enqueue SyncJob dan langsung mengembalikan job id.
+Worker (manage.py run_sync_worker) mengambil job dari tabel, menjalankan
+fetch + ProductSyncEngine, lalu menyimpan hasil atau error ke job.
+"""
+
+import logging
+import os
+import queue
+import socket
+import threading
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.utils import timezone
+
+from .models import SyncJob
+from .services import FastPrintAPIService
+from .sync import ProductSyncEngine, SyncResult
+
+logger = logging.getLogger(__name__)
+
+
+def worker_name() -> str:
+    """Identitas worker: hostname:pid."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_sync(username: str = None, catalogue: str = None, force: bool = False) -> Tuple[SyncJob, bool]:
+    """
+    Enqueue job sinkronisasi untuk sebuah catalogue.
+
+    Jika catalogue yang sama sudah punya job queued/running, job tersebut
+    dikembalikan dan tidak ada job baru yang dibuat.
+
+    Args:
+        username (str): Username API. Jika None, akan generate otomatis saat job jalan.
+        catalogue (str): Feed yang disinkronisasi. Default URL API dari settings.
+        force (bool): Import ulang walaupun feed tidak berubah sejak fetch terakhir.
+
+    Returns:
+        Tuple[SyncJob, bool]: Job dan flag apakah job baru dibuat
+    """
+    catalogue = catalogue or FastPrintAPIService.get_api_url()
+
+    try:
+        with transaction.atomic():
+            job = SyncJob.objects.create(catalogue=catalogue, username=username or None, force=force)
+    except IntegrityError:
+        active = SyncJob.objects.filter(
+            catalogue=catalogue, status__in=SyncJob.ACTIVE_STATUSES
+        ).first()
+        if active is None:
+            # Job aktif baru saja selesai di antara insert dan select, coba lagi
+            return enqueue_sync(username, catalogue, force)
+        return active, False
+
+    logger.info(f"Enqueued {job} for {catalogue}")
+
+    if getattr(settings, 'FASTPRINT_SYNC_INLINE', False):
+        job = claim_job(job.pk)
+        if job is not None:
+            run_job(job)
+
+    return job, True
+
+
+def claim_job(job_id: int = None, worker: str = None) -> Optional[SyncJob]:
+    """
+    Ambil job queued (tertua, atau job_id tertentu) dan tandai running.
+
+    Transisi queued -> running dilakukan dengan UPDATE bersyarat sehingga
+    aman dijalankan oleh beberapa worker sekaligus.
+
+    Returns:
+        SyncJob: Job yang berhasil di-claim, atau None jika tidak ada
+    """
+    worker = worker or worker_name()
+    candidates = SyncJob.objects.filter(status=SyncJob.STATUS_QUEUED)
+    if job_id is not None:
+        candidates = candidates.filter(pk=job_id)
+
+    for pk in candidates.order_by('created_at').values_list('pk', flat=True)[:10]:
+        now = timezone.now()
+        claimed = SyncJob.objects.filter(pk=pk, status=SyncJob.STATUS_QUEUED).update(
+            status=SyncJob.STATUS_RUNNING,
+            worker=worker,
+            started_at=now,
+            heartbeat_at=now,
+        )
+        if claimed:
+            return SyncJob.objects.get(pk=pk)
+
+    return None
+
+
+def recover_stale_jobs() -> int:
+    """
+    Tandai failed job running yang heartbeat-nya lebih lama dari
+    FASTPRINT_SYNC_JOB_TIMEOUT (worker mati di tengah jalan), supaya
+    catalogue tersebut bisa di-enqueue lagi.
+
+    Returns:
+        int: Jumlah job yang ditandai failed
+    """
+    timeout = getattr(settings, 'FASTPRINT_SYNC_JOB_TIMEOUT', 30 * 60)
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    count = SyncJob.objects.filter(
+        status=SyncJob.STATUS_RUNNING, heartbeat_at__lt=cutoff
+    ).update(
+        status=SyncJob.STATUS_FAILED,
+        error='Worker berhenti merespons (heartbeat timeout).',
+        finished_at=timezone.now(),
+    )
+    if count:
+        logger.warning(f"Marked {count} stale sync job(s) as failed")
+    return count
+
+
+def get_progress(job: SyncJob) -> Dict[str, int]:
+    """
+    Progress job: counter yang ditulis JobReporter per batch selama job
+    running, atau hasil akhir setelah job selesai.
+    """
+    return {
+        'processed': job.processed,
+        'created': job.created,
+        'updated': job.updated,
+        'unchanged': job.unchanged,
+        'removed': job.removed,
+    }
+
+
+def _touch(job_id: int, **fields) -> int:
+    """Perbarui heartbeat (dan field lain) job yang masih running."""
+    return SyncJob.objects.filter(pk=job_id, status=SyncJob.STATUS_RUNNING).update(
+        heartbeat_at=timezone.now(), **fields
+    )
+
+
+class JobReporter:
+    """
+    Menulis heartbeat dan progress job yang sedang berjalan ke baris SyncJob.
+
+    Import berjalan di dalam satu transaksi, jadi update lewat koneksi yang
+    sama baru terlihat setelah commit. Karena itu reporter memakai thread
+    dengan koneksi database sendiri: progress per batch langsung ter-commit,
+    dan heartbeat diperbarui setiap FASTPRINT_SYNC_HEARTBEAT_INTERVAL detik
+    walaupun batch berikutnya belum datang (mis. download feed lambat), supaya
+    recover_stale_jobs tidak menggagalkan job yang masih sehat.
+
+    SQLite hanya mengizinkan satu writer; di sana update ditulis lewat
+    koneksi yang sama dan terlihat setelah sync selesai.
+
+    Update hanya mengenai job yang masih running: job yang sudah ditandai
+    failed oleh recover_stale_jobs tidak diubah lagi.
+    """
+
+    def __init__(self, job: SyncJob, interval: float = None):
+        self.job_id = job.pk
+        self.interval = interval or getattr(settings, 'FASTPRINT_SYNC_HEARTBEAT_INTERVAL', 60)
+        self.threaded = connection.vendor != 'sqlite'
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def __enter__(self):
+        if self.threaded:
+            self._thread = threading.Thread(target=self._run, name=f'sync-job-{self.job_id}', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def progress(self, result: SyncResult):
+        """Progress callback ProductSyncEngine."""
+        if self._thread is None:
+            _touch(self.job_id, **result.as_dict())
+        else:
+            self._queue.put(result.as_dict())
+
+    def _run(self):
+        try:
+            while True:
+                try:
+                    counters = self._queue.get(timeout=self.interval)
+                except queue.Empty:
+                    counters = {}
+                if counters is None:
+                    return
+                try:
+                    _touch(self.job_id, **counters)
+                except DatabaseError as e:
+                    logger.warning(f"Gagal menulis heartbeat SyncJob #{self.job_id}: {e}")
+        finally:
+            connection.close()
+
+
+def run_job(job: SyncJob) -> SyncJob:
+    """
+    Jalankan job yang sudah di-claim: conditional fetch + bulk sync.
+
+    Jika feed tidak berubah sejak import terakhir (HTTP 304 atau body hash
+    sama), parse+import dilewati dan job selesai dengan not_modified=True.
+    Error tidak di-raise, tetapi disimpan di job.error dengan status failed.
+
+    Hasil ditulis dengan UPDATE bersyarat status running: job yang sementara
+    itu sudah ditandai failed oleh recover_stale_jobs tetap failed.
+    """
+    logger.info(f"Running {job} on {job.worker}")
+
+    try:
+        with JobReporter(job) as reporter, \
+                FastPrintAPIService.open_feed(job.username, conditional=not job.force) as feed:
+            if feed.not_modified:
+                result = None
+            else:
+                engine = ProductSyncEngine(
+                    source=job.catalogue,
+                    detect_removed=True,
+                    progress_callback=reporter.progress,
+                )
+                result = engine.run(feed.iter_products())
+                feed.save_validators()
+
+    except Exception as e:
+        logger.error(f"{job} failed: {str(e)}")
+        fields = {'status': SyncJob.STATUS_FAILED, 'error': str(e)}
+
+    else:
+        fields = {'status': SyncJob.STATUS_SUCCESS}
+        if result is None:
+            fields['not_modified'] = True
+        else:
+            fields.update(result.as_dict())
+
+    if not _touch(job.pk, finished_at=timezone.now(), **fields):
+        logger.warning(f"{job} sudah tidak running (heartbeat timeout), status {fields['status']} tidak disimpan")
+
+    job.refresh_from_db()
+    return job
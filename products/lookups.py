@@ -0,0 +1,227 @@
+"""
+Cache in-process untuk tabel kecil Status dan Kategori.
+
+Listing produk cukup memfilter status_id hasil lookup di sini, tanpa JOIN ke
+products_status hanya untuk membandingkan nama_status. Dropdown kategori dan
+response list KategoriViewSet/StatusViewSet juga dilayani dari cache ini.
+
+Invalidasi:
+- Signal post_save/post_delete Kategori & Status (products/signals.py)
+  memanggil invalidate(), yang menaikkan version key di Django cache.
+- Setiap proses membandingkan versinya dengan version key tersebut, sehingga
+  perubahan dari proses lain terlihat jika CACHES memakai backend bersama.
+- LOOKUP_CACHE_TTL membatasi umur map lokal sebagai pengaman.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+SELLABLE_STATUS = 'bisa dijual'
+VERSION_KEY = 'products:lookups:version'
+
+_lock = threading.Lock()
+_state: Dict = {}
+
+
+def _shared_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def version() -> int:
+    """Versi bersama cache lookup; berubah setiap Kategori/Status berubah."""
+    return _shared_version()
+
+
+def invalidate():
+    """Tandai cache lookup basi di semua proses (naikkan version key)."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+    with _lock:
+        _state.clear()
+
+
+def _fresh_state(version: int) -> Optional[Dict]:
+    ttl = getattr(settings, 'LOOKUP_CACHE_TTL', 60)
+    with _lock:
+        if _state.get('version') == version and time.monotonic() - _state['loaded_at'] < ttl:
+            return _state
+    return None
+
+
+def _load() -> Dict:
+    from .models import Kategori, Status
+
+    version = _shared_version()
+    state = _fresh_state(version)
+    if state is not None:
+        return state
+    return _store(version, list(Kategori.objects.all()), list(Status.objects.all()))
+
+
+async def _aload() -> Dict:
+    """Seperti _load(), dengan cache dan ORM async (untuk view async)."""
+    from .models import Kategori, Status
+
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        await cache.aadd(VERSION_KEY, 1, timeout=None)
+        version = await cache.aget(VERSION_KEY, 1)
+    state = _fresh_state(version)
+    if state is not None:
+        return state
+    kategoris = [kategori async for kategori in Kategori.objects.all()]
+    statuses = [status async for status in Status.objects.all()]
+    return _store(version, kategoris, statuses)
+
+
+def _store(version: int, kategoris: List, statuses: List) -> Dict:
+    from .serializers import KategoriSerializer, StatusSerializer
+
+    kategori_data = list(KategoriSerializer(kategoris, many=True).data)
+    status_data = list(StatusSerializer(statuses, many=True).data)
+    state = {
+        'version': version,
+        'loaded_at': time.monotonic(),
+        'kategoris': kategoris,
+        'kategori_by_id': {k.pk: k for k in kategoris},
+        'kategori_ids': {k.nama_kategori: k.pk for k in kategoris},
+        'kategori_data': kategori_data,
+        'kategori_data_by_id': {item['id_kategori']: item for item in kategori_data},
+        'statuses': statuses,
+        'status_by_id': {s.pk: s for s in statuses},
+        'status_ids': {s.nama_status: s.pk for s in statuses},
+        'status_data': status_data,
+        'status_data_by_id': {item['id_status']: item for item in status_data},
+    }
+
+    with _lock:
+        _state.clear()
+        _state.update(state)
+    return state
+
+
+def get_status_id(nama_status: str) -> Optional[int]:
+    """id_status untuk nama_status, atau None jika tidak ada."""
+    return _load()['status_ids'].get(nama_status)
+
+
+def sellable_status_id() -> Optional[int]:
+    """id_status untuk status "bisa dijual"."""
+    return get_status_id(SELLABLE_STATUS)
+
+
+def get_kategori_id(nama_kategori: str) -> Optional[int]:
+    """id_kategori untuk nama_kategori, atau None jika tidak ada."""
+    return _load()['kategori_ids'].get(nama_kategori)
+
+
+def is_reference_id(value) -> bool:
+    """
+    Aturan bersama untuk referensi kategori/status dari input (bulk API,
+    penyesuaian harga): int adalah primary key, string selalu nama, termasuk
+    nama yang hanya berisi angka.
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def reference_q(field_name: str, name_field: str, value) -> Q:
+    """Filter produk untuk referensi `value` (lihat is_reference_id)."""
+    if is_reference_id(value):
+        return Q(**{f'{field_name}_id': value})
+    return Q(**{f'{field_name}__{name_field}': value})
+
+
+def kategori_list() -> List:
+    """Semua Kategori (urut nama_kategori), untuk dropdown filter."""
+    return _load()['kategoris']
+
+
+def status_list() -> List:
+    """Semua Status (urut nama_status)."""
+    return _load()['statuses']
+
+
+def kategori_data() -> List[Dict]:
+    """Data KategoriSerializer(many=True) untuk semua Kategori."""
+    return _load()['kategori_data']
+
+
+def status_data() -> List[Dict]:
+    """Data StatusSerializer(many=True) untuk semua Status."""
+    return _load()['status_data']
+
+
+def kategori_data_by_id() -> Dict[int, Dict]:
+    """Data KategoriSerializer per id_kategori (dibagi antar request, jangan diubah)."""
+    return _load()['kategori_data_by_id']
+
+
+def status_data_by_id() -> Dict[int, Dict]:
+    """Data StatusSerializer per id_status (dibagi antar request, jangan diubah)."""
+    return _load()['status_data_by_id']
+
+
+async def aversion() -> int:
+    """version() untuk view async."""
+    return (await _aload())['version']
+
+
+async def asellable_status_id() -> Optional[int]:
+    """sellable_status_id() untuk view async."""
+    return (await _aload())['status_ids'].get(SELLABLE_STATUS)
+
+
+async def akategori_data() -> List[Dict]:
+    """kategori_data() untuk view async."""
+    return (await _aload())['kategori_data']
+
+
+async def astatus_data() -> List[Dict]:
+    """status_data() untuk view async."""
+    return (await _aload())['status_data']
+
+
+async def akategori_data_by_id() -> Dict[int, Dict]:
+    """kategori_data_by_id() untuk view async."""
+    return (await _aload())['kategori_data_by_id']
+
+
+async def astatus_data_by_id() -> Dict[int, Dict]:
+    """status_data_by_id() untuk view async."""
+    return (await _aload())['status_data_by_id']
+
+
+def attach(products: Iterable) -> List:
+    """
+    Isi relasi kategori/status dari cache, pengganti select_related().
+
+    Produk yang kategori/status-nya belum ada di cache dibiarkan, sehingga
+    relasinya tetap di-load lazy seperti biasa.
+
+    Returns:
+        List: Produk yang sama dalam bentuk list
+    """
+    state = _load()
+    kategori_by_id = state['kategori_by_id']
+    status_by_id = state['status_by_id']
+
+    products = list(products)
+    for product in products:
+        kategori = kategori_by_id.get(product.kategori_id)
+        if kategori is not None:
+            product.kategori = kategori
+        status = status_by_id.get(product.status_id)
+        if status is not None:
+            product.status = status
+    return products
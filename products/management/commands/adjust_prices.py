@@ -0,0 +1,59 @@
+"""
+Penyesuaian harga massal dalam satu UPDATE (products/pricing.py).
+
+Usage:
+    python manage.py adjust_prices --kategori Kertas --multiply 1.05 --dry-run
+    python manage.py adjust_prices --kategori Kertas --multiply 1.05
+    python manage.py adjust_prices --kategori-id 3 --status "bisa dijual" --set 10000
+    python manage.py adjust_prices --nama "tinta" --add 2500
+    python manage.py adjust_prices --all --round 500
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products import pricing
+from products.models import PriceAdjustment
+
+
+class Command(BaseCommand):
+    help = 'Sesuaikan harga banyak produk sekaligus (set/add/multiply/round) dengan audit.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kategori', help='Nama kategori')
+        parser.add_argument('--kategori-id', type=int, help='id kategori')
+        parser.add_argument('--status', help='Nama status')
+        parser.add_argument('--status-id', type=int, help='id status')
+        parser.add_argument('--nama', help='Bagian nama produk (case-insensitive)')
+        parser.add_argument('--all', action='store_true', help='Semua produk (tanpa filter)')
+
+        operation = parser.add_mutually_exclusive_group(required=True)
+        for name, label in PriceAdjustment.OPERATION_CHOICES:
+            operation.add_argument(f'--{name}', metavar='NILAI', help=label)
+
+        parser.add_argument('--dry-run', action='store_true', help='Tampilkan preview tanpa mengubah data')
+
+    def handle(self, *args, **options):
+        operation, value = next(
+            (name, options[name]) for name, _ in PriceAdjustment.OPERATION_CHOICES if options[name] is not None
+        )
+        filters = {name: options[name] for name in pricing.FILTER_FIELDS if options[name]}
+
+        try:
+            queryset = pricing.filter_products(all_products=options['all'], **filters)
+            summary = pricing.preview(queryset, operation, value)
+            self.stdout.write(
+                f"{summary.affected} produk, total harga {summary.total_before} -> {summary.total_after} "
+                f"(harga baru {summary.min_after} s/d {summary.max_after})"
+            )
+            for row in summary.sample:
+                self.stdout.write(f"  #{row['id_produk']} {row['nama_produk']}: {row['harga']} -> {row['harga_baru']}")
+
+            if options['dry_run']:
+                self.stdout.write("Dry run: tidak ada yang diubah")
+                return
+
+            audit = pricing.apply(queryset, operation, value, filters=filters, performed_by='command')
+        except (pricing.PriceAdjustmentError, ArithmeticError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"{audit.affected} produk diubah (audit #{audit.pk})"))
@@ -0,0 +1,73 @@
+"""
+Kelola fixture response API untuk sinkronisasi offline.
+
+Usage:
+    python manage.py api_fixture record                    # rekam response API sungguhan
+    python manage.py api_fixture synthetic --products 100000
+    python manage.py api_fixture serve --port 8765         # stub server lokal
+
+Fixture dipakai oleh FASTPRINT_API['TRANSPORT'] = 'replay' (tanpa jaringan)
+atau lewat `serve` dengan FASTPRINT_API['URL'] diarahkan ke stub server
+(products/transports.py).
+"""
+
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products.services import FastPrintAPIError, FastPrintAPIService, build_session
+from products.transports import fixture_path, fixture_server, load_meta, write_synthetic_feed
+
+
+class Command(BaseCommand):
+    help = 'Rekam, buat (sintetis), atau layani fixture response API Fast Print.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['record', 'synthetic', 'serve'])
+        parser.add_argument('--fixture', help="Path fixture. Default: FASTPRINT_API['FIXTURE']")
+        parser.add_argument('--products', type=int, default=10_000, help='Jumlah produk fixture sintetis')
+        parser.add_argument('--seed', type=int, default=42, help='Seed random fixture sintetis')
+        parser.add_argument('--username', help='Username API untuk record. Default: otomatis')
+        parser.add_argument('--host', default='127.0.0.1', help='Host stub server')
+        parser.add_argument('--port', type=int, default=8765, help='Port stub server')
+
+    def handle(self, *args, **options):
+        path = fixture_path(options['fixture'])
+        handler = getattr(self, f"handle_{options['action']}")
+        handler(path, options)
+
+    def handle_record(self, path, options):
+        session = build_session('record', path)
+        try:
+            with FastPrintAPIService.open_feed(options['username'], conditional=False, session=session) as feed:
+                feed.drain()
+        except FastPrintAPIError as e:
+            raise CommandError(f"Gagal merekam response API: {e}")
+        finally:
+            session.close()
+        self._report(path)
+
+    def handle_synthetic(self, path, options):
+        if options['products'] < 0:
+            raise CommandError('--products tidak boleh negatif')
+        write_synthetic_feed(options['products'], path, seed=options['seed'])
+        self._report(path)
+
+    def handle_serve(self, path, options):
+        if not os.path.exists(path):
+            raise CommandError(f"Fixture {path} tidak ada, jalankan 'api_fixture record' atau 'synthetic' dulu")
+        server = fixture_server(path, options['host'], options['port'])
+        host, port = server.server_address[:2]
+        self.stdout.write(f"Melayani {path} di http://{host}:{port}/ (Ctrl+C untuk berhenti)")
+        self.stdout.write(f"Set FASTPRINT_API['URL'] = 'http://{host}:{port}/' untuk memakainya")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    def _report(self, path):
+        etag = load_meta(path).get('headers', {}).get('ETag', '-')
+        size = os.path.getsize(path)
+        self.stdout.write(self.style.SUCCESS(f"Fixture {path} ({size:,} bytes, ETag {etag})"))
@@ -0,0 +1,105 @@
+"""
+Perbaiki nama_produk ganda sebelum unique constraint nama_produk
+(migration 0007) dipasang. Migration 0006 berhenti dengan daftar duplikat
+selama masih ada nama ganda.
+
+Usage:
+    python manage.py dedupe_product_names --dry-run    # tampilkan rencana saja
+    python manage.py dedupe_product_names              # terapkan
+
+Produk dengan id_produk terkecil mempertahankan namanya (produk yang
+dicocokkan ProductSyncEngine lewat nama); produk lain diberi akhiran
+" #<id_produk>", ditambah "-2", "-3", ... jika nama tersebut sudah dipakai.
+Perubahan ditulis dengan UPDATE langsung (tanpa signal), karena tabel
+turunan dari migration berikutnya belum tentu ada.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from products.models import Product
+
+MAX_LENGTH = 255
+
+
+def find_duplicates() -> Dict[str, List[int]]:
+    """nama_produk ganda -> id_produk berurutan."""
+    names = (
+        Product.objects.values('nama_produk')
+        .annotate(total=Count('id_produk'))
+        .filter(total__gt=1)
+        .values_list('nama_produk', flat=True)
+    )
+    duplicates = defaultdict(list)
+    for pk, nama_produk in Product.objects.filter(nama_produk__in=list(names)).order_by(
+        'id_produk'
+    ).values_list('id_produk', 'nama_produk'):
+        duplicates[nama_produk].append(pk)
+    return dict(duplicates)
+
+
+def plan_renames(duplicates: Dict[str, List[int]], taken: Set[str]) -> List[Tuple[int, str, str]]:
+    """
+    Nama baru untuk produk duplikat (kecuali id_produk terkecil).
+
+    Args:
+        duplicates: nama_produk -> id_produk berurutan (find_duplicates)
+        taken: Semua nama_produk yang sudah ada; diperbarui dengan nama baru
+
+    Returns:
+        List[Tuple[int, str, str]]: (id_produk, nama lama, nama baru)
+    """
+    renames = []
+    for nama_produk in sorted(duplicates):
+        for pk in duplicates[nama_produk][1:]:
+            attempt = 1
+            while True:
+                suffix = f" #{pk}" if attempt == 1 else f" #{pk}-{attempt}"
+                candidate = nama_produk[:MAX_LENGTH - len(suffix)] + suffix
+                if candidate not in taken:
+                    break
+                attempt += 1
+            taken.add(candidate)
+            renames.append((pk, nama_produk, candidate))
+    return renames
+
+
+class Command(BaseCommand):
+    help = 'Ganti nama produk dengan nama_produk ganda sebelum unique constraint dipasang.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Tampilkan rencana tanpa mengubah data.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            duplicates = find_duplicates()
+            if not duplicates:
+                self.stdout.write(self.style.SUCCESS('Tidak ada nama_produk ganda'))
+                return
+
+            taken = set(Product.objects.values_list('nama_produk', flat=True))
+            renames = plan_renames(duplicates, taken)
+            for pk, old, new in renames:
+                self.stdout.write(f"  #{pk}: {old!r} -> {new!r}")
+
+            if options['dry_run']:
+                self.stdout.write(f"{len(renames)} produk akan diganti namanya (dry run, tidak ada yang diubah)")
+                return
+
+            now = timezone.now()
+            for pk, _, new in renames:
+                harga, kategori_id, status_id = Product.objects.values_list(
+                    'harga', 'kategori_id', 'status_id'
+                ).get(pk=pk)
+                Product.objects.filter(pk=pk).update(
+                    nama_produk=new,
+                    content_hash=Product.compute_content_hash(new, harga, kategori_id, status_id),
+                    updated_at=now,
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"{len(renames)} produk diganti namanya; jalankan migrate lagi"))
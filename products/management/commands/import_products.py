@@ -0,0 +1,63 @@
+"""
+Import produk dari file CSV, NDJSON, atau dump JSON response API.
+
+Usage:
+    python manage.py import_products produk.csv
+    python manage.py import_products dump.json --format json
+    python manage.py import_products produk.ndjson --engine batch --batch-size 5000
+
+PostgreSQL memakai COPY ke tabel staging + merge set-based; backend lain
+memakai ProductSyncEngine per batch (products/importer.py).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products.importer import FORMATS, ProductImporter, detect_format, iter_file
+
+
+class Command(BaseCommand):
+    help = 'Import produk dari file CSV/NDJSON/JSON dengan bulk load.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path file yang diimport')
+        parser.add_argument('--format', choices=FORMATS, help='Format file. Default: dari ekstensi')
+        parser.add_argument(
+            '--engine',
+            choices=['auto', 'copy', 'batch'],
+            default='auto',
+            help='copy (PostgreSQL COPY + merge) atau batch (ProductSyncEngine). Default: auto',
+        )
+        parser.add_argument('--batch-size', type=int, help='Baris per batch / interval progress')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        try:
+            file_format = options['format'] or detect_format(path)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        start = time.perf_counter()
+
+        def progress(processed):
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed else 0
+            self.stdout.write(f"  {processed:,} baris dibaca ({rate:,.0f} baris/detik)")
+
+        try:
+            importer = ProductImporter(
+                batch_size=options['batch_size'], engine=options['engine'], progress_callback=progress
+            )
+            self.stdout.write(f"Import {path} ({file_format}, engine {importer.engine})")
+            result = importer.run(iter_file(path, file_format))
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        elapsed = time.perf_counter() - start
+        rate = result.processed / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.processed:,} baris dalam {elapsed:.1f}s ({rate:,.0f} baris/detik): "
+            f"{result.created} baru, {result.updated} diperbarui, {result.unchanged} tidak berubah, "
+            f"{importer.skipped} dilewati (tidak valid)"
+        ))
@@ -0,0 +1,49 @@
+"""
+Bangun ulang atau periksa tabel ringkasan statistik kategori (KategoriStats).
+
+Usage:
+    python manage.py kategori_stats verify      # exit code 1 jika ada selisih
+    python manage.py kategori_stats rebuild     # hitung ulang dari tabel produk
+
+Tabel dipelihara otomatis oleh signal Product dan operasi massal
+(products/stats.py); command ini untuk pemulihan setelah perubahan data di
+luar aplikasi (SQL manual, restore) dan untuk pemeriksaan berkala.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products import stats
+
+MAX_REPORTED = 20
+
+
+class Command(BaseCommand):
+    help = 'Bangun ulang (rebuild) atau periksa (verify) statistik kategori.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['rebuild', 'verify'])
+
+    def handle(self, *args, **options):
+        drift = stats.verify()
+        self._report(drift)
+
+        if options['action'] == 'verify':
+            if drift:
+                raise CommandError(f"{len(drift)} kelompok kategori/status tidak sesuai, jalankan 'kategori_stats rebuild'")
+            self.stdout.write(self.style.SUCCESS('Statistik kategori sesuai dengan tabel produk'))
+            return
+
+        stats.rebuild()
+        remaining = stats.verify()
+        if remaining:
+            raise CommandError(f"{len(remaining)} kelompok masih tidak sesuai setelah rebuild (ada penulisan bersamaan?)")
+        self.stdout.write(self.style.SUCCESS(f'Statistik kategori dibangun ulang ({len(drift)} kelompok diperbaiki)'))
+
+    def _report(self, drift):
+        for row in drift[:MAX_REPORTED]:
+            self.stdout.write(
+                f"  kategori {row['kategori_id']} / status {row['status_id']}: "
+                f"tersimpan {row['actual']}, seharusnya {row['expected']}"
+            )
+        if len(drift) > MAX_REPORTED:
+            self.stdout.write(f"  ... dan {len(drift) - MAX_REPORTED} lainnya")
@@ -0,0 +1,64 @@
+"""
+Worker untuk menjalankan SyncJob dari antrian database.
+
+Usage:
+    python manage.py run_sync_worker            # jalan terus, polling antrian
+    python manage.py run_sync_worker --once     # proses antrian sampai kosong lalu keluar
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from products.checks import api_cache_warning
+from products.jobs import claim_job, recover_stale_jobs, run_job, worker_name
+
+
+class Command(BaseCommand):
+    help = 'Jalankan worker sinkronisasi API yang memproses SyncJob dari database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Proses semua job yang sedang queued lalu keluar.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Jeda (detik) antar polling saat antrian kosong. Default: 5',
+        )
+
+    def handle(self, *args, **options):
+        name = worker_name()
+        self.stdout.write(f"Sync worker {name} started")
+
+        warning = api_cache_warning()
+        if warning:
+            self.stderr.write(self.style.WARNING(f"{warning.msg} {warning.hint}"))
+
+        try:
+            while True:
+                recover_stale_jobs()
+                job = claim_job(worker=name)
+
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                self.stdout.write(f"Running {job}...")
+                job = run_job(job)
+
+                if job.status == job.STATUS_SUCCESS:
+                    self.stdout.write(self.style.SUCCESS(
+                        f"{job}: {job.processed} diproses, {job.created} baru, "
+                        f"{job.updated} diperbarui, {job.unchanged} tidak berubah"
+                    ))
+                else:
+                    self.stdout.write(self.style.ERROR(f"{job}: {job.error}"))
+
+        except KeyboardInterrupt:
+            self.stdout.write("Sync worker stopped")
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:54
+
+import hashlib
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def populate_content_hash(apps, schema_editor):
+    """Isi content_hash untuk produk yang sudah ada (lihat Product.compute_content_hash)."""
+    Product = apps.get_model('products', 'Product')
+    batch = []
+    for product in Product.objects.only('id_produk', 'nama_produk', 'harga', 'kategori_id', 'status_id').iterator(chunk_size=2000):
+        harga = Decimal(str(product.harga)).quantize(Decimal('0.01'))
+        raw = f"{product.nama_produk}|{harga}|{product.kategori_id}|{product.status_id}"
+        product.content_hash = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        batch.append(product)
+        if len(batch) >= 2000:
+            Product.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    if batch:
+        Product.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=255, unique=True)),
+                ('entries', models.JSONField(default=dict)),
+                ('product_count', models.PositiveIntegerField(default=0)),
+                ('feed_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('applied_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Sync Snapshot',
+            },
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(populate_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_syncjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='APIFetchState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.CharField(max_length=255, unique=True)),
+                ('etag', models.CharField(blank=True, default='', max_length=255)),
+                ('last_modified', models.CharField(blank=True, default='', max_length=255)),
+                ('body_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'API Fetch State',
+            },
+        ),
+        migrations.AddField(
+            model_name='syncjob',
+            name='force',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='syncjob',
+            name='not_modified',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-17 12:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_apifetchstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apifetchstate',
+            name='username_hint',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='apifetchstate',
+            name='username_hint_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import Count
+
+MAX_REPORTED = 20
+
+
+def check_duplicate_names(apps, schema_editor):
+    """
+    Siapkan unique constraint pada nama_produk (migration 0007).
+
+    Nama ganda tidak diubah otomatis: migration berhenti dengan daftar
+    duplikat, dan data diperbaiki secara eksplisit dengan
+    `python manage.py dedupe_product_names` sebelum migrate diulang.
+    """
+    Product = apps.get_model('products', 'Product')
+    duplicates = list(
+        Product.objects.values('nama_produk')
+        .annotate(total=Count('id_produk'))
+        .filter(total__gt=1)
+        .order_by('nama_produk')
+        .values_list('nama_produk', 'total')
+    )
+    if not duplicates:
+        return
+
+    lines = [f"  {nama_produk!r}: {total} produk" for nama_produk, total in duplicates[:MAX_REPORTED]]
+    if len(duplicates) > MAX_REPORTED:
+        lines.append(f"  ... dan {len(duplicates) - MAX_REPORTED} nama lainnya")
+    raise RuntimeError(
+        f"{len(duplicates)} nama_produk ganda, unique constraint nama_produk tidak bisa dipasang:\n"
+        + "\n".join(lines)
+        + "\nPeriksa rencana perubahan dengan `python manage.py dedupe_product_names --dry-run`, "
+        "terapkan dengan `python manage.py dedupe_product_names`, lalu jalankan migrate lagi."
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_apifetchstate_username_hint'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:00
+
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    """Index trigram untuk nama_produk__icontains (ILIKE '%...%'), hanya PostgreSQL."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS product_nama_trgm_idx '
+        'ON products_product USING gin (nama_produk gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS product_nama_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_dedupe_product_names'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='nama_produk',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', '-created_at'], name='product_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'kategori', '-created_at'], name='product_status_kat_created_idx'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_product_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='product',
+            options={'ordering': ['-created_at', '-id_produk'], 'verbose_name_plural': 'Produk'},
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_status_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_status_kat_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', '-created_at', '-id_produk'], name='product_status_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'kategori', '-created_at', '-id_produk'], name='product_status_kat_crtd_id_idx'),
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:30
+
+from django.db import migrations
+
+# SQL dibekukan di migration ini (bukan diambil dari products/search.py),
+# supaya perubahan backend search di kemudian hari tidak mengubah migration lama.
+# Struktur yang sama dipasang ulang oleh search.ensure_installed (post_migrate).
+
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce({prefix}nama_produk, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({prefix}deskripsi, '')), 'B')"
+)
+
+POSTGRES_INSTALL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'ALTER TABLE products_product ADD COLUMN IF NOT EXISTS search_vector tsvector',
+    f"""
+    CREATE OR REPLACE FUNCTION products_product_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {POSTGRES_DOCUMENT.format(prefix='NEW.')};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    'DROP TRIGGER IF EXISTS products_product_search_vector_trigger ON products_product',
+    """
+    CREATE TRIGGER products_product_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF nama_produk, deskripsi ON products_product
+    FOR EACH ROW EXECUTE FUNCTION products_product_search_vector_update()
+    """,
+    f"""
+    UPDATE products_product SET search_vector = {POSTGRES_DOCUMENT.format(prefix='')}
+    WHERE search_vector IS NULL
+    """,
+    'CREATE INDEX IF NOT EXISTS product_search_vector_idx ON products_product USING gin (search_vector)',
+]
+
+POSTGRES_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS products_product_search_vector_trigger ON products_product',
+    'DROP FUNCTION IF EXISTS products_product_search_vector_update()',
+    'DROP INDEX IF EXISTS product_search_vector_idx',
+    'ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector',
+]
+
+SQLITE_FTS_INSERT = (
+    'INSERT INTO products_product_fts(rowid, nama_produk, deskripsi) '
+    'VALUES (new.id_produk, new.nama_produk, new.deskripsi);'
+)
+SQLITE_FTS_DELETE = (
+    'INSERT INTO products_product_fts(products_product_fts, rowid, nama_produk, deskripsi) '
+    "VALUES ('delete', old.id_produk, old.nama_produk, old.deskripsi);"
+)
+
+SQLITE_INSTALL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS products_product_fts USING fts5("
+    "nama_produk, deskripsi, content='products_product', content_rowid='id_produk', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    'CREATE TRIGGER IF NOT EXISTS products_product_fts_ai AFTER INSERT ON products_product '
+    f'BEGIN {SQLITE_FTS_INSERT} END',
+    'CREATE TRIGGER IF NOT EXISTS products_product_fts_ad AFTER DELETE ON products_product '
+    f'BEGIN {SQLITE_FTS_DELETE} END',
+    'CREATE TRIGGER IF NOT EXISTS products_product_fts_au AFTER UPDATE OF nama_produk, deskripsi ON products_product '
+    f'BEGIN {SQLITE_FTS_DELETE} {SQLITE_FTS_INSERT} END',
+    "INSERT INTO products_product_fts(products_product_fts) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS products_product_fts_ai',
+    'DROP TRIGGER IF EXISTS products_product_fts_ad',
+    'DROP TRIGGER IF EXISTS products_product_fts_au',
+    'DROP TABLE IF EXISTS products_product_fts',
+]
+
+STATEMENTS = {
+    'postgresql': (POSTGRES_INSTALL, POSTGRES_UNINSTALL),
+    'sqlite': (SQLITE_INSTALL, SQLITE_UNINSTALL),
+}
+
+
+def _execute(schema_editor, index):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    for sql in statements[index]:
+        schema_editor.execute(sql, params=None)
+
+
+def install_search(apps, schema_editor):
+    """tsvector + trigger + GIN (PostgreSQL) atau FTS5 + trigger (SQLite)."""
+    _execute(schema_editor, 0)
+
+
+def uninstall_search(apps, schema_editor):
+    _execute(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_product_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search, uninstall_search),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceAdjustment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('operation', models.CharField(choices=[('set', 'Set harga'), ('add', 'Tambah harga'), ('multiply', 'Kalikan harga'), ('round', 'Bulatkan ke kelipatan')], max_length=20)),
+                ('value', models.DecimalField(decimal_places=4, max_digits=15)),
+                ('filters', models.JSONField(default=dict)),
+                ('affected', models.PositiveIntegerField(default=0)),
+                ('total_before', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('total_after', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('performed_by', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Price Adjustment',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
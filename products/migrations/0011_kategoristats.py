@@ -0,0 +1,46 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+
+def populate_stats(apps, schema_editor):
+    """Isi ringkasan awal dari produk yang sudah ada (satu GROUP BY)."""
+    Product = apps.get_model('products', 'Product')
+    KategoriStats = apps.get_model('products', 'KategoriStats')
+    rows = Product.objects.order_by().values('kategori_id', 'status_id').annotate(
+        product_count=Count('pk'),
+        total_harga=Sum('harga'),
+        min_harga=Min('harga'),
+        max_harga=Max('harga'),
+    )
+    KategoriStats.objects.bulk_create([KategoriStats(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_priceadjustment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KategoriStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_count', models.PositiveIntegerField(default=0)),
+                ('total_harga', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('min_harga', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('max_harga', models.DecimalField(blank=True, decimal_places=2, max_digits=15, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kategori', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='products.kategori')),
+                ('status', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='kategori_stats', to='products.status')),
+            ],
+            options={
+                'verbose_name_plural': 'Kategori Stats',
+                'constraints': [models.UniqueConstraint(fields=('kategori', 'status'), name='kategori_stats_kategori_status_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
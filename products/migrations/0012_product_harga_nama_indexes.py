@@ -0,0 +1,29 @@
+# Generated by Django 5.2.10 on 2026-10-17 13:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_kategoristats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'harga', 'id_produk'], name='product_status_harga_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'kategori', 'harga', 'id_produk'], name='product_status_kat_harga_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'nama_produk', 'id_produk'], name='product_status_nama_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'kategori', 'nama_produk', 'id_produk'], name='product_status_kat_nama_idx'),
+        ),
+    ]
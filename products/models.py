@@ -1,4 +1,12 @@
+import hashlib
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import F, Func, TextField, Value
+from django.db.models.functions import Cast, Concat
+
+# Harga terbesar yang muat di kolom Product.harga (max_digits=15, decimal_places=2)
+MAX_HARGA = Decimal('9999999999999.99')
 
 
 class Kategori(models.Model):
@@ -49,24 +57,311 @@ class Product(models.Model):
     
     Fields:
     - id_produk: Primary Key
-    - nama_produk: Nama produk (required)
+    - nama_produk: Nama produk (required, unique - key sinkronisasi API)
     - harga: Harga produk (numeric)
     - kategori: Foreign Key ke model Kategori
     - status: Foreign Key ke model Status
     - deskripsi: Deskripsi produk (optional)
+    - content_hash: Fingerprint nama_produk, harga, kategori, dan status
+      untuk delta sync (lihat compute_content_hash)
     """
     id_produk = models.AutoField(primary_key=True)
-    nama_produk = models.CharField(max_length=255, null=False, blank=False)
+    nama_produk = models.CharField(max_length=255, null=False, blank=False, unique=True)
     harga = models.DecimalField(max_digits=15, decimal_places=2)
     kategori = models.ForeignKey(Kategori, on_delete=models.PROTECT, related_name='products')
     status = models.ForeignKey(Status, on_delete=models.PROTECT, related_name='products')
     deskripsi = models.TextField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, default='', editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Produk"
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id_produk']
+        indexes = [
+            # Listing "bisa dijual" terbaru, dengan/tanpa filter kategori.
+            # id_produk ikut di index supaya keyset pagination (created_at, id_produk)
+            # cukup satu range scan (products/pagination.py)
+            models.Index(fields=['status', '-created_at', '-id_produk'], name='product_status_created_id_idx'),
+            models.Index(
+                fields=['status', 'kategori', '-created_at', '-id_produk'], name='product_status_kat_crtd_id_idx'
+            ),
+            # ?ordering=harga/nama_produk dan rentang min_harga/max_harga (products/filters.py):
+            # range scan + urutan langsung dari index, kedua arah
+            models.Index(fields=['status', 'harga', 'id_produk'], name='product_status_harga_id_idx'),
+            models.Index(fields=['status', 'kategori', 'harga', 'id_produk'], name='product_status_kat_harga_idx'),
+            models.Index(fields=['status', 'nama_produk', 'id_produk'], name='product_status_nama_id_idx'),
+            models.Index(fields=['status', 'kategori', 'nama_produk', 'id_produk'], name='product_status_kat_nama_idx'),
+            # Produk yang berubah sejak ProductChange.since (products/autocomplete.py)
+            models.Index(fields=['updated_at'], name='product_updated_at_idx'),
+        ]
+
+    # Field yang menentukan kelompok statistik kategori (products/signals.py)
+    STATS_FIELDS = ('kategori_id', 'status_id', 'harga')
 
     def __str__(self):
         return self.nama_produk
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Simpan nilai yang dibaca dari database di `_loaded_values` (dipakai signal pre_save)."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        # Nilai dari from_db sudah tidak berlaku; signal akan membaca ulang dari database
+        self.__dict__.pop('_loaded_values', None)
+        super().refresh_from_db(*args, **kwargs)
+
+    @staticmethod
+    def compute_content_hash(nama_produk, harga, kategori_id, status_id) -> str:
+        """
+        Hitung fingerprint SHA-256 dari field yang disinkronisasi dari API.
+
+        Format: sha256("nama_produk|harga|kategori_id|status_id") dengan harga
+        dua desimal, sama seperti representasi teks kolom DecimalField.
+        """
+        harga = Decimal(str(harga)).quantize(Decimal('0.01'))
+        raw = f"{nama_produk}|{harga}|{kategori_id}|{status_id}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def content_hash_expression(harga=None, nama_produk=None, kategori_id=None, status_id=None):
+        """
+        Ekspresi SQL PostgreSQL yang menghasilkan compute_content_hash().
+
+        Dipakai UPDATE/INSERT set-based agar content_hash tetap konsisten
+        tanpa membaca baris ke Python. Setiap kolom dapat diganti ekspresi
+        lain, mis. `harga` baru (nilai SET dievaluasi dari baris lama) atau
+        kolom tabel staging (products/importer.py).
+        """
+        harga = Cast(F('harga') if harga is None else harga, models.DecimalField(max_digits=15, decimal_places=2))
+        raw = Concat(
+            F('nama_produk') if nama_produk is None else nama_produk, Value('|'),
+            Cast(harga, TextField()), Value('|'),
+            Cast(F('kategori_id') if kategori_id is None else kategori_id, TextField()), Value('|'),
+            Cast(F('status_id') if status_id is None else status_id, TextField()),
+            output_field=TextField(),
+        )
+        digest = Func(Func(raw, Value('UTF8'), function='convert_to'), function='sha256')
+        return Func(digest, Value('hex'), function='encode', output_field=TextField())
+
+    def save(self, *args, **kwargs):
+        self.content_hash = self.compute_content_hash(
+            self.nama_produk, self.harga, self.kategori_id, self.status_id
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content_hash' not in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['content_hash']
+        super().save(*args, **kwargs)
+
+
+class SyncSnapshot(models.Model):
+    """
+    Snapshot feed terakhir yang berhasil diterapkan oleh ProductSyncEngine.
+
+    Fields:
+    - source: Identitas feed (biasanya URL API)
+    - entries: Mapping nama_produk -> content_hash dari feed tersebut
+    - product_count: Jumlah produk unik di feed
+    - feed_hash: Fingerprint seluruh feed (gabungan semua content_hash)
+    """
+    source = models.CharField(max_length=255, unique=True)
+    entries = models.JSONField(default=dict)
+    product_count = models.PositiveIntegerField(default=0)
+    feed_hash = models.CharField(max_length=64, blank=True, default='')
+    applied_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Sync Snapshot"
+
+    def __str__(self):
+        return f"{self.source} ({self.product_count} produk)"
+
+
+class ProductChange(models.Model):
+    """
+    Log perubahan produk untuk index autocomplete di proses lain
+    (products/autocomplete.py). Ditulis setelah transaksi commit; proses lain
+    membaca entry baru secara berkala dan menerapkannya secara inkremental.
+
+    Fields:
+    - since: Produk dengan updated_at >= since perlu dibaca ulang (None jika tidak ada)
+    - deleted: List id_produk yang dihapus
+    - full: Index dibangun ulang dari awal (rebuild)
+    - created_at: Waktu dicatat (setelah commit)
+    """
+    since = models.DateTimeField(blank=True, null=True)
+    deleted = models.JSONField(default=list, blank=True)
+    full = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name_plural = "Product Change"
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"ProductChange #{self.pk} ({self.created_at})"
+
+
+class PriceAdjustment(models.Model):
+    """
+    Audit penyesuaian harga massal (products/pricing.py).
+
+    Fields:
+    - operation: set, add, multiply, atau round
+    - value: Nilai operasi (harga baru, selisih, faktor, atau kelipatan pembulatan)
+    - filters: Filter produk yang dipakai (kategori, status, nama)
+    - affected: Jumlah produk yang diubah
+    - total_before/total_after: Jumlah harga produk terpilih sebelum/sesudah
+    - performed_by: User atau sumber (api, command)
+    """
+    OPERATION_SET = 'set'
+    OPERATION_ADD = 'add'
+    OPERATION_MULTIPLY = 'multiply'
+    OPERATION_ROUND = 'round'
+    OPERATION_CHOICES = [
+        (OPERATION_SET, 'Set harga'),
+        (OPERATION_ADD, 'Tambah harga'),
+        (OPERATION_MULTIPLY, 'Kalikan harga'),
+        (OPERATION_ROUND, 'Bulatkan ke kelipatan'),
+    ]
+
+    operation = models.CharField(max_length=20, choices=OPERATION_CHOICES)
+    value = models.DecimalField(max_digits=15, decimal_places=4)
+    filters = models.JSONField(default=dict)
+    affected = models.PositiveIntegerField(default=0)
+    total_before = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    total_after = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    performed_by = models.CharField(max_length=255, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = "Price Adjustment"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.operation} {self.value} ({self.affected} produk)"
+
+
+class KategoriStats(models.Model):
+    """
+    Ringkasan produk per kategori dan status (products/stats.py).
+
+    Diperbarui secara inkremental oleh signal Product dan oleh operasi massal
+    (sync, bulk API, penyesuaian harga, import), sehingga statistik kategori
+    dibaca tanpa scan tabel produk.
+
+    Fields:
+    - kategori/status: Kelompok produk
+    - product_count: Jumlah produk
+    - total_harga: Jumlah harga (rata-rata = total_harga / product_count)
+    - min_harga/max_harga: Harga terendah/tertinggi
+    """
+    kategori = models.ForeignKey(Kategori, on_delete=models.CASCADE, related_name='stats')
+    status = models.ForeignKey(Status, on_delete=models.CASCADE, related_name='kategori_stats')
+    product_count = models.PositiveIntegerField(default=0)
+    total_harga = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    min_harga = models.DecimalField(max_digits=15, decimal_places=2, blank=True, null=True)
+    max_harga = models.DecimalField(max_digits=15, decimal_places=2, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Kategori Stats"
+        constraints = [
+            models.UniqueConstraint(fields=['kategori', 'status'], name='kategori_stats_kategori_status_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.kategori_id}/{self.status_id} ({self.product_count} produk)"
+
+
+class SyncJob(models.Model):
+    """
+    Job sinkronisasi API yang dijalankan oleh worker (manage.py run_sync_worker).
+
+    Fields:
+    - catalogue: Feed yang disinkronisasi (biasanya URL API). Hanya boleh ada
+      satu job queued/running per catalogue.
+    - status: queued, running, success, atau failed
+    - username: Username API (opsional, default generate otomatis)
+    - processed/created/updated/unchanged/removed: Hasil ProductSyncEngine
+    - error: Pesan error jika job gagal
+    - worker: Identitas worker yang menjalankan job
+    - force: Abaikan validator conditional fetch dan selalu import ulang
+    - not_modified: Feed tidak berubah sejak fetch terakhir, import dilewati
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCESS = 'success'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCESS, 'Success'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    ACTIVE_STATUSES = [STATUS_QUEUED, STATUS_RUNNING]
+
+    catalogue = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    username = models.CharField(max_length=255, blank=True, null=True)
+    processed = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    unchanged = models.PositiveIntegerField(default=0)
+    removed = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default='')
+    worker = models.CharField(max_length=255, blank=True, default='')
+    force = models.BooleanField(default=False)
+    not_modified = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name_plural = "Sync Job"
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['catalogue'],
+                condition=models.Q(status__in=['queued', 'running']),
+                name='unique_active_sync_job_per_catalogue',
+            ),
+        ]
+
+    def __str__(self):
+        return f"SyncJob #{self.pk} ({self.status})"
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+
+
+class APIFetchState(models.Model):
+    """
+    Validator dari fetch API terakhir yang berhasil diimport.
+
+    Fields:
+    - url: URL API
+    - etag: Header ETag dari response terakhir
+    - last_modified: Header Last-Modified dari response terakhir
+    - body_hash: SHA-256 body response terakhir, untuk API tanpa ETag/Last-Modified
+    - username_hint: Username dari header X-Credentials-Username
+    - username_hint_date: Tanggal (zona waktu API) saat username_hint diterima
+    """
+    url = models.CharField(max_length=255, unique=True)
+    etag = models.CharField(max_length=255, blank=True, default='')
+    last_modified = models.CharField(max_length=255, blank=True, default='')
+    body_hash = models.CharField(max_length=64, blank=True, default='')
+    username_hint = models.CharField(max_length=255, blank=True, default='')
+    username_hint_date = models.DateField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "API Fetch State"
+
+    def __str__(self):
+        return self.url
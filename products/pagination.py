@@ -0,0 +1,281 @@
+"""
+Keyset (cursor/seek) pagination untuk listing produk.
+
+Halaman berikutnya diambil dengan WHERE (created_at, id_produk) < (nilai
+baris terakhir) memakai index, bukan OFFSET, sehingga halaman ke-10.000
+secepat halaman pertama dan tidak ada COUNT(*).
+"""
+
+import base64
+import binascii
+import json
+from typing import Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+DEFAULT_ORDERING = ('-created_at', '-id_produk')
+
+
+def encode_cursor(values: Sequence, reverse: bool = False) -> str:
+    """Encode nilai key baris batas (dan arah) menjadi cursor opaque."""
+    raw = [v.isoformat() if hasattr(v, 'isoformat') else str(v) for v in values]
+    payload = json.dumps({'k': raw, 'r': reverse}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int):
+    """
+    Decode cursor dari encode_cursor().
+
+    Raises:
+        ValueError: Jika cursor tidak valid
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        values, reverse = payload['k'], bool(payload.get('r'))
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('Invalid cursor')
+    return values, reverse
+
+
+def keyset_filter(ordering: Sequence[str], values: Sequence, reverse: bool = False) -> Q:
+    """
+    Kondisi "baris setelah `values`" untuk urutan `ordering`.
+
+    Untuk ('-created_at', '-id_produk') hasilnya:
+        created_at <= c AND (created_at < c OR (created_at = c AND id_produk < i))
+    Batas pertama (<=) redundan secara logika, tetapi membuat planner memakai
+    range scan pada index (status, created_at, id_produk).
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        descending = field.startswith('-') != reverse
+        step = Q(**{f"{name}__{'lt' if descending else 'gt'}": values[i]})
+        for previous, value in zip(ordering[:i], values[:i]):
+            step &= Q(**{previous.lstrip('-'): value})
+        condition |= step
+
+    first = ordering[0].lstrip('-')
+    descending = ordering[0].startswith('-') != reverse
+    return Q(**{f"{first}__{'lte' if descending else 'gte'}": values[0]}) & condition
+
+
+def flip_ordering(ordering: Sequence[str]) -> List[str]:
+    return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+
+class SeekPage:
+    """
+    Satu halaman hasil seek_page().
+
+    Attributes:
+    - object_list: Baris pada halaman ini (urutan sesuai ordering)
+    - next_cursor / previous_cursor: Cursor halaman berikut/sebelumnya atau None
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+
+def seek_page(queryset, cursor: Optional[str], size: int, ordering: Sequence[str] = DEFAULT_ORDERING) -> SeekPage:
+    """
+    Ambil satu halaman keyset dari queryset.
+
+    Args:
+        queryset: QuerySet yang sudah difilter (model atau .values(); field
+            ordering harus ikut di values)
+        cursor (str): Cursor dari halaman sebelumnya (None untuk halaman pertama)
+        size (int): Jumlah baris per halaman
+        ordering (Sequence[str]): Field urutan; field terakhir harus unik (pk)
+
+    Raises:
+        ValueError: Jika cursor tidak valid
+    """
+    queryset, reverse = _seek_queryset(queryset, cursor, size, ordering)
+    return _seek_result(list(queryset), cursor, size, ordering, reverse)
+
+
+async def aseek_page(queryset, cursor: Optional[str], size: int,
+                     ordering: Sequence[str] = DEFAULT_ORDERING) -> SeekPage:
+    """seek_page() dengan ORM async (untuk view async)."""
+    queryset, reverse = _seek_queryset(queryset, cursor, size, ordering)
+    return _seek_result([row async for row in queryset], cursor, size, ordering, reverse)
+
+
+def _seek_queryset(queryset, cursor: Optional[str], size: int, ordering: Sequence[str]):
+    reverse = False
+    if cursor:
+        values, reverse = decode_cursor(cursor, len(ordering))
+        queryset = queryset.filter(keyset_filter(ordering, values, reverse))
+    queryset = queryset.order_by(*(flip_ordering(ordering) if reverse else ordering))
+    return queryset[:size + 1], reverse
+
+
+def _seek_result(rows: List, cursor: Optional[str], size: int, ordering: Sequence[str], reverse: bool) -> SeekPage:
+    fields = [field.lstrip('-') for field in ordering]
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    if reverse:
+        rows.reverse()
+
+    def key(row):
+        if isinstance(row, dict):
+            return [row[field] for field in fields]
+        return [getattr(row, field) for field in fields]
+
+    # Arah maju: halaman berikut ada jika ada baris lebih, halaman sebelumnya
+    # ada jika datang dari cursor. Arah mundur: kebalikannya.
+    if reverse:
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, bool(cursor)
+
+    next_cursor = previous_cursor = None
+    if rows:
+        if has_next:
+            next_cursor = encode_cursor(key(rows[-1]))
+        if has_previous:
+            previous_cursor = encode_cursor(key(rows[0]), reverse=True)
+
+    return SeekPage(rows, next_cursor, previous_cursor)
+
+
+def estimate_count(queryset) -> int:
+    """
+    Perkiraan jumlah baris tanpa COUNT(*) penuh.
+
+    PostgreSQL: estimasi planner dari EXPLAIN (FORMAT JSON). Backend lain
+    (SQLite untuk development) memakai COUNT(*) biasa.
+    """
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination DRF di atas seek_page().
+
+    Opt-in: hanya aktif jika request membawa `cursor`, `page_size`, atau
+    `limit`; tanpa parameter itu response tetap list penuh seperti sebelumnya.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_params = ('page_size', 'limit')
+    ordering = DEFAULT_ORDERING
+
+    def __init__(self):
+        self.default_page_size = getattr(settings, 'PRODUCT_API_PAGE_SIZE', 10)
+        self.max_page_size = getattr(settings, 'PRODUCT_API_MAX_PAGE_SIZE', 100)
+        self.page = None
+        self.request = None
+
+    def is_requested(self, request) -> bool:
+        params = request.GET
+        return self.cursor_query_param in params or any(p in params for p in self.page_size_query_params)
+
+    def get_page_size(self, request) -> int:
+        for param in self.page_size_query_params:
+            value = request.GET.get(param)
+            if value:
+                try:
+                    size = int(value)
+                except ValueError:
+                    continue
+                if size > 0:
+                    return min(size, self.max_page_size)
+        return self.default_page_size
+
+    def get_ordering(self, request, queryset, view=None) -> Sequence[str]:
+        """Ordering keyset; view bisa menggantinya lewat atribut `keyset_ordering`."""
+        return getattr(view, 'keyset_ordering', None) or self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        try:
+            self.page = seek_page(
+                queryset,
+                request.query_params.get(self.cursor_query_param),
+                self.get_page_size(request),
+                self.get_ordering(request, queryset, view),
+            )
+        except ValueError:
+            raise NotFound('Invalid cursor')
+        return self.page.object_list
+
+    async def apaginate_queryset(self, queryset, request, ordering: Sequence[str] = None):
+        """paginate_queryset() dengan ORM async; ordering default DEFAULT_ORDERING."""
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        try:
+            self.page = await aseek_page(
+                queryset,
+                request.GET.get(self.cursor_query_param),
+                self.get_page_size(request),
+                ordering or self.ordering,
+            )
+        except ValueError:
+            raise NotFound('Invalid cursor')
+        return self.page.object_list
+
+    def _link(self, cursor: Optional[str]) -> Optional[str]:
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_data(self, data) -> Dict:
+        return {
+            'next': self._link(self.page.next_cursor),
+            'previous': self._link(self.page.previous_cursor),
+            'results': data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
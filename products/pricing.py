@@ -0,0 +1,218 @@
+"""
+Penyesuaian harga massal di sisi database.
+
+Satu statement UPDATE untuk semua produk yang cocok dengan filter:
+- set: harga = nilai
+- add: harga = harga + nilai
+- multiply: harga = ROUND(harga * nilai, 2)
+- round: harga = ROUND(harga / nilai) * nilai (kelipatan terdekat)
+
+updated_at ikut di-set; content_hash dihitung ulang di SQL pada PostgreSQL
+(Product.content_hash_expression), di backend lain dikosongkan sehingga sync
+berikutnya menulis ulang baris tersebut. Setiap penerapan dicatat di
+PriceAdjustment dan statistik kategori yang terkena dihitung ulang
+(products/stats.py). preview() menampilkan jumlah, total, dan contoh harga baru
+tanpa mengubah data.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Max, Min, Sum, Value
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from . import invalidation, lookups, stats
+from .models import MAX_HARGA, PriceAdjustment, Product
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_SAMPLE_SIZE = 20
+
+
+class PriceAdjustmentError(Exception):
+    """Filter/operasi tidak valid atau hasil harga di luar batas."""
+
+
+@dataclass
+class PricePreview:
+    """
+    Ringkasan efek penyesuaian harga.
+
+    Fields:
+    - affected: Jumlah produk yang cocok dengan filter
+    - total_before/total_after: Jumlah harga sebelum/sesudah
+    - min_after/max_after: Harga baru terendah/tertinggi
+    - sample: Contoh {'id_produk', 'nama_produk', 'harga', 'harga_baru'}
+    """
+    affected: int = 0
+    total_before: Decimal = Decimal('0')
+    total_after: Decimal = Decimal('0')
+    min_after: Optional[Decimal] = None
+    max_after: Optional[Decimal] = None
+    sample: List[Dict] = field(default_factory=list)
+
+    def as_dict(self) -> Dict:
+        """Untuk response API; nilai uang sebagai string seperti DecimalField serializer."""
+        def money(value):
+            return None if value is None else str(value)
+
+        return {
+            'affected': self.affected,
+            'total_before': money(self.total_before),
+            'total_after': money(self.total_after),
+            'min_after': money(self.min_after),
+            'max_after': money(self.max_after),
+            'sample': [{**row, 'harga': money(row['harga']), 'harga_baru': money(row['harga_baru'])}
+                       for row in self.sample],
+        }
+
+
+def price_expression(operation: str, value: Decimal):
+    """
+    Ekspresi harga baru untuk `operation`.
+
+    Raises:
+        PriceAdjustmentError: Jika operasi tidak dikenal atau nilai tidak valid
+    """
+    value = Decimal(value)
+    output = DecimalField(max_digits=15, decimal_places=2)
+
+    if operation == PriceAdjustment.OPERATION_SET:
+        if value <= 0:
+            raise PriceAdjustmentError('Harga baru harus lebih besar dari 0.')
+        expression = Value(value)
+    elif operation == PriceAdjustment.OPERATION_ADD:
+        expression = F('harga') + Value(value)
+    elif operation == PriceAdjustment.OPERATION_MULTIPLY:
+        if value <= 0:
+            raise PriceAdjustmentError('Faktor pengali harus lebih besar dari 0.')
+        expression = Round(F('harga') * Value(value), 2)
+    elif operation == PriceAdjustment.OPERATION_ROUND:
+        if value <= 0:
+            raise PriceAdjustmentError('Kelipatan pembulatan harus lebih besar dari 0.')
+        expression = Round(F('harga') / Value(value)) * Value(value)
+    else:
+        raise PriceAdjustmentError(f'Operasi tidak dikenal: {operation}')
+
+    return ExpressionWrapper(expression, output_field=output)
+
+
+FILTER_FIELDS = ('kategori', 'kategori_id', 'status', 'status_id', 'nama')
+
+
+def filter_products(kategori=None, status=None, nama: str = None, all_products: bool = False,
+                    kategori_id: int = None, status_id: int = None):
+    """
+    Queryset produk sesuai filter. kategori_id/status_id berupa id,
+    kategori/status berupa nama (aturan lookups.is_reference_id, sama dengan
+    bulk API), nama dicocokkan case-insensitive (mengandung).
+
+    Raises:
+        PriceAdjustmentError: Jika tidak ada filter dan all_products=False
+    """
+    if not any((kategori, kategori_id, status, status_id, nama)) and not all_products:
+        raise PriceAdjustmentError('Berikan minimal satu filter (kategori, status, nama) atau pilih semua produk.')
+
+    queryset = Product.objects.all()
+    for field_name, name_field, value in (
+        ('kategori', 'nama_kategori', kategori), ('kategori', 'nama_kategori', kategori_id),
+        ('status', 'nama_status', status), ('status', 'nama_status', status_id),
+    ):
+        if value:
+            queryset = queryset.filter(lookups.reference_q(field_name, name_field, value))
+    if nama:
+        queryset = queryset.filter(nama_produk__icontains=nama)
+    return queryset.order_by()
+
+
+def preview(queryset, operation: str, value: Decimal) -> PricePreview:
+    """Efek penyesuaian tanpa mengubah data (satu query agregat + satu query contoh)."""
+    new_price = price_expression(operation, value)
+    annotated = queryset.annotate(harga_baru=new_price)
+    stats = annotated.aggregate(
+        affected=Count('pk'),
+        total_before=Sum('harga'),
+        total_after=Sum('harga_baru'),
+        min_after=Min('harga_baru'),
+        max_after=Max('harga_baru'),
+    )
+    sample = list(
+        annotated.order_by('id_produk').values('id_produk', 'nama_produk', 'harga', 'harga_baru')[:PREVIEW_SAMPLE_SIZE]
+    )
+    return PricePreview(
+        affected=stats['affected'],
+        total_before=_money(stats['total_before']),
+        total_after=_money(stats['total_after']),
+        min_after=_money(stats['min_after']) if stats['min_after'] is not None else None,
+        max_after=_money(stats['max_after']) if stats['max_after'] is not None else None,
+        sample=[{**row, 'harga': _money(row['harga']), 'harga_baru': _money(row['harga_baru'])} for row in sample],
+    )
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal('0.01'))
+
+
+def apply(queryset, operation: str, value: Decimal, filters: Dict = None, performed_by: str = '') -> PriceAdjustment:
+    """
+    Terapkan penyesuaian harga dalam satu UPDATE dan catat audit-nya.
+
+    Args:
+        queryset: Produk yang diubah (hasil filter_products)
+        operation (str): set, add, multiply, atau round
+        value (Decimal): Nilai operasi
+        filters (Dict): Filter asal, disimpan di audit
+        performed_by (str): User/sumber perubahan
+
+    Returns:
+        PriceAdjustment: Baris audit
+
+    Raises:
+        PriceAdjustmentError: Jika harga baru akan <= 0 atau melebihi kolom harga,
+            termasuk jika produk berubah bersamaan di antara preview dan UPDATE
+    """
+    new_price = price_expression(operation, value)
+
+    with transaction.atomic():
+        summary = preview(queryset, operation, value)
+        if summary.affected and summary.min_after <= 0:
+            raise PriceAdjustmentError(f'Harga baru terendah {summary.min_after} tidak valid (harus > 0).')
+        if summary.affected and summary.max_after > MAX_HARGA:
+            raise PriceAdjustmentError(f'Harga baru tertinggi {summary.max_after} melebihi batas kolom harga.')
+
+        if connection.vendor == 'postgresql':
+            content_hash = Product.content_hash_expression(new_price)
+        else:
+            content_hash = Value('')
+
+        kategori_ids = set(queryset.values_list('kategori_id', flat=True).distinct())
+        # Batas harga juga dicek di WHERE: baris yang berubah setelah preview
+        # tidak bisa lolos keluar batas
+        affected = queryset.alias(harga_baru=new_price).filter(
+            harga_baru__gt=0, harga_baru__lte=MAX_HARGA
+        ).update(harga=new_price, content_hash=content_hash, updated_at=timezone.now())
+        if affected != summary.affected:
+            raise PriceAdjustmentError(
+                f'Produk berubah selama penyesuaian ({affected} dari {summary.affected} dapat diubah), coba lagi.'
+            )
+        audit = PriceAdjustment.objects.create(
+            operation=operation,
+            value=value,
+            filters=filters or {},
+            affected=affected,
+            total_before=summary.total_before,
+            total_after=summary.total_after,
+            performed_by=performed_by,
+        )
+
+        if affected:
+            stats.touch(kategori_ids)
+            # Nama dan status tidak berubah: index autocomplete tidak perlu disentuh
+            invalidation.responses_changed()
+
+    logger.info(f"Penyesuaian harga {operation} {value}: {affected} produk diubah (audit #{audit.pk})")
+    return audit
@@ -0,0 +1,88 @@
+"""
+Renderer JSON untuk API produk.
+
+FastJSONRenderer menghasilkan byte yang sama dengan JSONRenderer DRF
+(compact, UTF-8, \\u2028/\\u2029 di-escape) tetapi memakai orjson jika
+terpasang. Tanpa orjson, atau untuk output ber-indent (browsable API,
+`Accept: application/json; indent=4`), renderer DRF biasa yang dipakai.
+"""
+
+import re
+
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson opsional
+    orjson = None
+
+# orjson menulis float eksponen sebagai 1e-7/1e20, json stdlib 1e-07/1e+20.
+# Jika output memuat digit + 'e' + digit/'-' (float eksponen, atau kebetulan
+# di dalam string), render ulang dengan json stdlib. Pola diawali literal 'e'
+# supaya scan cepat; digit sebelumnya dicek terpisah.
+EXPONENT_RE = re.compile(rb'e[-0-9]')
+
+
+def has_exponent(ret: bytes) -> bool:
+    return any(ret[m.start() - 1:m.start()].isdigit() for m in EXPONENT_RE.finditer(ret))
+
+# datetime/dataclass diteruskan ke encoder DRF supaya formatnya sama
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer dengan orjson untuk output compact."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except (orjson.JSONEncodeError, TypeError, ValueError):
+            # Mis. integer > 64 bit atau key dict bukan string: biarkan json stdlib
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if has_exponent(ret):
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+def json_response(data, status: int = 200) -> HttpResponse:
+    """
+    Response JSON dengan byte yang sama seperti FastJSONRenderer di view DRF,
+    untuk view di luar DRF (products/async_views.py). `data` disimpan di
+    atribut response seperti Response DRF.
+    """
+    response = HttpResponse(FastJSONRenderer().render(data), content_type='application/json', status=status)
+    response.data = data
+    return response
+
+
+class NDJSONRenderer(FastJSONRenderer):
+    """
+    Media type NDJSON untuk content negotiation (?format=ndjson).
+
+    Body export dibuat products/export.py (StreamingHttpResponse); renderer
+    ini hanya menulis response error sebagai satu baris JSON.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class CSVRenderer(FastJSONRenderer):
+    """Media type CSV untuk content negotiation (?format=csv); lihat NDJSONRenderer."""
+    media_type = 'text/csv'
+    format = 'csv'
@@ -0,0 +1,252 @@
+"""
+Cache response untuk endpoint API read-only (list produk, by_kategori,
+kategori, status).
+
+- Key: generation + endpoint + query parameter yang dinormalisasi (urut,
+  parameter kosong dibuang) + host + format renderer.
+- Backend: alias Django cache dari PRODUCT_API_CACHE['ALIAS'] (locmem, file,
+  Redis, atau products.cache_backends.InMemoryRedisCache). Generation counter
+  harus berada di cache bersama (file/Redis) jika penulisan terjadi di proses
+  lain, mis. worker sync; lihat products/checks.py.
+- Invalidasi: invalidate() menaikkan generation counter di cache tersebut;
+  entry lama tidak pernah dibaca lagi dan kedaluwarsa sendiri. Dipanggil
+  signal Product/Kategori/Status dan operasi massal (products/invalidation.py).
+- ETag: validator endpoint jika ada (lihat products/conditional.py; dicek
+  sebelum cache sehingga 304 tidak perlu membaca cache), selain itu hash data
+  response. Request dengan If-None-Match yang cocok mendapat 304 tanpa body.
+
+Response yang dihitung di dalam transaksi (connection.in_atomic_block) tidak
+disimpan, karena bisa memuat data yang belum commit.
+"""
+
+import hashlib
+import json
+import logging
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from rest_framework import status
+from rest_framework.response import Response
+
+from . import conditional
+from .cache_backends import InMemoryRedisCache
+from .renderers import json_response
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'products:api:generation'
+
+DEFAULT_CACHE_SETTINGS = {
+    'ENABLED': True,
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+}
+
+
+def cache_setting(name: str):
+    """Ambil nilai PRODUCT_API_CACHE[name] dengan fallback ke default."""
+    return getattr(settings, 'PRODUCT_API_CACHE', {}).get(name, DEFAULT_CACHE_SETTINGS[name])
+
+
+def get_cache():
+    return caches[cache_setting('ALIAS')]
+
+
+def is_process_local(cache=None) -> bool:
+    """
+    True jika backend cache API hanya hidup di memori proses ini (locmem atau
+    stand-in InMemoryRedisCache). Generation counter di backend seperti ini
+    tidak terlihat proses lain: invalidasi dari worker sync tidak sampai ke
+    proses web.
+    """
+    return isinstance(cache or get_cache(), (LocMemCache, InMemoryRedisCache))
+
+
+def generation() -> int:
+    """Generation counter saat ini (dibuat jika belum ada)."""
+    cache = get_cache()
+    value = cache.get(GENERATION_KEY)
+    if value is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        value = cache.get(GENERATION_KEY, 1)
+    return value
+
+
+async def ageneration() -> int:
+    """generation() untuk view async."""
+    cache = get_cache()
+    value = await cache.aget(GENERATION_KEY)
+    if value is None:
+        await cache.aadd(GENERATION_KEY, 1, timeout=None)
+        value = await cache.aget(GENERATION_KEY, 1)
+    return value
+
+
+def invalidate():
+    """Buang semua response tersimpan (naikkan generation counter)."""
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, timeout=None)
+
+
+def normalize_params(query_params) -> str:
+    """Query string kanonik: key dan value diurutkan, value kosong dibuang."""
+    items = sorted(
+        (key, value)
+        for key in query_params
+        for value in query_params.getlist(key)
+        if value != ''
+    )
+    return urlencode(items)
+
+
+def cache_key(request, namespace: str) -> str:
+    renderer = getattr(request, 'accepted_renderer', None)
+    return _key(request, getattr(renderer, 'format', ''), namespace, generation())
+
+
+def _key(request, renderer_format: str, namespace: str, current_generation: int) -> str:
+    raw = '|'.join([
+        request.get_host(),
+        renderer_format,
+        normalize_params(request.GET),
+    ])
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f'products:api:{current_generation}:{namespace}:{digest}'
+
+
+def compute_etag(data) -> str:
+    """ETag kuat dari isi data response."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(',', ':'))
+    return f'"{hashlib.sha1(payload.encode()).hexdigest()}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True jika If-None-Match request memuat `etag` (atau '*')."""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    response['ETag'] = etag
+    return response
+
+
+def cached_response(namespace: str = None, validators=None):
+    """
+    Decorator method ViewSet GET: simpan data response di cache API.
+
+    Args:
+        namespace (str): Nama endpoint di key cache. Default basename:action.
+        validators: Callable(view, request) -> (etag, last_modified). Jika
+            diberikan, request bersyarat dijawab 304 sebelum membaca cache.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method != 'GET':
+                return method(self, request, *args, **kwargs)
+
+            if validators is not None and conditional.has_conditional_headers(request):
+                etag, last_modified = validators(self, request)
+                response = conditional.conditional_response(request, etag, last_modified)
+                if response is not None:
+                    return response
+
+            enabled = cache_setting('ENABLED')
+            cache = get_cache()
+            key = cache_key(request, namespace or f'{self.basename}:{self.action}')
+            entry = cache.get(key) if enabled else None
+
+            if entry is not None:
+                etag, last_modified, data = entry
+                response = Response(data)
+                response['X-Cache'] = 'HIT'
+            else:
+                response = method(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                if validators is not None:
+                    etag, last_modified = validators(self, request)
+                else:
+                    etag, last_modified = compute_etag(response.data), None
+                if enabled and not connection.in_atomic_block:
+                    cache.set(key, (etag, last_modified, response.data), cache_setting('TIMEOUT'))
+                response['X-Cache'] = 'MISS'
+
+            if validators is None and etag_matches(request, etag):
+                response = not_modified(etag)
+            conditional.set_validators(response, etag, last_modified)
+            patch_vary_headers(response, ['Accept'])
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def acached_response(namespace: str, validators=None):
+    """
+    Versi cached_response() untuk view async (products/async_views.py).
+
+    Key dan isi entry sama dengan view DRF (renderer JSON), sehingga proses
+    WSGI dan ASGI memakai entry cache yang sama. View harus mengembalikan
+    response dengan atribut `data` (renderers.json_response).
+
+    Args:
+        namespace (str): Nama endpoint di key cache, sama dengan basename:action DRF
+        validators: Coroutine function(request) -> (etag, last_modified)
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if validators is not None and conditional.has_conditional_headers(request):
+                etag, last_modified = await validators(request)
+                response = conditional.conditional_response(request, etag, last_modified)
+                if response is not None:
+                    return response
+
+            enabled = cache_setting('ENABLED')
+            cache = get_cache()
+            key = _key(request, 'json', namespace, await ageneration())
+            entry = await cache.aget(key) if enabled else None
+
+            if entry is not None:
+                etag, last_modified, data = entry
+                response = json_response(data)
+                response['X-Cache'] = 'HIT'
+            else:
+                response = await view(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                if validators is not None:
+                    etag, last_modified = await validators(request)
+                else:
+                    etag, last_modified = compute_etag(response.data), None
+                if enabled and not connection.in_atomic_block:
+                    await cache.aset(key, (etag, last_modified, response.data), cache_setting('TIMEOUT'))
+                response['X-Cache'] = 'MISS'
+
+            if validators is None and etag_matches(request, etag):
+                response = HttpResponseNotModified()
+                response['ETag'] = etag
+            conditional.set_validators(response, etag, last_modified)
+            patch_vary_headers(response, ['Accept'])
+            return response
+
+        return wrapper
+
+    return decorator
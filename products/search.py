@@ -0,0 +1,319 @@
+"""
+Full-text search produk (nama_produk + deskripsi) dengan backend pluggable.
+
+Backend dipilih lewat PRODUCT_SEARCH_BACKEND:
+- 'auto' (default): sesuai vendor database
+- 'postgres': kolom tsvector `search_vector` yang diisi trigger saat
+  INSERT/UPDATE (termasuk bulk_create/bulk_update sync), GIN index,
+  ranking ts_rank + similarity pg_trgm (toleran typo), highlight ts_headline
+- 'sqlite': tabel virtual FTS5 (external content) yang dijaga trigger,
+  ranking bm25, highlight(); untuk development dan test
+- 'simple': icontains tanpa index, untuk backend lain
+- atau dotted path ke subclass SearchBackend
+
+Semua backend mengembalikan queryset dengan anotasi `search_rank` (makin
+besar makin relevan) dan `search_highlight` (teks dengan penanda
+MARK_START/MARK_END), urut relevansi. Gunakan attach_highlights() untuk
+mengubah penanda menjadi HTML <mark> yang sudah di-escape.
+"""
+
+import re
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, Case, F, FloatField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from django.utils.module_loading import import_string
+from django.utils.safestring import SafeString, mark_safe
+
+from .models import Product
+
+# Urutan hasil pencarian; field terakhir unik sehingga bisa dipakai keyset pagination
+SEARCH_ORDERING = ('-search_rank', '-id_produk')
+
+# Penanda highlight dari database (karakter kontrol, tidak muncul di data normal)
+MARK_START = '\x02'
+MARK_END = '\x03'
+
+TABLE = Product._meta.db_table
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def terms(query: str) -> List[str]:
+    """Kata-kata pencarian (huruf/angka) dari input user."""
+    return TERM_RE.findall(query.lower())
+
+
+class SearchBackend:
+    """Interface backend pencarian."""
+
+    name = 'base'
+
+    def install(self, conn):
+        """Buat struktur pendukung (idempotent). Dipanggil migration & post_migrate."""
+
+    def uninstall(self, conn):
+        """Hapus struktur pendukung (reverse migration)."""
+
+    def search(self, queryset, query: str):
+        """
+        Filter queryset dengan query dan urutkan berdasarkan relevansi.
+
+        Returns:
+            QuerySet: Dengan anotasi search_rank dan search_highlight
+        """
+        raise NotImplementedError
+
+
+class SimpleSearchBackend(SearchBackend):
+    """icontains pada nama_produk/deskripsi; nama yang cocok diurutkan lebih dulu."""
+
+    name = 'simple'
+
+    def search(self, queryset, query):
+        query = query.strip()
+        return queryset.filter(
+            Q(nama_produk__icontains=query) | Q(deskripsi__icontains=query)
+        ).annotate(
+            search_rank=Case(
+                When(nama_produk__icontains=query, then=Value(1.0)),
+                default=Value(0.5),
+                output_field=FloatField(),
+            ),
+            search_highlight=F('nama_produk'),
+        ).order_by(*SEARCH_ORDERING)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector + GIN index, ditambah trigram similarity untuk salah ketik."""
+
+    name = 'postgres'
+    config = 'simple'
+
+    def install(self, conn):
+        document = (
+            f"setweight(to_tsvector('{self.config}', coalesce(NEW.nama_produk, '')), 'A') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(NEW.deskripsi, '')), 'B')"
+        )
+        with conn.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            cursor.execute(f'ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector')
+            cursor.execute(f"""
+                CREATE OR REPLACE FUNCTION {TABLE}_search_vector_update() RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector := {document};
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql
+            """)
+            cursor.execute(f'DROP TRIGGER IF EXISTS {TABLE}_search_vector_trigger ON {TABLE}')
+            cursor.execute(f"""
+                CREATE TRIGGER {TABLE}_search_vector_trigger
+                BEFORE INSERT OR UPDATE OF nama_produk, deskripsi ON {TABLE}
+                FOR EACH ROW EXECUTE FUNCTION {TABLE}_search_vector_update()
+            """)
+            cursor.execute(f"""
+                UPDATE {TABLE} SET search_vector = {document.replace('NEW.', '')}
+                WHERE search_vector IS NULL
+            """)
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS product_search_vector_idx ON {TABLE} USING gin (search_vector)'
+            )
+
+    def uninstall(self, conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {TABLE}_search_vector_trigger ON {TABLE}')
+            cursor.execute(f'DROP FUNCTION IF EXISTS {TABLE}_search_vector_update()')
+            cursor.execute('DROP INDEX IF EXISTS product_search_vector_idx')
+            cursor.execute(f'ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector')
+
+    @staticmethod
+    def tsquery(words: List[str]) -> str:
+        """Semua kata harus ada, kata terakhir sebagai prefix (ketik-sambil-cari)."""
+        return ' & '.join(words[:-1] + [f'{words[-1]}:*'])
+
+    def search(self, queryset, query):
+        words = terms(query)
+        if not words:
+            return SimpleSearchBackend().search(queryset, query)
+
+        tsquery = self.tsquery(words)
+        query = ' '.join(words)
+        ts = f"to_tsquery('{self.config}', %s)"
+
+        return queryset.filter(
+            RawSQL(
+                f'({TABLE}.search_vector @@ {ts} OR {TABLE}.nama_produk %% %s)',
+                (tsquery, query),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'ts_rank({TABLE}.search_vector, {ts}) + similarity({TABLE}.nama_produk, %s)',
+                (tsquery, query),
+                output_field=FloatField(),
+            ),
+            search_highlight=RawSQL(
+                f"ts_headline('{self.config}', {TABLE}.nama_produk, {ts}, %s)",
+                (tsquery, f'StartSel={MARK_START}, StopSel={MARK_END}, HighlightAll=true'),
+            ),
+        ).order_by(*SEARCH_ORDERING)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """FTS5 external-content table yang disinkronkan trigger."""
+
+    name = 'sqlite'
+    fts_table = f'{TABLE}_fts'
+
+    def _triggers(self):
+        fts = self.fts_table
+        insert = f"INSERT INTO {fts}(rowid, nama_produk, deskripsi) VALUES (new.id_produk, new.nama_produk, new.deskripsi);"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, nama_produk, deskripsi) "
+            f"VALUES ('delete', old.id_produk, old.nama_produk, old.deskripsi);"
+        )
+        return {
+            f'{fts}_ai': f'AFTER INSERT ON {TABLE} BEGIN {insert} END',
+            f'{fts}_ad': f'AFTER DELETE ON {TABLE} BEGIN {delete} END',
+            f'{fts}_au': f'AFTER UPDATE OF nama_produk, deskripsi ON {TABLE} BEGIN {delete} {insert} END',
+        }
+
+    def install(self, conn):
+        triggers = self._triggers()
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5("
+                f"nama_produk, deskripsi, content='{TABLE}', content_rowid='id_produk', "
+                f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s", [TABLE]
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = [name for name in triggers if name not in existing]
+            for name in missing:
+                cursor.execute(f'CREATE TRIGGER {name} {triggers[name]}')
+            # Trigger hilang (tabel baru dibuat / di-remake migration SQLite): bangun ulang index
+            if missing:
+                cursor.execute(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')")
+
+    def uninstall(self, conn):
+        with conn.cursor() as cursor:
+            for name in self._triggers():
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(f'DROP TABLE IF EXISTS {self.fts_table}')
+
+    @staticmethod
+    def match_query(words: List[str]) -> str:
+        """Semua kata harus ada, kata terakhir sebagai prefix."""
+        return ' '.join([f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*'])
+
+    def search(self, queryset, query):
+        words = terms(query)
+        if not words:
+            return SimpleSearchBackend().search(queryset, query)
+
+        match = self.match_query(words)
+        fts = self.fts_table
+        # bm25: kolom nama_produk berbobot 10x deskripsi; nilai lebih kecil = lebih relevan
+        subquery = (
+            f'SELECT {{expr}} FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = {TABLE}.id_produk'
+        )
+
+        return queryset.filter(
+            RawSQL(
+                f'{TABLE}.id_produk IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)',
+                (match,),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                subquery.format(expr=f'-bm25({fts}, 10.0, 1.0)'), (match,), output_field=FloatField()
+            ),
+            search_highlight=RawSQL(
+                subquery.format(expr=f"highlight({fts}, 0, '{MARK_START}', '{MARK_END}')"), (match,)
+            ),
+        ).order_by(*SEARCH_ORDERING)
+
+
+BACKENDS = {
+    'simple': SimpleSearchBackend,
+    'postgres': PostgresSearchBackend,
+    'sqlite': SQLiteSearchBackend,
+}
+
+VENDOR_BACKENDS = {
+    'postgresql': 'postgres',
+    'sqlite': 'sqlite',
+}
+
+
+def get_backend(conn=None) -> SearchBackend:
+    """Backend sesuai PRODUCT_SEARCH_BACKEND (atau vendor database untuk 'auto')."""
+    conn = conn or connection
+    name = getattr(settings, 'PRODUCT_SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = VENDOR_BACKENDS.get(conn.vendor, 'simple')
+    if '.' in name:
+        return import_string(name)()
+    return BACKENDS[name]()
+
+
+def search(queryset, query: str):
+    """Pencarian full-text dengan backend aktif, urut relevansi."""
+    return get_backend().search(queryset, query)
+
+
+def install(conn=None):
+    """Pasang struktur pencarian untuk backend vendor `conn` (idempotent)."""
+    conn = conn or connection
+    name = VENDOR_BACKENDS.get(conn.vendor)
+    if name:
+        BACKENDS[name]().install(conn)
+
+
+def ensure_installed(sender, using='default', **kwargs):
+    """
+    Handler post_migrate.
+
+    Di SQLite, migration yang mengubah tabel produk membuat ulang tabelnya dan
+    ikut menghapus trigger FTS; handler ini memasangnya kembali.
+    """
+    from django.db import connections
+
+    conn = connections[using]
+    if conn.vendor == 'sqlite' and TABLE in conn.introspection.table_names():
+        install(conn)
+
+
+def highlight(text: str, words: Iterable[str] = ()) -> SafeString:
+    """
+    HTML aman dengan <mark> di sekitar kata yang cocok.
+
+    Jika teks membawa penanda dari database, penanda tersebut yang dipakai;
+    jika tidak, kata-kata `words` ditandai secara case-insensitive.
+    """
+    text = text or ''
+    if MARK_START in text:
+        html = escape(text).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+        return mark_safe(html)
+
+    html = escape(text)
+    words = [w for w in words if w]
+    if words:
+        pattern = re.compile('|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)), re.IGNORECASE)
+        html = pattern.sub(lambda m: f'<mark>{m.group(0)}</mark>', html)
+    return mark_safe(html)
+
+
+def attach_highlights(products: Iterable, query: str) -> List:
+    """Set `product.highlight` (HTML aman) untuk hasil search()."""
+    words = terms(query)
+    products = list(products)
+    for product in products:
+        source = getattr(product, 'search_highlight', None) or product.nama_produk
+        product.highlight = highlight(source, words)
+    return products
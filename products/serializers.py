@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import Product, Kategori, Status
+from .models import Product, Kategori, Status, SyncJob, PriceAdjustment
+from . import pricing
 
 
 class KategoriSerializer(serializers.ModelSerializer):
@@ -13,6 +14,36 @@ class KategoriSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
+class KategoriStatusStatsSerializer(serializers.Serializer):
+    """Statistik produk satu kategori untuk satu status."""
+    id_status = serializers.IntegerField()
+    nama_status = serializers.CharField()
+    product_count = serializers.IntegerField()
+    min_harga = serializers.DecimalField(max_digits=15, decimal_places=2, allow_null=True)
+    max_harga = serializers.DecimalField(max_digits=15, decimal_places=2, allow_null=True)
+    avg_harga = serializers.DecimalField(max_digits=15, decimal_places=2, allow_null=True)
+
+
+class KategoriStatsSerializer(KategoriSerializer):
+    """
+    KategoriSerializer + statistik produk dari tabel ringkasan KategoriStats.
+    Instance harus sudah diproses products.stats.attach().
+
+    Dipisah dari KategoriSerializer supaya kategori_detail di response produk
+    dan cache lookup tidak ikut berubah setiap harga produk berubah.
+    """
+    product_count = serializers.IntegerField(read_only=True)
+    min_harga = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True, allow_null=True)
+    max_harga = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True, allow_null=True)
+    avg_harga = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True, allow_null=True)
+    per_status = KategoriStatusStatsSerializer(source='status_breakdown', many=True, read_only=True)
+
+    class Meta(KategoriSerializer.Meta):
+        fields = KategoriSerializer.Meta.fields + [
+            'product_count', 'min_harga', 'max_harga', 'avg_harga', 'per_status'
+        ]
+
+
 class StatusSerializer(serializers.ModelSerializer):
     """
     Serializer untuk model Status.
@@ -32,6 +63,7 @@ class ProductSerializer(serializers.ModelSerializer):
     Includes:
     - Nested serializers untuk kategori dan status
     - Validasi untuk nama_produk (required) dan harga (numeric)
+    - search_rank dan highlight, hanya untuk hasil pencarian (?search=)
     """
     kategori_detail = KategoriSerializer(source='kategori', read_only=True)
     status_detail = StatusSerializer(source='status', read_only=True)
@@ -52,6 +84,13 @@ class ProductSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if hasattr(instance, 'highlight'):
+            data['search_rank'] = instance.search_rank
+            data['highlight'] = str(instance.highlight)
+        return data
+
     def validate_nama_produk(self, value):
         """Validasi bahwa nama_produk tidak kosong."""
         if not value or not value.strip():
@@ -95,3 +134,74 @@ class ProductCreateUpdateSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("Harga harus lebih besar dari 0.")
         return value
+
+
+class PriceAdjustmentRequestSerializer(serializers.Serializer):
+    """
+    Input penyesuaian harga massal (products/pricing.py).
+    kategori_id/status_id berupa id, kategori/status berupa nama;
+    minimal satu filter kecuali all=true.
+    """
+    operation = serializers.ChoiceField(choices=PriceAdjustment.OPERATION_CHOICES)
+    value = serializers.DecimalField(max_digits=15, decimal_places=4)
+    kategori = serializers.CharField(required=False, allow_blank=True)
+    kategori_id = serializers.IntegerField(required=False, min_value=1)
+    status = serializers.CharField(required=False, allow_blank=True)
+    status_id = serializers.IntegerField(required=False, min_value=1)
+    nama = serializers.CharField(required=False, allow_blank=True)
+    all = serializers.BooleanField(required=False, default=False)
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if not any(attrs.get(name) for name in pricing.FILTER_FIELDS) and not attrs['all']:
+            raise serializers.ValidationError(
+                "Berikan minimal satu filter (kategori, kategori_id, status, status_id, nama) atau all=true."
+            )
+        return attrs
+
+
+class PriceAdjustmentSerializer(serializers.ModelSerializer):
+    """Serializer audit PriceAdjustment."""
+
+    class Meta:
+        model = PriceAdjustment
+        fields = [
+            'id',
+            'operation',
+            'value',
+            'filters',
+            'affected',
+            'total_before',
+            'total_after',
+            'performed_by',
+            'created_at',
+        ]
+        read_only_fields = fields
+
+
+class SyncJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer untuk status SyncJob.
+    Field progress berisi hitungan terbaru, termasuk saat job masih berjalan.
+    """
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SyncJob
+        fields = [
+            'id',
+            'catalogue',
+            'status',
+            'not_modified',
+            'progress',
+            'error',
+            'worker',
+            'created_at',
+            'started_at',
+            'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        from .jobs import get_progress
+        return get_progress(obj)
@@ -4,16 +4,340 @@ Service untuk mengambil data produk dari API eksternal Fast Print.
 API URL: https://recruitment.fastprint.co.id/tes/api_tes_programmer
 Authentication: Basic Auth
 Password format: md5(bisacoding-DD-MM-YY)
+
+HTTP client memakai satu requests.Session per proses (keep-alive + connection
+pool) dengan retry exponential backoff untuk timeout, connection error, dan 5xx.
+Konfigurasi di settings.FASTPRINT_API. FASTPRINT_API['TRANSPORT'] = 'record' /
+'replay' merekam atau memutar ulang response dari file fixture (products/transports.py).
 """
 
 import requests
+import base64
 import hashlib
-from datetime import datetime
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from .streaming import iter_json_array
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_API_SETTINGS = {
+    'URL': 'https://recruitment.fastprint.co.id/tes/api_tes_programmer',
+    'CONNECT_TIMEOUT': 3.05,
+    'READ_TIMEOUT': 10,
+    'POOL_CONNECTIONS': 1,
+    'POOL_MAXSIZE': 10,
+    'MAX_RETRIES': 3,
+    'BACKOFF_FACTOR': 0.5,
+    'BACKOFF_MAX': 10,
+    'VERIFY_SSL': True,
+    'TIME_ZONE': 'Asia/Jakarta',
+    'TRANSPORT': 'live',
+    'FIXTURE': 'fixtures/api_feed.json',
+}
+
+
+def api_setting(name: str):
+    """Ambil satu nilai dari settings.FASTPRINT_API dengan fallback ke default."""
+    default = DEFAULT_API_SETTINGS[name]
+    if name == 'TIME_ZONE':
+        default = settings.TIME_ZONE or default
+    return getattr(settings, 'FASTPRINT_API', {}).get(name, default)
+
+
+class FastPrintAPIError(Exception):
+    """Base exception untuk semua error komunikasi dengan API Fast Print."""
+
+
+class FastPrintConnectionError(FastPrintAPIError):
+    """Tidak dapat terhubung ke API."""
+
+
+class FastPrintTimeoutError(FastPrintAPIError):
+    """API tidak merespons dalam batas connect/read timeout."""
+
+
+class FastPrintHTTPError(FastPrintAPIError):
+    """API mengembalikan HTTP status error."""
+
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FastPrintAuthError(FastPrintHTTPError):
+    """Autentikasi ditolak (401/403)."""
+
+
+class FastPrintResponseError(FastPrintAPIError):
+    """Body response bukan JSON / format yang diharapkan."""
+
+
+class FastPrintDataError(FastPrintAPIError):
+    """Item feed memiliki nilai field yang tidak valid."""
+
+    def __init__(self, message: str, field: str = None):
+        super().__init__(message)
+        self.field = field
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def build_session(transport: str = None, fixture: str = None) -> requests.Session:
+    """
+    Session HTTP baru dengan connection pool sesuai FASTPRINT_API.
+
+    Args:
+        transport (str): live, record, atau replay. Default FASTPRINT_API['TRANSPORT']
+        fixture (str): Path fixture record/replay. Default FASTPRINT_API['FIXTURE']
+    """
+    from .transports import build_adapter
+
+    session = requests.Session()
+    adapter = build_adapter(
+        transport or api_setting('TRANSPORT'),
+        fixture=fixture,
+        pool_connections=api_setting('POOL_CONNECTIONS'),
+        pool_maxsize=api_setting('POOL_MAXSIZE'),
+        max_retries=0,  # retry ditangani FastPrintAPIService._request
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = 'FastPrint-Django-Client/1.0'
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Session HTTP bersama (build_session dengan transport dari FASTPRINT_API).
+    Dibuat sekali per proses, koneksi TCP+TLS dipakai ulang (keep-alive).
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def reset_session():
+    """Tutup session bersama (mis. setelah FASTPRINT_API berubah)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+class FastPrintCredentials:
+    """
+    Provider kredensial API yang di-cache per hari kalender.
+
+    Password (md5 bisacoding-DD-MM-YY), username, dan header Basic Auth hanya
+    dihitung ulang saat tanggal di zona FASTPRINT_API['TIME_ZONE'] berganti.
+    Counter username (C##) dipelajari dari header X-Credentials-Username dan
+    disimpan di APIFetchState agar dipakai oleh semua proses.
+    """
+
+    DEFAULT_COUNTER = 'C23'
+    USERNAME_HEADER = 'X-Credentials-Username'
+
+    _lock = threading.Lock()
+    _cache: Dict = {}
+    _last_hint = ''
+
+    @staticmethod
+    def today() -> date:
+        """Tanggal hari ini di zona waktu API."""
+        return datetime.now(ZoneInfo(api_setting('TIME_ZONE'))).date()
+
+    @classmethod
+    def _current(cls) -> Dict:
+        today = cls.today()
+        with cls._lock:
+            if cls._cache.get('date') != today:
+                password_format = f"bisacoding-{today.strftime('%d-%m-%y')}"
+                cls._cache = {
+                    'date': today,
+                    'password': hashlib.md5(password_format.encode()).hexdigest(),
+                    'auth': {},
+                }
+            return cls._cache
+
+    @classmethod
+    def password(cls) -> str:
+        return cls._current()['password']
+
+    @classmethod
+    def username(cls) -> str:
+        cache = cls._current()
+        with cls._lock:
+            username = cache.get('username')
+        if username is None:
+            # Query DB di luar lock; jika thread lain lebih dulu, nilainya yang dipakai
+            username = cls._derive_username(cache['date'])
+            with cls._lock:
+                username = cache.setdefault('username', username)
+        return username
+
+    @classmethod
+    def basic_auth(cls, username: str) -> str:
+        """Nilai header Authorization untuk username, di-cache per hari."""
+        cache = cls._current()
+        with cls._lock:
+            if username not in cache['auth']:
+                credentials = f"{username}:{cache['password']}"
+                cache['auth'][username] = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+            return cache['auth'][username]
+
+    @classmethod
+    def _derive_username(cls, day: date) -> str:
+        from .models import APIFetchState
+
+        counter = cls.DEFAULT_COUNTER
+        state = APIFetchState.objects.filter(url=api_setting('URL')).exclude(username_hint='').first()
+        if state is not None:
+            if state.username_hint_date == day:
+                return state.username_hint
+            # Hint dari hari sebelumnya: pakai counter-nya dengan tanggal hari ini
+            match = re.search(r'(C\d+)$', state.username_hint)
+            if match:
+                counter = match.group(1)
+
+        return f"tesprogrammer{day.strftime('%d%m%y')}{counter}"
+
+    @classmethod
+    def learn(cls, response: requests.Response) -> bool:
+        """
+        Simpan username dari header X-Credentials-Username jika berbeda dari
+        username yang sedang dipakai.
+
+        Returns:
+            bool: True jika username baru dipelajari
+        """
+        from .models import APIFetchState
+
+        hint = response.headers.get(cls.USERNAME_HEADER, '').strip()
+        with cls._lock:
+            known = (cls._cache.get('username'), cls._last_hint)
+        if not hint or hint in known:
+            return False
+
+        logger.info(f"Learned API username from {cls.USERNAME_HEADER}: {hint}")
+        APIFetchState.objects.update_or_create(
+            url=api_setting('URL'),
+            defaults={'username_hint': hint, 'username_hint_date': cls.today()},
+        )
+        with cls._lock:
+            cls._cache = {}
+            cls._last_hint = hint
+        return True
+
+    @classmethod
+    def invalidate(cls):
+        """Buang kredensial yang di-cache sehingga diturunkan ulang."""
+        with cls._lock:
+            cls._cache = {}
+            cls._last_hint = ''
+
+
+class FeedResponse:
+    """
+    Hasil FastPrintAPIService.open_feed().
+
+    Jika `not_modified` True, feed sama dengan import terakhir dan tidak ada
+    body yang perlu diproses. Jika tidak, body dibaca lewat iter_products():
+    - `body`: body sudah di-spool ke file sementara (memori tetap datar);
+      body_hash sudah lengkap sejak awal.
+    - `response`: body di-stream langsung dari koneksi ke parser dan
+      body_hash dihitung dari chunk yang sama, lengkap setelah body habis.
+    Panggil save_validators() setelah import berhasil.
+    """
+
+    def __init__(self, url: str, not_modified: bool, etag: str = '', last_modified: str = '',
+                 body_hash: str = '', body=None, response: requests.Response = None):
+        self.url = url
+        self.not_modified = not_modified
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+        self._body = body
+        self._response = response
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._body is not None:
+            self._body.close()
+            self._body = None
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+
+    def _iter_body(self, chunk_size: int) -> Iterator[bytes]:
+        if self._body is not None:
+            self._body.seek(0)
+            yield from iter(lambda: self._body.read(chunk_size), b'')
+            return
+
+        if self._response is not None:
+            body_hash = hashlib.sha256()
+            for chunk in self._response.iter_content(chunk_size):
+                body_hash.update(chunk)
+                yield chunk
+            self.body_hash = body_hash.hexdigest()
+
+    def iter_products(self, chunk_size: int = None) -> Iterator[Dict]:
+        """Yield produk dari body (lihat FastPrintAPIService.iter_products)."""
+        if chunk_size is None:
+            chunk_size = getattr(settings, 'FASTPRINT_STREAM_CHUNK_SIZE', 64 * 1024)
+
+        chunks = self._iter_body(chunk_size)
+        try:
+            for item in iter_json_array(chunks, 'data'):
+                product = FastPrintAPIService.normalize_product(item)
+                if product:
+                    yield product
+            # Sisa body setelah array tetap dibaca supaya body_hash lengkap
+            for _ in chunks:
+                pass
+        except Exception as e:
+            raise FastPrintAPIService._translate_error(e) from e
+
+    def drain(self):
+        """Baca seluruh body tanpa parse (mis. saat merekam fixture)."""
+        for _ in self._iter_body(getattr(settings, 'FASTPRINT_STREAM_CHUNK_SIZE', 64 * 1024)):
+            pass
+
+    def save_validators(self):
+        """Simpan ETag/Last-Modified/body hash untuk conditional fetch berikutnya."""
+        from .models import APIFetchState
+
+        if self.not_modified:
+            return
+        APIFetchState.objects.update_or_create(
+            url=self.url,
+            defaults={
+                'etag': self.etag,
+                'last_modified': self.last_modified,
+                'body_hash': self.body_hash,
+            }
+        )
+
 
 class FastPrintAPIService:
     """
@@ -27,33 +351,26 @@ class FastPrintAPIService:
     def generate_password() -> str:
         """
         Generate password MD5 dengan format: bisacoding-DD-MM-YY
+        Tanggal mengikuti FASTPRINT_API['TIME_ZONE'], di-cache per hari.
         
         Returns:
             str: MD5 hash dari password format
         """
-        today = datetime.now()
-        password_format = f"bisacoding-{today.strftime('%d-%m-%y')}"
-        md5_hash = hashlib.md5(password_format.encode()).hexdigest()
-        return md5_hash
+        return FastPrintCredentials.password()
     
     @staticmethod
     def generate_username() -> str:
         """
-        Generate username dengan format: testprogrammerDDMMYYC##
+        Generate username dengan format: tesprogrammerDDMMYYC##
         Format berubah setiap hari sesuai tanggal server.
         
-        CATATAN: Username dapat diambil dari response header X-Credentials-Username
-        jika API memberikan hint. Format default: testprogrammerDDMMYYC##
+        CATATAN: Counter C## dipelajari dari response header X-Credentials-Username
+        (lihat FastPrintCredentials.learn). Default: C23.
         
         Returns:
             str: Username untuk autentikasi
         """
-        today = datetime.now()
-        date_str = today.strftime('%d%m%y')
-        # Default counter - biasanya berubah setiap hari (cek response header untuk nilai actual)
-        # Hari ini (04-02-26) seharusnya C23 atau nomor lain sesuai server
-        username = f"tesprogrammer{date_str}C23"
-        return username
+        return FastPrintCredentials.username()
     
     @staticmethod
     def get_auth_headers(username: str) -> Dict[str, str]:
@@ -66,59 +383,169 @@ class FastPrintAPIService:
         Returns:
             Dict: Authorization header
         """
-        import base64
-        
-        password = FastPrintAPIService.generate_password()
-        credentials = f"{username}:{password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        
         return {
-            'Authorization': f'Basic {encoded}',
+            'Authorization': FastPrintCredentials.basic_auth(username),
             'User-Agent': 'FastPrint-Django-Client/1.0'
         }
     
     @staticmethod
-    def fetch_products(username: str = None) -> Optional[Dict]:
+    def get_api_url() -> str:
+        """URL API dari settings.FASTPRINT_API['URL'] (default API_URL)."""
+        return api_setting('URL')
+    
+    @staticmethod
+    def backoff_delay(attempt: int, response: requests.Response = None) -> float:
         """
-        Fetch data produk dari API eksternal.
-        CATATAN: API menggunakan METHOD POST dengan username & password di body
+        Delay sebelum retry ke-`attempt` (mulai 0): BACKOFF_FACTOR * 2^attempt,
+        maksimal BACKOFF_MAX. Header Retry-After (detik) dihormati jika ada.
+        """
+        delay = api_setting('BACKOFF_FACTOR') * (2 ** attempt)
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+        return min(delay, api_setting('BACKOFF_MAX'))
+    
+    @staticmethod
+    def _request(username: str = None, stream: bool = False, headers: Dict[str, str] = None,
+                 session: requests.Session = None) -> requests.Response:
+        """
+        Kirim POST request ke API dengan username & password di body.
+        Timeout, connection error, dan HTTP 5xx di-retry maksimal MAX_RETRIES kali.
         
         Args:
             username (str): Username untuk autentikasi. Jika None, akan generate otomatis.
+            stream (bool): Jika True, body tidak langsung dibaca (untuk iter_content)
+            headers (Dict): Header tambahan (mis. If-None-Match)
+            session (requests.Session): Session lain (lihat build_session). Default get_session()
             
         Returns:
-            Dict: Response dari API atau None jika gagal
+            requests.Response: Response yang status code-nya sudah dicek
         """
-        try:
-            # Generate username jika tidak disediakan
-            if not username:
-                username = FastPrintAPIService.generate_username()
+        # Generate username jika tidak disediakan
+        auto_username = not username
+        if auto_username:
+            username = FastPrintAPIService.generate_username()
+        
+        password = FastPrintAPIService.generate_password()
+        
+        # Prepare POST data
+        data = {
+            'username': username,
+            'password': password
+        }
+        
+        url = FastPrintAPIService.get_api_url()
+        timeout = (api_setting('CONNECT_TIMEOUT'), api_setting('READ_TIMEOUT'))
+        max_retries = api_setting('MAX_RETRIES')
+        session = session or get_session()
+        
+        logger.info(f"Fetching from API with username: {username}")
+        
+        attempt = 0
+        auth_retried = False
+        while True:
+            try:
+                # NOTE: API memerlukan POST method dengan username & password di body
+                response = session.post(
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=timeout,
+                    verify=api_setting('VERIFY_SSL'),
+                    stream=stream
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= max_retries:
+                    raise
+                delay = FastPrintAPIService.backoff_delay(attempt)
+                logger.warning(f"API request failed ({e.__class__.__name__}), retry {attempt + 1}/{max_retries} in {delay}s")
+                attempt += 1
+                time.sleep(delay)
+                continue
             
-            password = FastPrintAPIService.generate_password()
+            if response.status_code >= 500 and attempt < max_retries:
+                delay = FastPrintAPIService.backoff_delay(attempt, response)
+                logger.warning(f"API returned HTTP {response.status_code}, retry {attempt + 1}/{max_retries} in {delay}s")
+                response.close()
+                attempt += 1
+                time.sleep(delay)
+                continue
             
-            # Prepare POST data
-            data = {
-                'username': username,
-                'password': password
-            }
+            FastPrintCredentials.learn(response)
             
-            # Headers
-            headers = {
-                'User-Agent': 'FastPrint-Django-Client/1.0'
-            }
+            if response.status_code == 401 and not auth_retried:
+                # Kredensial mungkin basi (ganti hari) atau counter username berubah:
+                # turunkan ulang, lalu coba lagi sekali jika hasilnya berbeda
+                auth_retried = True
+                FastPrintCredentials.invalidate()
+                retry_data = {
+                    'username': FastPrintAPIService.generate_username() if auto_username else username,
+                    'password': FastPrintAPIService.generate_password(),
+                }
+                if retry_data != data:
+                    data = retry_data
+                    logger.warning(f"API returned HTTP 401, retrying with username: {data['username']}")
+                    response.close()
+                    continue
             
-            logger.info(f"Fetching from API with username: {username}")
+            response.raise_for_status()
+            return response
+    
+    @staticmethod
+    def _translate_error(e: Exception) -> FastPrintAPIError:
+        """
+        Konversi exception dari requests/JSON menjadi FastPrintAPIError yang sesuai.
+        
+        Args:
+            e (Exception): Exception asli
             
-            # NOTE: API memerlukan POST method dengan username & password di body
-            response = requests.post(
-                FastPrintAPIService.API_URL,
-                data=data,
-                headers=headers,
-                timeout=10,
-                verify=True  # Verify SSL certificate
-            )
+        Returns:
+            FastPrintAPIError: Exception bertipe dengan pesan untuk user
+        """
+        if isinstance(e, FastPrintAPIError):
+            return e
+        
+        # Cek Timeout lebih dulu: ConnectTimeout juga turunan ConnectionError
+        if isinstance(e, requests.exceptions.Timeout):
+            logger.error("API request timeout")
+            return FastPrintTimeoutError("Request timeout. API tidak merespons dalam waktu yang ditentukan.")
+        
+        if isinstance(e, requests.exceptions.ConnectionError):
+            logger.error(f"Connection error: {str(e)}")
+            return FastPrintConnectionError("Tidak dapat terhubung ke API. Periksa koneksi internet.")
+        
+        if isinstance(e, requests.exceptions.HTTPError):
+            status_code = e.response.status_code
+            logger.error(f"HTTP error: {status_code}")
+            if status_code == 401:
+                return FastPrintAuthError("Autentikasi gagal. Username atau password salah.", status_code)
+            elif status_code == 403:
+                return FastPrintAuthError("Anda tidak memiliki akses ke resource ini.", status_code)
+            else:
+                return FastPrintHTTPError(f"HTTP Error {status_code}", status_code)
+        
+        if isinstance(e, ValueError):
+            logger.error(f"JSON decode error: {str(e)}")
+            return FastPrintResponseError("Response dari API bukan format JSON yang valid.")
+        
+        logger.error(f"Unexpected error: {str(e)}")
+        return FastPrintAPIError(f"Error: {str(e)}")
+    
+    @staticmethod
+    def fetch_products(username: str = None) -> Optional[Dict]:
+        """
+        Fetch data produk dari API eksternal.
+        CATATAN: API menggunakan METHOD POST dengan username & password di body
+        
+        Args:
+            username (str): Username untuk autentikasi. Jika None, akan generate otomatis.
             
-            response.raise_for_status()
+        Returns:
+            Dict: Response dari API atau None jika gagal
+        """
+        try:
+            response = FastPrintAPIService._request(username)
             
             data = response.json()
             
@@ -128,30 +555,172 @@ class FastPrintAPIService:
             
             return data
             
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error: {str(e)}")
-            raise Exception("Tidak dapat terhubung ke API. Periksa koneksi internet.")
+        except Exception as e:
+            raise FastPrintAPIService._translate_error(e) from e
+    
+    @staticmethod
+    def iter_products(username: str = None, chunk_size: int = None) -> Iterator[Dict]:
+        """
+        Streaming fetch: baca response per chunk dan yield produk satu per satu.
         
-        except requests.exceptions.Timeout:
-            logger.error("API request timeout")
-            raise Exception("Request timeout. API tidak merespons dalam waktu yang ditentukan.")
-        
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e.response.status_code}")
-            if e.response.status_code == 401:
-                raise Exception("Autentikasi gagal. Username atau password salah.")
-            elif e.response.status_code == 403:
-                raise Exception("Anda tidak memiliki akses ke resource ini.")
-            else:
-                raise Exception(f"HTTP Error {e.response.status_code}")
+        Body mentah tidak pernah di-load penuh ke memori, sehingga konsumsi memori
+        tetap datar berapa pun ukuran feed. Cocok dipakai langsung oleh
+        ProductSyncEngine.run() yang memproses record per batch.
         
-        except ValueError as e:
-            logger.error(f"JSON decode error: {str(e)}")
-            raise Exception("Response dari API bukan format JSON yang valid.")
+        Args:
+            username (str): Username untuk autentikasi. Jika None, akan generate otomatis.
+            chunk_size (int): Ukuran chunk baca dalam bytes
+            
+        Yields:
+            Dict: Product data hasil normalize_product()
+        """
+        if chunk_size is None:
+            chunk_size = getattr(settings, 'FASTPRINT_STREAM_CHUNK_SIZE', 64 * 1024)
+        
+        count = 0
+        try:
+            with FastPrintAPIService._request(username, stream=True) as response:
+                for item in iter_json_array(response.iter_content(chunk_size), 'data'):
+                    product = FastPrintAPIService.normalize_product(item)
+                    if product:
+                        count += 1
+                        yield product
         
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            raise Exception(f"Error: {str(e)}")
+            raise FastPrintAPIService._translate_error(e) from e
+        
+        logger.info(f"Streamed {count} valid products from API")
+    
+    @staticmethod
+    def open_feed(username: str = None, conditional: bool = True,
+                  session: requests.Session = None) -> FeedResponse:
+        """
+        Fetch feed dengan conditional request.
+        
+        Validator dari import terakhir (APIFetchState) dikirim sebagai
+        If-None-Match / If-Modified-Since. Jika upstream membalas 304, atau
+        tidak mendukung validator tetapi body-nya identik (SHA-256 sama),
+        hasilnya FeedResponse.not_modified dan parse+import bisa dilewati.
+        
+        Trade-off: body hanya di-spool (download selesai dulu, baru parse)
+        jika ada body_hash tersimpan untuk dibandingkan, karena keputusan
+        skip butuh hash seluruh body sebelum import dimulai. Tanpa body_hash
+        (fetch pertama, force, atau upstream dengan ETag) body di-stream
+        langsung ke parser dan di-hash sambil jalan.
+        
+        Args:
+            username (str): Username untuk autentikasi. Jika None, akan generate otomatis.
+            conditional (bool): False untuk mengabaikan validator (force full fetch)
+            session (requests.Session): Session lain, mis. build_session('record', path)
+            
+        Returns:
+            FeedResponse: Status not modified atau body yang siap diparse
+        """
+        from .models import APIFetchState
+        
+        url = FastPrintAPIService.get_api_url()
+        state = APIFetchState.objects.filter(url=url).first() if conditional else None
+        
+        headers = {}
+        if state is not None:
+            if state.etag:
+                headers['If-None-Match'] = state.etag
+            if state.last_modified:
+                headers['If-Modified-Since'] = state.last_modified
+        
+        if state is None or not state.body_hash:
+            return FastPrintAPIService._stream_feed(url, username, headers, session)
+        
+        max_size = getattr(settings, 'FASTPRINT_SPOOL_MAX_SIZE', 5 * 1024 * 1024)
+        chunk_size = getattr(settings, 'FASTPRINT_STREAM_CHUNK_SIZE', 64 * 1024)
+        body = tempfile.SpooledTemporaryFile(max_size=max_size)
+        
+        try:
+            with FastPrintAPIService._request(username, stream=True, headers=headers, session=session) as response:
+                if response.status_code == 304:
+                    logger.info("API feed not modified (HTTP 304)")
+                    body.close()
+                    return FeedResponse(url, True)
+                
+                body_hash = hashlib.sha256()
+                for chunk in response.iter_content(chunk_size):
+                    body_hash.update(chunk)
+                    body.write(chunk)
+                
+                feed = FeedResponse(
+                    url,
+                    not_modified=False,
+                    etag=response.headers.get('ETag', ''),
+                    last_modified=response.headers.get('Last-Modified', ''),
+                    body_hash=body_hash.hexdigest(),
+                    body=body,
+                )
+        
+        except Exception as e:
+            body.close()
+            raise FastPrintAPIService._translate_error(e) from e
+        
+        if state.body_hash == feed.body_hash:
+            logger.info("API feed not modified (identical body hash)")
+            feed.close()
+            feed.not_modified = True
+        
+        return feed
+    
+    @staticmethod
+    def _stream_feed(url: str, username: str, headers: Dict[str, str],
+                     session: requests.Session = None) -> FeedResponse:
+        """FeedResponse yang membaca body langsung dari koneksi (tanpa spool)."""
+        try:
+            response = FastPrintAPIService._request(username, stream=True, headers=headers, session=session)
+        except Exception as e:
+            raise FastPrintAPIService._translate_error(e) from e
+        
+        if response.status_code == 304:
+            logger.info("API feed not modified (HTTP 304)")
+            response.close()
+            return FeedResponse(url, True)
+        
+        return FeedResponse(
+            url,
+            not_modified=False,
+            etag=response.headers.get('ETag', ''),
+            last_modified=response.headers.get('Last-Modified', ''),
+            response=response,
+        )
+    
+    @staticmethod
+    def normalize_product(item: Dict) -> Optional[Dict]:
+        """
+        Transform satu item API ke format yang sesuai dengan model Product.
+        
+        Args:
+            item (Dict): Satu elemen array "data" dari response API
+            
+        Returns:
+            Dict: Product data, atau None jika nama kosong / harga tidak positif
+            
+        Raises:
+            FastPrintDataError: Jika harga bukan bilangan bulat
+        """
+        harga = item.get('harga', 0)
+        try:
+            harga = int(harga)
+        except (TypeError, ValueError):
+            raise FastPrintDataError(
+                f"Field 'harga' produk {item.get('nama_produk', '')!r} bukan angka: {harga!r}", field='harga'
+            )
+        
+        product = {
+            'nama_produk': item.get('nama_produk', ''),
+            'harga': harga,
+            'kategori': item.get('kategori', ''),
+            'status': item.get('status', ''),
+        }
+        
+        if product['nama_produk'] and product['harga'] > 0:
+            return product
+        return None
     
     @staticmethod
     def parse_product_data(api_response: Dict) -> List[Dict]:
@@ -170,14 +739,8 @@ class FastPrintAPIService:
             api_data = api_response.get('data', [])
             
             for item in api_data:
-                product = {
-                    'nama_produk': item.get('nama_produk', ''),
-                    'harga': int(item.get('harga', 0)),
-                    'kategori': item.get('kategori', ''),
-                    'status': item.get('status', ''),
-                }
-                
-                if product['nama_produk'] and product['harga'] > 0:
+                product = FastPrintAPIService.normalize_product(item)
+                if product:
                     products.append(product)
             
             logger.info(f"Parsed {len(products)} valid products from API response")
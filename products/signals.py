@@ -0,0 +1,83 @@
+"""
+Signal handlers untuk invalidasi cache dan statistik kategori di app products.
+Didaftarkan di ProductsConfig.ready().
+"""
+
+from decimal import Decimal
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import autocomplete, invalidation, lookups, stats
+from .models import Kategori, Product, Status
+
+
+@receiver(post_save, sender=Kategori)
+@receiver(post_delete, sender=Kategori)
+@receiver(post_save, sender=Status)
+@receiver(post_delete, sender=Status)
+def invalidate_lookups(sender, **kwargs):
+    """Kategori/Status berubah: buang cache lookup dan response API di semua proses."""
+    lookups.invalidate()
+    invalidation.lookups_changed()
+
+
+@receiver(pre_save, sender=Product)
+def product_saving(sender, instance, raw=False, **kwargs):
+    """
+    Simpan kelompok statistik lama (kategori, status, harga) sebelum produk diubah.
+
+    Nilai lama diambil dari `_loaded_values` (Product.from_db / save sebelumnya);
+    hanya instance yang tidak dibaca dari database (mis. Product(pk=...)) atau
+    dibaca tanpa field tersebut (.only()) yang butuh SELECT tambahan.
+    """
+    instance._stats_previous = None
+    if instance.pk is None or raw:
+        return
+
+    loaded = getattr(instance, '_loaded_values', {})
+    if all(field in loaded for field in Product.STATS_FIELDS):
+        instance._stats_previous = tuple(loaded[field] for field in Product.STATS_FIELDS)
+    else:
+        instance._stats_previous = Product.objects.filter(pk=instance.pk).values_list(
+            *Product.STATS_FIELDS
+        ).first()
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, raw=False, **kwargs):
+    """
+    Geser statistik kategori; buang response API; perbarui index autocomplete
+    setelah transaksi commit.
+    """
+    previous = getattr(instance, '_stats_previous', None)
+    current = (instance.kategori_id, instance.status_id, instance.harga)
+    if raw:
+        # loaddata: nilai lama tidak diketahui, hitung ulang kategorinya
+        stats.touch([instance.kategori_id])
+    elif previous is None:
+        stats.product_added(*current)
+    elif previous[:2] != current[:2] or previous[2] != Decimal(str(instance.harga)):
+        refreshed = stats.product_removed(*previous)
+        # Hitung ulang kelompok yang sama sudah memuat harga baru
+        if not (refreshed and previous[:2] == current[:2]):
+            stats.product_added(*current)
+
+    instance._loaded_values = {field: getattr(instance, field) for field in Product.STATS_FIELDS}
+    invalidation.responses_changed()
+    transaction.on_commit(partial(
+        autocomplete.product_saved, instance.pk, instance.nama_produk, instance.status_id, instance.updated_at
+    ))
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    """
+    Geser statistik kategori; buang response API; hapus produk dari index
+    autocomplete setelah transaksi commit.
+    """
+    stats.product_removed(instance.kategori_id, instance.status_id, instance.harga)
+    invalidation.responses_changed()
+    transaction.on_commit(partial(autocomplete.product_deleted, instance.pk))
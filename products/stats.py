@@ -0,0 +1,267 @@
+"""
+Statistik produk per kategori (jumlah, harga min/max/rata-rata) per status.
+
+Dibaca dari tabel ringkasan KategoriStats (satu baris per kategori+status),
+jadi biaya baca sebanding jumlah kategori, bukan jumlah produk.
+
+Pemeliharaan:
+- Signal Product (products/signals.py): product_added()/product_removed()
+  menggeser counter satu kelompok. Jika produk yang dihapus memegang harga
+  min/max, kelompok itu dihitung ulang (satu agregat lewat index kategori+status).
+- Operasi massal (sync, bulk API, penyesuaian harga, import) berjalan di dalam
+  bulk_changes(): signal di dalam blok tidak menulis per baris, kategori yang
+  tersentuh dikumpulkan lalu dihitung ulang sekali di akhir blok.
+- rebuild()/verify() (manage.py kategori_stats) menghitung ulang/memeriksa
+  seluruh tabel terhadap tabel produk.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+
+from .models import Kategori, KategoriStats, Product
+
+logger = logging.getLogger(__name__)
+
+STAT_FIELDS = ['product_count', 'total_harga', 'min_harga', 'max_harga']
+CENT = Decimal('0.01')
+
+_local = threading.local()
+
+
+# ----------------------------------------------------------------------
+# Pemeliharaan
+# ----------------------------------------------------------------------
+
+@contextmanager
+def bulk_changes():
+    """
+    Tunda pembaruan per baris selama operasi massal.
+
+    Kategori yang disentuh (lewat touch() atau signal Product) dihitung ulang
+    sekali saat blok terluar selesai tanpa error. Panggil di dalam transaksi
+    yang sama dengan penulisan produk.
+    """
+    outer = getattr(_local, 'pending', None) is None
+    if outer:
+        _local.pending = set()
+    try:
+        yield
+        if outer and _local.pending:
+            refresh(_local.pending)
+    finally:
+        if outer:
+            _local.pending = None
+
+
+def touch(kategori_ids: Iterable[int]):
+    """Tandai kategori berubah di dalam bulk_changes() (di luar blok: hitung ulang sekarang)."""
+    kategori_ids = set(kategori_ids)
+    pending = getattr(_local, 'pending', None)
+    if pending is not None:
+        pending.update(kategori_ids)
+    elif kategori_ids:
+        refresh(kategori_ids)
+
+
+def product_added(kategori_id: int, status_id: int, harga):
+    """Satu produk masuk ke kelompok kategori+status."""
+    if getattr(_local, 'pending', None) is not None:
+        _local.pending.add(kategori_id)
+        return
+
+    harga = Value(Decimal(str(harga)))
+    updated = KategoriStats.objects.filter(kategori_id=kategori_id, status_id=status_id).update(
+        product_count=F('product_count') + 1,
+        total_harga=F('total_harga') + harga,
+        min_harga=Least(Coalesce('min_harga', harga), harga),
+        max_harga=Greatest(Coalesce('max_harga', harga), harga),
+    )
+    if not updated:
+        # Kelompok baru: hitung dari tabel produk (aman terhadap insert bersamaan)
+        _refresh(Q(kategori_id=kategori_id, status_id=status_id))
+
+
+def product_removed(kategori_id: int, status_id: int, harga) -> bool:
+    """
+    Satu produk keluar dari kelompok kategori+status.
+
+    Returns:
+        bool: True jika kelompok dihitung ulang dari tabel produk (isinya
+              sudah mencerminkan keadaan baris saat ini)
+    """
+    if getattr(_local, 'pending', None) is not None:
+        _local.pending.add(kategori_id)
+        return False
+
+    harga = Decimal(str(harga))
+    group = Q(kategori_id=kategori_id, status_id=status_id)
+    with transaction.atomic():
+        # Kunci baris ringkasan: min/max yang dibaca tetap berlaku sampai UPDATE
+        row = KategoriStats.objects.select_for_update().filter(group).values(
+            'product_count', 'min_harga', 'max_harga'
+        ).first()
+        if row is None or row['product_count'] <= 1 or harga <= row['min_harga'] or harga >= row['max_harga']:
+            # Kelompok kosong atau harga ekstrem hilang: min/max harus dihitung ulang
+            _refresh(group)
+            return True
+
+        KategoriStats.objects.filter(group).update(
+            product_count=F('product_count') - 1,
+            total_harga=F('total_harga') - Value(harga),
+        )
+    return False
+
+
+def refresh(kategori_ids: Optional[Iterable[int]] = None):
+    """
+    Hitung ulang ringkasan kategori tertentu (None = semua) dari tabel produk.
+
+    Satu query GROUP BY untuk kategori tersebut, lalu upsert/hapus baris ringkasan.
+    """
+    if kategori_ids is None:
+        _refresh(Q())
+        return
+    kategori_ids = set(kategori_ids)
+    if kategori_ids:
+        _refresh(Q(kategori_id__in=kategori_ids))
+
+
+def rebuild():
+    """Bangun ulang seluruh tabel ringkasan."""
+    refresh()
+    logger.info("Kategori stats rebuilt")
+
+
+def _aggregate(scope: Q) -> Dict:
+    rows = Product.objects.filter(scope).order_by().values('kategori_id', 'status_id').annotate(
+        product_count=Count('pk'),
+        total_harga=Sum('harga'),
+        min_harga=Min('harga'),
+        max_harga=Max('harga'),
+    )
+    return {
+        (row['kategori_id'], row['status_id']): {
+            'product_count': row['product_count'],
+            'total_harga': _money(row['total_harga']),
+            'min_harga': _money(row['min_harga']),
+            'max_harga': _money(row['max_harga']),
+        }
+        for row in rows
+    }
+
+
+def _refresh(scope: Q):
+    with transaction.atomic():
+        fresh = _aggregate(scope)
+        current = dict(
+            ((kategori_id, status_id), pk)
+            for pk, kategori_id, status_id in KategoriStats.objects.filter(scope).values_list(
+                'pk', 'kategori_id', 'status_id'
+            )
+        )
+
+        stale = [pk for key, pk in current.items() if key not in fresh]
+        if stale:
+            KategoriStats.objects.filter(pk__in=stale).delete()
+
+        rows = [
+            KategoriStats(pk=current.get(key), kategori_id=key[0], status_id=key[1], **values)
+            for key, values in fresh.items()
+        ]
+        existing = [row for row in rows if row.pk is not None]
+        if existing:
+            KategoriStats.objects.bulk_update(existing, STAT_FIELDS, batch_size=1000)
+        new = [row for row in rows if row.pk is None]
+        if new:
+            KategoriStats.objects.bulk_create(new, batch_size=1000, **_upsert_options())
+
+
+def _upsert_options() -> Dict:
+    """ON CONFLICT (kategori, status) DO UPDATE jika didukung (refresh bersamaan)."""
+    if not connection.features.supports_update_conflicts_with_target:
+        return {}
+    return {
+        'update_conflicts': True,
+        'unique_fields': ['kategori', 'status'],
+        'update_fields': STAT_FIELDS,
+    }
+
+
+def verify() -> List[Dict]:
+    """
+    Bandingkan tabel ringkasan dengan agregat tabel produk.
+
+    Returns:
+        List[Dict]: Kelompok yang berbeda ({'kategori_id', 'status_id', 'expected', 'actual'})
+    """
+    fresh = _aggregate(Q())
+    stored = {
+        (row.pop('kategori_id'), row.pop('status_id')): row
+        for row in KategoriStats.objects.values('kategori_id', 'status_id', *STAT_FIELDS)
+    }
+    for values in stored.values():
+        for name in ('total_harga', 'min_harga', 'max_harga'):
+            values[name] = _money(values[name])
+
+    return [
+        {'kategori_id': key[0], 'status_id': key[1], 'expected': fresh.get(key), 'actual': stored.get(key)}
+        for key in sorted(fresh.keys() | stored.keys())
+        if fresh.get(key) != stored.get(key)
+    ]
+
+
+def _money(value) -> Optional[Decimal]:
+    return None if value is None else Decimal(str(value)).quantize(CENT)
+
+
+# ----------------------------------------------------------------------
+# Pembacaan
+# ----------------------------------------------------------------------
+
+def attach(kategoris: Iterable[Kategori]) -> List[Kategori]:
+    """
+    Pasang statistik ke instance Kategori (untuk KategoriStatsSerializer).
+
+    Atribut: product_count, min_harga, max_harga, avg_harga, dan
+    status_breakdown (list per status). Satu query ke tabel ringkasan.
+    """
+    kategoris = list(kategoris)
+    groups: Dict[int, List[Dict]] = {}
+    for row in KategoriStats.objects.filter(
+        kategori_id__in=[kategori.pk for kategori in kategoris]
+    ).order_by('status__nama_status').values(
+        'kategori_id', 'status_id', 'status__nama_status', *STAT_FIELDS
+    ):
+        groups.setdefault(row['kategori_id'], []).append({
+            'id_status': row['status_id'],
+            'nama_status': row['status__nama_status'],
+            'product_count': row['product_count'],
+            'total_harga': _money(row['total_harga']),
+            'min_harga': _money(row['min_harga']),
+            'max_harga': _money(row['max_harga']),
+            'avg_harga': _average(row['total_harga'], row['product_count']),
+        })
+
+    for kategori in kategoris:
+        breakdown = groups.get(kategori.pk, [])
+        count = sum(row['product_count'] for row in breakdown)
+        total = sum((row['total_harga'] for row in breakdown), Decimal('0'))
+        kategori.status_breakdown = breakdown
+        kategori.product_count = count
+        kategori.min_harga = min((row['min_harga'] for row in breakdown), default=None)
+        kategori.max_harga = max((row['max_harga'] for row in breakdown), default=None)
+        kategori.avg_harga = _average(total, count)
+    return kategoris
+
+
+def _average(total, count: int) -> Optional[Decimal]:
+    if not count:
+        return None
+    return (Decimal(str(total)) / count).quantize(CENT)
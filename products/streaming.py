@@ -0,0 +1,160 @@
+"""
+Parser JSON inkremental untuk response API yang besar.
+
+Membaca body per chunk dan menghasilkan elemen array (misalnya key "data")
+satu per satu, sehingga body mentah, tree hasil parse, dan list produk
+tidak perlu berada di memori sekaligus.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+WHITESPACE = ' \t\n\r'
+
+# Buang prefix buffer yang sudah dibaca jika melebihi ukuran ini
+COMPACT_THRESHOLD = 64 * 1024
+# Ukuran maksimal (karakter) satu nilai JSON, mis. satu elemen array
+MAX_VALUE_SIZE = 32 * 1024 * 1024
+
+
+class _StreamReader:
+    """Buffer teks di atas iterator chunk bytes/str."""
+
+    def __init__(self, chunks: Iterable):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_chars: int = 1) -> bool:
+        """
+        Tambah chunk ke buffer sampai bertambah minimal `min_chars` karakter
+        (atau stream habis). Chunk dikumpulkan di list dan digabung sekali.
+        Return False jika stream sudah habis.
+        """
+        if self.eof:
+            return False
+
+        if self.pos > COMPACT_THRESHOLD:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+        parts = [self.buf]
+        added = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._decoder.decode(chunk)
+            if chunk:
+                parts.append(chunk)
+                added += len(chunk)
+                if added >= min_chars:
+                    break
+        else:
+            parts.append(self._decoder.decode(b'', final=True))
+            self.eof = True
+
+        self.buf = ''.join(parts)
+        return True
+
+    def _grow(self):
+        """
+        Nilai di posisi sekarang belum lengkap: tambah data sebanyak bagian
+        yang sudah ada (minimal satu chunk). Ukuran yang dicoba tumbuh dua
+        kali lipat, jadi satu nilai besar hanya di-decode ulang O(log n) kali.
+
+        Raises:
+            ValueError: Jika nilai melebihi MAX_VALUE_SIZE karakter
+        """
+        pending = len(self.buf) - self.pos
+        if pending > MAX_VALUE_SIZE:
+            raise ValueError(f"Nilai JSON di posisi {self.pos} lebih dari {MAX_VALUE_SIZE} karakter")
+        self._fill(max(pending, 1))
+
+    def peek(self) -> str:
+        """Return karakter non-whitespace berikutnya tanpa mengkonsumsinya."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill() or (self.eof and self.pos >= len(self.buf)):
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at position {self.pos}, found '{found}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode satu nilai JSON lengkap mulai dari posisi sekarang."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._grow()
+                continue
+
+            # Angka/literal di ujung buffer mungkin masih terpotong
+            if end >= len(self.buf) and not self.eof:
+                self._grow()
+                continue
+
+            self.pos = end
+            return obj
+
+
+def iter_json_array(chunks: Iterable, key: str = 'data') -> Iterator[Any]:
+    """
+    Yield elemen array `key` dari objek JSON top-level secara inkremental.
+
+    Args:
+        chunks (Iterable): Iterator chunk bytes atau str (mis. response.iter_content())
+        key (str): Nama key array di objek top-level
+
+    Yields:
+        Elemen array satu per satu. Tidak yield apa pun jika key tidak ada
+        atau nilainya bukan array.
+
+    Raises:
+        ValueError: Jika body bukan JSON yang valid
+    """
+    reader = _StreamReader(chunks)
+    reader.expect('{')
+
+    if reader.peek() == '}':
+        return
+
+    while True:
+        name = reader.value()
+        if not isinstance(name, str):
+            raise ValueError(f"Expected object key at position {reader.pos}")
+        reader.expect(':')
+
+        if name == key and reader.peek() == '[':
+            reader.pos += 1
+            if reader.peek() == ']':
+                return
+            while True:
+                yield reader.value()
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == ']':
+                    return
+                if separator != ',':
+                    raise ValueError(f"Expected ',' or ']' at position {reader.pos - 1}")
+
+        # Key lain dilewati
+        reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"Expected ',' or '}}' at position {reader.pos - 1}")
@@ -0,0 +1,248 @@
+"""
+Engine sinkronisasi produk dari feed API eksternal ke database lokal.
+
+Menggantikan loop get_or_create/update_or_create per baris dengan operasi
+set-based: kategori & status di-resolve sekali per batch, produk yang sudah
+ada di-diff secara bulk lewat content_hash, lalu hanya baris yang benar-benar
+berubah ditulis dengan bulk_create (ON CONFLICT upsert bila didukung) dan
+bulk_update.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import invalidation, stats
+from .models import Product, Kategori, Status, SyncSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class SyncResult:
+    """
+    Ringkasan hasil sinkronisasi.
+
+    Fields:
+    - processed: Jumlah baris feed yang diproses (termasuk duplikat)
+    - created: Produk baru yang dibuat
+    - updated: Produk yang datanya berubah
+    - unchanged: Produk yang sudah sama dengan feed (tidak ditulis)
+    - removed: Produk di snapshot sebelumnya yang tidak ada lagi di feed
+    """
+    processed: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    removed_names: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'removed': self.removed,
+        }
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """Pecah iterable menjadi list berukuran maksimal `size`."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class ProductSyncEngine:
+    """
+    Bulk upsert produk hasil parse FastPrintAPIService.
+
+    Hasil akhir database identik dengan loop update_or_create berdasarkan
+    nama_produk (baris terakhir di feed menang jika ada duplikat), tetapi
+    jumlah query per batch konstan, bukan per produk. Baris yang content_hash-nya
+    sama dengan database dilewati sehingga updated_at tidak berubah.
+
+    Jika `source` diberikan, feed yang diterapkan disimpan sebagai SyncSnapshot.
+    Dengan `detect_removed=True`, produk yang ada di snapshot sebelumnya tetapi
+    hilang dari feed dilaporkan di SyncResult.removed (tidak dihapus).
+
+    `progress_callback(result)` dipanggil setelah setiap batch selesai ditulis.
+    """
+
+    UPDATE_FIELDS = ['harga', 'kategori', 'status', 'content_hash', 'updated_at']
+
+    def __init__(self, batch_size: int = None, source: str = None, detect_removed: bool = False,
+                 progress_callback: Optional[Callable[[SyncResult], None]] = None):
+        self.batch_size = batch_size or getattr(
+            settings, 'FASTPRINT_SYNC_BATCH_SIZE', DEFAULT_BATCH_SIZE
+        )
+        self.source = source
+        self.detect_removed = detect_removed
+        self.progress_callback = progress_callback
+        self._kategori_ids: Dict[str, int] = {}
+        self._status_ids: Dict[str, int] = {}
+        self._seen: Dict[str, str] = {}
+
+    def run(self, records: Iterable[Dict]) -> SyncResult:
+        """
+        Sinkronisasi seluruh record dalam satu transaksi.
+
+        Args:
+            records (Iterable[Dict]): Record produk dengan key nama_produk,
+                harga, kategori, dan status (format parse_product_data)
+
+        Returns:
+            SyncResult: Jumlah produk created/updated/unchanged
+        """
+        result = SyncResult()
+        started_at = timezone.now()
+
+        with transaction.atomic(), stats.bulk_changes():
+            for batch in chunked(records, self.batch_size):
+                self._apply_batch(batch, result)
+                if self.progress_callback:
+                    self.progress_callback(result)
+
+            if self.source:
+                self._save_snapshot(result)
+
+            # bulk_create/bulk_update tidak mengirim signal
+            if result.created or result.updated:
+                invalidation.products_changed(since=started_at)
+
+        logger.info(
+            f"Sync selesai: {result.created} dibuat, {result.updated} diperbarui, "
+            f"{result.unchanged} tidak berubah, {result.removed} hilang dari feed "
+            f"({result.processed} baris)"
+        )
+        return result
+
+    def _save_snapshot(self, result: SyncResult):
+        previous = SyncSnapshot.objects.filter(source=self.source).first()
+
+        if self.detect_removed and previous is not None:
+            result.removed_names = sorted(previous.entries.keys() - self._seen.keys())
+            result.removed = len(result.removed_names)
+
+        feed_hash = hashlib.sha256()
+        for nama_produk in sorted(self._seen):
+            feed_hash.update(self._seen[nama_produk].encode())
+
+        SyncSnapshot.objects.update_or_create(
+            source=self.source,
+            defaults={
+                'entries': self._seen,
+                'product_count': len(self._seen),
+                'feed_hash': feed_hash.hexdigest(),
+            }
+        )
+
+    def _apply_batch(self, batch: List[Dict], result: SyncResult):
+        result.processed += len(batch)
+
+        # Deduplikasi per nama_produk, baris terakhir menang
+        rows = {row['nama_produk']: row for row in batch}
+
+        self._resolve_ids(Kategori, 'nama_kategori', {r['kategori'] for r in rows.values()}, self._kategori_ids)
+        self._resolve_ids(Status, 'nama_status', {r['status'] for r in rows.values()}, self._status_ids)
+
+        existing = {
+            nama_produk: (pk, content_hash, kategori_id)
+            for pk, nama_produk, content_hash, kategori_id in Product.objects.filter(
+                nama_produk__in=rows.keys()
+            ).order_by().values_list('id_produk', 'nama_produk', 'content_hash', 'kategori_id')
+        }
+
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        touched = set()
+
+        for nama_produk, row in rows.items():
+            harga = Decimal(str(row['harga']))
+            kategori_id = self._kategori_ids[row['kategori']]
+            status_id = self._status_ids[row['status']]
+            content_hash = Product.compute_content_hash(nama_produk, harga, kategori_id, status_id)
+
+            if self.source:
+                self._seen[nama_produk] = content_hash
+
+            product = Product(
+                nama_produk=nama_produk,
+                harga=harga,
+                kategori_id=kategori_id,
+                status_id=status_id,
+                content_hash=content_hash,
+            )
+
+            if nama_produk not in existing:
+                to_create.append(product)
+                touched.add(kategori_id)
+                continue
+
+            pk, current_hash, current_kategori_id = existing[nama_produk]
+            if current_hash == content_hash:
+                result.unchanged += 1
+            else:
+                product.id_produk = pk
+                product.updated_at = now
+                to_update.append(product)
+                touched.update((kategori_id, current_kategori_id))
+
+        if to_create:
+            Product.objects.bulk_create(to_create, batch_size=self.batch_size, **self._upsert_options())
+            result.created += len(to_create)
+
+        if to_update:
+            Product.objects.bulk_update(to_update, self.UPDATE_FIELDS, batch_size=self.batch_size)
+            result.updated += len(to_update)
+
+        # Statistik kategori dihitung ulang sekali di akhir run()
+        stats.touch(touched)
+
+    def _upsert_options(self) -> Dict:
+        """
+        INSERT ... ON CONFLICT (nama_produk) DO UPDATE jika backend mendukung,
+        sehingga produk yang dibuat proses lain di antara diff dan insert
+        tetap ter-update, bukan melanggar unique constraint.
+        """
+        if not connection.features.supports_update_conflicts_with_target:
+            return {}
+        return {
+            'update_conflicts': True,
+            'unique_fields': ['nama_produk'],
+            'update_fields': self.UPDATE_FIELDS,
+        }
+
+    @staticmethod
+    def _resolve_ids(model, name_field: str, names: set, cache: Dict[str, int]):
+        """Resolve nama -> primary key, membuat baris yang belum ada secara bulk."""
+        missing = names - cache.keys()
+        if not missing:
+            return
+
+        found = dict(model.objects.filter(**{f'{name_field}__in': missing}).values_list(name_field, 'pk'))
+        new_names = missing - found.keys()
+        if new_names:
+            model.objects.bulk_create(
+                [model(**{name_field: name}) for name in new_names],
+                ignore_conflicts=True,
+            )
+            found.update(model.objects.filter(**{f'{name_field}__in': new_names}).values_list(name_field, 'pk'))
+            # bulk_create tidak mengirim post_save, invalidasi cache lookup manual
+            invalidation.lookups_changed()
+
+        cache.update(found)
@@ -0,0 +1,37 @@
+"""
+Template filter app products. Dipakai dengan {% load product_tags %}.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from django import template
+
+register = template.Library()
+
+RUPIAH = Decimal('1')
+
+
+@register.filter(is_safe=True)
+def rupiah(value) -> str:
+    """
+    Format harga sebagai rupiah: 'Rp 1.250.000'.
+
+    Dibulatkan ke rupiah terdekat (ROUND_HALF_UP, seperti floatformat:0),
+    pemisah ribuan titik. Menggantikan rantai
+    floatformat|add|stringformat|cut di template produk.
+
+    Args:
+        value: Decimal/int/float/str harga
+
+    Returns:
+        str: Harga terformat, atau '' jika kosong/tidak valid
+    """
+    if value is None or value == '':
+        return ''
+    try:
+        amount = Decimal(str(value)).quantize(RUPIAH, rounding=ROUND_HALF_UP)
+    except (InvalidOperation, ValueError):
+        return ''
+    if not amount.is_finite():
+        return ''
+    return 'Rp ' + f'{amount:,}'.replace(',', '.')
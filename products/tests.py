@@ -2,9 +2,56 @@
 Tests untuk products app.
 """
 
-from django.test import TestCase
-from django.test import Client
-from .models import Product, Kategori, Status
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import date, timedelta
+from io import StringIO
+from decimal import Decimal
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase, SimpleTestCase, TransactionTestCase, override_settings
+from django.test import AsyncClient, Client
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+from .models import (
+    MAX_HARGA, Product, Kategori, Status, SyncSnapshot, SyncJob, APIFetchState, PriceAdjustment, KategoriStats,
+    ProductChange,
+)
+from .jobs import JobReporter, enqueue_sync, claim_job, get_progress, recover_stale_jobs, run_job
+from .services import (
+    FastPrintAPIError, FastPrintAPIService, FastPrintCredentials, FastPrintAuthError, FastPrintDataError,
+    FastPrintHTTPError, FastPrintResponseError, FastPrintTimeoutError, get_session, reset_session
+)
+from . import async_views, autocomplete, checks, invalidation, lookups, pricing, response_cache
+from . import urls as product_urls
+from . import stats as stats_module
+from .bulk import BulkProductWriter
+from .importer import ProductImporter, normalize_record
+from .management.commands import dedupe_product_names
+from .cache_backends import InMemoryRedis
+from .renderers import FastJSONRenderer
+from . import search as search_backend
+from .sync import ProductSyncEngine, SyncResult
+from . import streaming
+from .streaming import iter_json_array
+from .templatetags.product_tags import rupiah
 
 
 class KategoriModelTest(TestCase):
@@ -96,3 +143,1756 @@ class ProductViewTest(TestCase):
         """Test product detail view."""
         response = self.client.get(f'/products/{self.product.id_produk}/')
         self.assertEqual(response.status_code, 200)
+
+
+class ProductSyncEngineTest(TestCase):
+    """Test untuk bulk upsert ProductSyncEngine."""
+
+    def setUp(self):
+        self.kategori = Kategori.objects.create(nama_kategori="Kertas")
+        self.status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.create(
+            nama_produk="Kertas A4",
+            harga=50000,
+            kategori=self.kategori,
+            status=self.status
+        )
+        Product.objects.create(
+            nama_produk="Kertas F4",
+            harga=60000,
+            kategori=self.kategori,
+            status=self.status
+        )
+
+    def test_sync_counts(self):
+        """Test created/updated/unchanged counts."""
+        records = [
+            {'nama_produk': 'Kertas A4', 'harga': 50000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'Kertas F4', 'harga': 65000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'Tinta Hitam', 'harga': 25000, 'kategori': 'Tinta', 'status': 'tidak bisa dijual'},
+        ]
+        result = ProductSyncEngine(batch_size=2).run(records)
+
+        self.assertEqual(result.as_dict(), {'processed': 3, 'created': 1, 'updated': 1, 'unchanged': 1, 'removed': 0})
+        self.assertEqual(Product.objects.get(nama_produk='Kertas F4').harga, 65000)
+        tinta = Product.objects.get(nama_produk='Tinta Hitam')
+        self.assertEqual(tinta.kategori.nama_kategori, 'Tinta')
+        self.assertEqual(tinta.status.nama_status, 'tidak bisa dijual')
+
+    def test_sync_last_duplicate_wins(self):
+        """Test baris duplikat di feed: baris terakhir menang seperti update_or_create."""
+        records = [
+            {'nama_produk': 'Pulpen', 'harga': 1000, 'kategori': 'ATK', 'status': 'bisa dijual'},
+            {'nama_produk': 'Pulpen', 'harga': 2000, 'kategori': 'ATK', 'status': 'bisa dijual'},
+        ]
+        ProductSyncEngine().run(records)
+
+        self.assertEqual(Product.objects.filter(nama_produk='Pulpen').count(), 1)
+        self.assertEqual(Product.objects.get(nama_produk='Pulpen').harga, 2000)
+
+    def test_sync_query_count_is_constant(self):
+        """Test jumlah query tidak bertambah per produk."""
+        records = [
+            {'nama_produk': f'Produk {i}', 'harga': 1000 + i, 'kategori': f'Kat {i % 3}', 'status': 'bisa dijual'}
+            for i in range(200)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            ProductSyncEngine(batch_size=500).run(records)
+
+        self.assertLess(len(queries), 15)
+        self.assertEqual(Product.objects.count(), 202)
+
+
+class StreamingParserTest(SimpleTestCase):
+    """Test untuk parser JSON inkremental."""
+
+    def setUp(self):
+        self.payload = {
+            'error': 0,
+            'version': '1.0',
+            'meta': {'tags': ['a', 'b'], 'total': 3},
+            'data': [
+                {'id_produk': '1', 'nama_produk': 'Kertas A4', 'harga': '50000', 'kategori': 'Kertas'},
+                {'id_produk': '2', 'nama_produk': 'Tinta \u00e9 "biru"', 'harga': 123456789, 'kategori': 'Tinta'},
+                {'id_produk': '3', 'nama_produk': 'Pulpen 中文', 'harga': 1.5, 'kategori': None},
+            ],
+            'tail': True,
+        }
+        self.body = json.dumps(self.payload, ensure_ascii=False).encode('utf-8')
+
+    def test_items_for_every_chunk_size(self):
+        """Test hasil sama dengan json.loads untuk semua ukuran chunk."""
+        for size in (1, 2, 3, 7, 64, len(self.body)):
+            chunks = [self.body[i:i + size] for i in range(0, len(self.body), size)]
+            self.assertEqual(list(iter_json_array(chunks, 'data')), self.payload['data'])
+
+    def test_missing_key_yields_nothing(self):
+        """Test key tidak ada atau bukan array."""
+        self.assertEqual(list(iter_json_array([b'{"error": 1, "ket": "gagal"}'])), [])
+        self.assertEqual(list(iter_json_array([b'{"data": null}'])), [])
+        self.assertEqual(list(iter_json_array([b'{"data": []}'])), [])
+
+    def test_invalid_json_raises(self):
+        """Test body rusak menghasilkan ValueError."""
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"data": [{"a": 1}, {"b": ']))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'<html>error</html>']))
+
+
+    def test_large_value_decoded_logarithmic_times(self):
+        """Test elemen besar yang terpotong di banyak chunk tidak di-decode ulang per chunk."""
+        body = json.dumps({'data': [{'deskripsi': 'x' * 200_000}, {'id': 2}]}).encode()
+        chunks = [body[i:i + 100] for i in range(0, len(body), 100)]
+
+        with mock.patch.object(
+            json.JSONDecoder, 'raw_decode', autospec=True, side_effect=json.JSONDecoder.raw_decode
+        ) as decode:
+            items = list(iter_json_array(chunks))
+
+        self.assertEqual(items, json.loads(body)['data'])
+        self.assertLess(decode.call_count, 40)
+
+        with mock.patch.object(streaming, 'MAX_VALUE_SIZE', 10_000):
+            with self.assertRaisesMessage(ValueError, 'lebih dari 10000 karakter'):
+                list(iter_json_array(chunks))
+
+
+class DeltaSyncTest(TestCase):
+    """Test untuk content_hash dan snapshot delta sync."""
+
+    def setUp(self):
+        self.records = [
+            {'nama_produk': 'Kertas A4', 'harga': 50000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'Tinta Hitam', 'harga': 25000, 'kategori': 'Tinta', 'status': 'bisa dijual'},
+        ]
+        ProductSyncEngine(source='test-feed').run(self.records)
+
+    def test_content_hash_set_on_save(self):
+        """Test content_hash diisi saat save() dan sama dengan hasil sync."""
+        product = Product.objects.get(nama_produk='Kertas A4')
+        synced_hash = product.content_hash
+        product.save()
+        self.assertEqual(product.content_hash, synced_hash)
+
+        product.harga = 51000
+        product.save(update_fields=['harga'])
+        product.refresh_from_db()
+        self.assertNotEqual(product.content_hash, synced_hash)
+
+    def test_unchanged_feed_writes_nothing(self):
+        """Test feed yang sama tidak menulis produk dan updated_at tetap."""
+        before = dict(Product.objects.values_list('nama_produk', 'updated_at'))
+
+        with CaptureQueriesContext(connection) as queries:
+            result = ProductSyncEngine(source='test-feed').run(self.records)
+
+        self.assertEqual(result.unchanged, 2)
+        self.assertEqual(result.updated + result.created, 0)
+        self.assertEqual(dict(Product.objects.values_list('nama_produk', 'updated_at')), before)
+        product_writes = [
+            q for q in queries.captured_queries
+            if q['sql'].startswith(('UPDATE "products_product"', 'INSERT INTO "products_product"'))
+        ]
+        self.assertEqual(product_writes, [])
+
+    def test_detect_removed(self):
+        """Test produk yang hilang dari feed dilaporkan tetapi tidak dihapus."""
+        result = ProductSyncEngine(source='test-feed', detect_removed=True).run(self.records[:1])
+
+        self.assertEqual(result.removed, 1)
+        self.assertEqual(result.removed_names, ['Tinta Hitam'])
+        self.assertTrue(Product.objects.filter(nama_produk='Tinta Hitam').exists())
+        self.assertEqual(SyncSnapshot.objects.get(source='test-feed').product_count, 1)
+
+
+class SyncJobTest(TestCase):
+    """Test untuk antrian SyncJob dan worker."""
+
+    records = [
+        {'nama_produk': 'Kertas A4', 'harga': 50000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+    ]
+
+    def test_enqueue_deduplicates_active_job(self):
+        """Test hanya satu job aktif per catalogue."""
+        job, created = enqueue_sync()
+        again, created_again = enqueue_sync()
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(job.pk, again.pk)
+        self.assertEqual(SyncJob.objects.count(), 1)
+
+    def setUp(self):
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def api_settings(self, server):
+        return override_settings(FASTPRINT_API={'URL': server.url, 'MAX_RETRIES': 0})
+
+    def test_worker_runs_job(self):
+        """Test worker claim dan menjalankan job sampai sukses."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings(server):
+            job, _ = enqueue_sync()
+            claimed = claim_job()
+            self.assertEqual(claimed.pk, job.pk)
+            self.assertEqual(claimed.status, SyncJob.STATUS_RUNNING)
+            self.assertIsNone(claim_job())
+
+            job = run_job(claimed)
+
+            self.assertEqual(job.status, SyncJob.STATUS_SUCCESS)
+            self.assertEqual(job.created, 1)
+            self.assertTrue(Product.objects.filter(nama_produk='Kertas A4').exists())
+
+            # Catalogue bisa di-enqueue lagi setelah job selesai
+            _, created = enqueue_sync()
+            self.assertTrue(created)
+
+    def test_failed_job_records_error(self):
+        """Test error fetch disimpan di job."""
+        with StubAPIServer([(401, 'unauthorized', None, 0)]) as server, self.api_settings(server):
+            enqueue_sync()
+            job = run_job(claim_job())
+
+        self.assertEqual(job.status, SyncJob.STATUS_FAILED)
+        self.assertEqual(job.error, 'Autentikasi gagal. Username atau password salah.')
+
+    def test_not_modified_with_etag(self):
+        """Test validator ETag dikirim ulang dan 304 melewati import."""
+        responses = [(200, FEED_BODY, {'ETag': '"v1"'}, 0), (304, '', None, 0)]
+        with StubAPIServer(responses) as server, self.api_settings(server):
+            enqueue_sync()
+            run_job(claim_job())
+            enqueue_sync()
+            job = run_job(claim_job())
+
+        self.assertEqual(server.requests[1]['headers'].get('If-None-Match'), '"v1"')
+        self.assertTrue(job.not_modified)
+        self.assertEqual(job.processed, 0)
+
+    def test_not_modified_with_body_hash(self):
+        """Test body identik tanpa ETag dianggap tidak berubah, kecuali force."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings(server):
+            enqueue_sync()
+            run_job(claim_job())
+            enqueue_sync()
+            job = run_job(claim_job())
+            self.assertTrue(job.not_modified)
+
+            enqueue_sync(force=True)
+            job = run_job(claim_job())
+            self.assertFalse(job.not_modified)
+            self.assertEqual(job.unchanged, 1)
+
+    def test_progress_written_to_job_row(self):
+        """Test progress per batch dan heartbeat ditulis ke baris job, bukan cache."""
+        enqueue_sync()
+        job = claim_job()
+        SyncJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+
+        with JobReporter(job) as reporter:
+            reporter.progress(SyncResult(processed=3, created=2, unchanged=1))
+
+        job.refresh_from_db()
+        self.assertEqual(get_progress(job), {'processed': 3, 'created': 2, 'updated': 0, 'unchanged': 1, 'removed': 0})
+        self.assertGreater(job.heartbeat_at, timezone.now() - timedelta(minutes=1))
+
+    def test_recovered_job_is_not_resurrected(self):
+        """Test job yang ditandai failed karena heartbeat timeout tidak ditimpa hasil worker lama."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings(server):
+            enqueue_sync()
+            job = claim_job()
+            SyncJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+            self.assertEqual(recover_stale_jobs(), 1)
+
+            job = run_job(job)
+
+        self.assertEqual(job.status, SyncJob.STATUS_FAILED)
+        self.assertIn('heartbeat timeout', job.error)
+        self.assertEqual(job.processed, 0)
+
+    def test_fetch_endpoint_returns_job_id(self):
+        """Test endpoint fetch_from_api langsung kembali dengan job id."""
+        response = self.client.get('/api/products/fetch_from_api/')
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()['job_id']
+
+        response = self.client.get(f'/api/sync-jobs/{job_id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], SyncJob.STATUS_QUEUED)
+
+
+class JobReporterThreadTest(TransactionTestCase):
+    """Test heartbeat JobReporter dari thread dengan koneksi database sendiri."""
+
+    def test_heartbeat_and_progress_from_thread(self):
+        stale = timezone.now() - timedelta(hours=1)
+        job = SyncJob.objects.create(status=SyncJob.STATUS_RUNNING, catalogue='feed', heartbeat_at=stale)
+
+        reporter = JobReporter(job, interval=0.05)
+        reporter.threaded = True
+        with reporter:
+            time.sleep(0.2)
+            job.refresh_from_db()
+            self.assertGreater(job.heartbeat_at, stale)
+            reporter.progress(SyncResult(processed=7, updated=7))
+
+        job.refresh_from_db()
+        self.assertEqual(job.processed, 7)
+        self.assertEqual(job.updated, 7)
+
+
+class StubAPIServer:
+    """
+    HTTP server lokal untuk mensimulasikan API Fast Print di test.
+    `responses` berisi tuple (status, body, headers, delay) yang dikirim berurutan;
+    response terakhir diulang jika request lebih banyak.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                stub.requests.append({
+                    'client_port': self.client_address[1],
+                    'headers': dict(self.headers),
+                    'body': self.rfile.read(length).decode(),
+                })
+                index = min(len(stub.requests), len(stub.responses)) - 1
+                status_code, body, headers, delay = stub.responses[index]
+                if delay:
+                    time.sleep(delay)
+                payload = body.encode() if isinstance(body, str) else body
+                self.send_response(status_code)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/api'
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+FEED_BODY = json.dumps({
+    'error': 0,
+    'data': [{'nama_produk': 'Kertas A4', 'harga': '50000', 'kategori': 'Kertas', 'status': 'bisa dijual'}],
+})
+
+
+class FastPrintHTTPClientTest(SimpleTestCase):
+    """Test untuk HTTP client FastPrintAPIService terhadap stub server lokal."""
+
+    def setUp(self):
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def api_settings(self, server, **overrides):
+        config = {'URL': server.url, 'READ_TIMEOUT': 2, 'MAX_RETRIES': 2, 'BACKOFF_FACTOR': 0}
+        config.update(overrides)
+        return override_settings(FASTPRINT_API=config)
+
+    def test_connection_reused(self):
+        """Test koneksi keep-alive dipakai ulang antar request."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings(server):
+            FastPrintAPIService.fetch_products('user')
+            FastPrintAPIService.fetch_products('user')
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(server.requests[0]['client_port'], server.requests[1]['client_port'])
+
+    def test_retry_on_5xx(self):
+        """Test HTTP 5xx di-retry sampai berhasil."""
+        responses = [(503, 'busy', None, 0), (502, 'bad gateway', None, 0), (200, FEED_BODY, None, 0)]
+        with StubAPIServer(responses) as server, self.api_settings(server):
+            data = FastPrintAPIService.fetch_products('user')
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(data['data'][0]['nama_produk'], 'Kertas A4')
+
+    def test_retries_are_bounded(self):
+        """Test retry berhenti setelah MAX_RETRIES dan raise FastPrintHTTPError."""
+        with StubAPIServer([(500, 'error', None, 0)]) as server, self.api_settings(server):
+            with self.assertRaises(FastPrintHTTPError) as ctx:
+                FastPrintAPIService.fetch_products('user')
+
+        self.assertEqual(ctx.exception.status_code, 500)
+        self.assertEqual(len(server.requests), 3)
+
+    def test_auth_error_not_retried(self):
+        """Test 401 langsung raise FastPrintAuthError tanpa retry."""
+        with StubAPIServer([(401, 'unauthorized', None, 0)]) as server, self.api_settings(server):
+            with self.assertRaises(FastPrintAuthError):
+                FastPrintAPIService.fetch_products('user')
+
+        self.assertEqual(len(server.requests), 1)
+
+    def test_read_timeout(self):
+        """Test read timeout di-retry lalu raise FastPrintTimeoutError."""
+        with StubAPIServer([(200, FEED_BODY, None, 0.5)]) as server, \
+                self.api_settings(server, READ_TIMEOUT=0.1, MAX_RETRIES=1):
+            with self.assertRaises(FastPrintTimeoutError):
+                FastPrintAPIService.fetch_products('user')
+
+        self.assertEqual(len(server.requests), 2)
+
+    def test_invalid_json(self):
+        """Test body bukan JSON raise FastPrintResponseError."""
+        with StubAPIServer([(200, '<html>maintenance</html>', None, 0)]) as server, self.api_settings(server):
+            with self.assertRaises(FastPrintResponseError):
+                FastPrintAPIService.fetch_products('user')
+            with self.assertRaises(FastPrintResponseError):
+                list(FastPrintAPIService.iter_products('user'))
+
+
+    def test_invalid_harga_names_field(self):
+        """Test harga bukan angka raise FastPrintDataError dengan nama field, bukan error JSON."""
+        body = json.dumps({'data': [{'nama_produk': 'Kertas A4', 'harga': 'lima puluh'}]})
+        with StubAPIServer([(200, body, None, 0)]) as server, self.api_settings(server):
+            with self.assertRaises(FastPrintDataError) as ctx:
+                list(FastPrintAPIService.iter_products('user'))
+
+        self.assertEqual(ctx.exception.field, 'harga')
+        self.assertIn("'lima puluh'", str(ctx.exception))
+
+
+class OpenFeedTest(TestCase):
+    """Test spool vs streaming di FastPrintAPIService.open_feed."""
+
+    def setUp(self):
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def api_settings(self, server):
+        return override_settings(FASTPRINT_API={'URL': server.url, 'MAX_RETRIES': 0})
+
+    def test_streams_without_stored_hash(self):
+        """Test tanpa body_hash tersimpan body di-stream langsung dan di-hash sambil diparse."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings(server):
+            with FastPrintAPIService.open_feed('user') as feed:
+                self.assertIsNone(feed._body)
+                self.assertEqual(len(list(feed.iter_products())), 1)
+                feed.save_validators()
+
+            with FastPrintAPIService.open_feed('user') as feed:
+                self.assertTrue(feed.not_modified)
+
+        expected = hashlib.sha256(FEED_BODY.encode()).hexdigest()
+        self.assertEqual(APIFetchState.objects.get(url=server.url).body_hash, expected)
+
+class FastPrintCredentialsTest(TestCase):
+    """Test untuk cache kredensial harian dan username dari header."""
+
+    def setUp(self):
+        FastPrintCredentials.invalidate()
+        reset_session()
+        self.addCleanup(FastPrintCredentials.invalidate)
+        self.addCleanup(reset_session)
+
+    def test_credentials_cached_per_day(self):
+        """Test password/username hanya berubah saat tanggal berganti."""
+        with mock.patch.object(FastPrintCredentials, 'today', return_value=date(2026, 2, 4)):
+            password = FastPrintAPIService.generate_password()
+            self.assertEqual(password, hashlib.md5(b'bisacoding-04-02-26').hexdigest())
+            self.assertEqual(FastPrintAPIService.generate_username(), 'tesprogrammer040226C23')
+            self.assertIs(FastPrintAPIService.generate_password(), password)
+
+        with mock.patch.object(FastPrintCredentials, 'today', return_value=date(2026, 2, 5)):
+            self.assertEqual(FastPrintAPIService.generate_password(), hashlib.md5(b'bisacoding-05-02-26').hexdigest())
+            self.assertEqual(FastPrintAPIService.generate_username(), 'tesprogrammer050226C23')
+
+    def test_learns_username_and_retries_on_401(self):
+        """Test 401 dengan header X-Credentials-Username di-retry sekali dengan username baru."""
+        responses = [
+            (401, 'unauthorized', {'X-Credentials-Username': 'tesprogrammer040226C07'}, 0),
+            (200, FEED_BODY, None, 0),
+        ]
+        with mock.patch.object(FastPrintCredentials, 'today', return_value=date(2026, 2, 4)), \
+                StubAPIServer(responses) as server, \
+                override_settings(FASTPRINT_API={'URL': server.url, 'MAX_RETRIES': 0}):
+            FastPrintAPIService.fetch_products()
+
+            self.assertEqual(len(server.requests), 2)
+            self.assertIn('username=tesprogrammer040226C23', server.requests[0]['body'])
+            self.assertIn('username=tesprogrammer040226C07', server.requests[1]['body'])
+            state = APIFetchState.objects.get(url=server.url)
+            self.assertEqual(state.username_hint, 'tesprogrammer040226C07')
+
+        # Hari berikutnya memakai counter yang dipelajari
+        with mock.patch.object(FastPrintCredentials, 'today', return_value=date(2026, 2, 5)), \
+                override_settings(FASTPRINT_API={'URL': server.url}):
+            self.assertEqual(FastPrintAPIService.generate_username(), 'tesprogrammer050226C07')
+
+
+class LookupCacheTest(TestCase):
+    """Test untuk cache lookup Status/Kategori."""
+
+    def setUp(self):
+        self.kategori = Kategori.objects.create(nama_kategori="Kertas")
+        self.status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kategori, status=self.status)
+
+    def test_listing_does_not_join_status(self):
+        """Test listing API memfilter status_id tanpa JOIN ke products_status."""
+        self.client.get('/api/products/')  # warm up cache lookup
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/products/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['kategori_detail']['nama_kategori'], 'Kertas')
+        # List + agregat validator conditional GET
+        self.assertEqual(len(queries), 2)
+        self.assertFalse(any('products_status' in q['sql'] for q in queries))
+
+    def test_signal_invalidates_cache(self):
+        """Test perubahan Kategori langsung terlihat di list KategoriViewSet."""
+        self.assertEqual([k['nama_kategori'] for k in self.client.get('/api/kategoris/').json()], ['Kertas'])
+
+        Kategori.objects.create(nama_kategori="Tinta")
+        self.assertEqual(
+            [k['nama_kategori'] for k in self.client.get('/api/kategoris/').json()], ['Kertas', 'Tinta']
+        )
+
+        # QuerySet.update() tidak mengirim signal, invalidasi manual
+        Status.objects.filter(pk=self.status.pk).update(nama_status='habis')
+        lookups.invalidate()
+        self.assertIsNone(lookups.sellable_status_id())
+        self.assertEqual(self.client.get('/api/products/').json(), [])
+
+    def test_sync_invalidates_cache(self):
+        """Test kategori baru dari sync (bulk_create) masuk ke cache."""
+        lookups.kategori_list()
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductSyncEngine().run([
+                {'nama_produk': 'Tinta Hitam', 'harga': 25000, 'kategori': 'Tinta', 'status': 'bisa dijual'},
+            ])
+        self.assertIsNotNone(lookups.get_kategori_id('Tinta'))
+
+
+class KeysetPaginationTest(TestCase):
+    """Test untuk keyset pagination listing produk."""
+
+    def setUp(self):
+        kategori = Kategori.objects.create(nama_kategori="Kertas")
+        status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.bulk_create([
+            Product(nama_produk=f"Produk {i:02d}", harga=1000 + i, kategori=kategori, status=status)
+            for i in range(25)
+        ])
+        # created_at kembar memaksa tie-break lewat id_produk
+        Product.objects.filter(nama_produk__lt="Produk 10").update(created_at=timezone.now())
+        self.expected = list(
+            Product.objects.order_by('-created_at', '-id_produk').values_list('id_produk', flat=True)
+        )
+
+    def test_api_walks_all_pages(self):
+        """Test mengikuti `next` mengembalikan semua produk tepat sekali, lalu `previous` kembali."""
+        url = '/api/products/?limit=10'
+        pages = []
+        while url:
+            data = self.client.get(url).json()
+            pages.append(data)
+            url = data['next']
+
+        self.assertEqual([len(p['results']) for p in pages], [10, 10, 5])
+        self.assertEqual([row['id_produk'] for p in pages for row in p['results']], self.expected)
+        self.assertIsNone(pages[0]['previous'])
+
+        previous = self.client.get(pages[2]['previous']).json()
+        self.assertEqual(previous['results'], pages[1]['results'])
+        self.assertEqual(self.client.get(previous['previous']).json()['results'], pages[0]['results'])
+
+    def test_api_is_opt_in(self):
+        """Test tanpa limit/page_size/cursor response tetap list penuh."""
+        self.assertEqual(len(self.client.get('/api/products/').json()), 25)
+        self.assertEqual(self.client.get('/api/products/?cursor=rusak').status_code, 404)
+
+    def test_deep_page_uses_seek(self):
+        """Test halaman berikutnya memakai WHERE, bukan OFFSET atau COUNT."""
+        next_url = self.client.get('/api/products/?page_size=10').json()['next']
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(next_url)
+        # Query agregat validator ETag (products/conditional.py) tidak ikut dicek
+        sql = ' '.join(q['sql'] for q in queries if '"last_modified"' not in q['sql']).upper()
+        self.assertNotIn('OFFSET', sql)
+        self.assertNotIn('COUNT(', sql)
+
+    @override_settings(PRODUCT_LIST_PAGINATION='seek')
+    def test_web_seek_mode(self):
+        """Test product_list mode seek dengan jumlah perkiraan."""
+        response = self.client.get('/')
+        self.assertEqual(response.context['estimated_count'], 25)
+        self.assertEqual([p.id_produk for p in response.context['products']], self.expected[:10])
+
+        response = self.client.get('/', {'cursor': response.context['seek_page'].next_cursor})
+        self.assertEqual([p.id_produk for p in response.context['products']], self.expected[10:20])
+        self.assertTrue(response.context['seek_page'].has_previous)
+
+
+class ProductSearchTest(TestCase):
+    """Test untuk full-text search produk (backend FTS5 di SQLite)."""
+
+    def setUp(self):
+        kategori = Kategori.objects.create(nama_kategori="ATK")
+        status = Status.objects.create(nama_status="bisa dijual")
+        self.kertas = Product.objects.create(
+            nama_produk="Kertas A4", harga=50000, kategori=kategori, status=status, deskripsi="HVS putih 80gsm"
+        )
+        self.tinta = Product.objects.create(
+            nama_produk="Tinta Hitam", harga=25000, kategori=kategori, status=status,
+            deskripsi="Cocok untuk printer kertas foto"
+        )
+        Product.objects.create(nama_produk="Pulpen <Biru>", harga=3000, kategori=kategori, status=status)
+
+    def search(self, query, **params):
+        return self.client.get('/api/products/', {'search': query, **params}).json()
+
+    def test_ranked_by_relevance(self):
+        """Test kecocokan di nama_produk lebih relevan daripada di deskripsi."""
+        results = self.search('kertas')
+        self.assertEqual([r['id_produk'] for r in results], [self.kertas.pk, self.tinta.pk])
+        self.assertGreater(results[0]['search_rank'], results[1]['search_rank'])
+        self.assertEqual(results[0]['highlight'], '<mark>Kertas</mark> A4')
+        self.assertEqual([r['id_produk'] for r in self.search('hvs')], [self.kertas.pk])
+
+    def test_prefix_and_escaping(self):
+        """Test kata terakhir dicari sebagai prefix dan highlight di-escape."""
+        self.assertEqual([r['nama_produk'] for r in self.search('pulp')], ['Pulpen <Biru>'])
+        self.assertEqual(self.search('pulpen')[0]['highlight'], '<mark>Pulpen</mark> &lt;Biru&gt;')
+        self.assertNotIn('search_rank', self.client.get('/api/products/').json()[0])
+
+    def test_index_maintained_on_write(self):
+        """Test update/delete produk langsung tercermin di index."""
+        Product.objects.filter(pk=self.kertas.pk).update(nama_produk="Map Plastik")
+        self.assertEqual([r['nama_produk'] for r in self.search('map')], ['Map Plastik'])
+        self.assertEqual([r['id_produk'] for r in self.search('kertas')], [self.tinta.pk])
+
+        self.tinta.delete()
+        self.assertEqual(self.search('kertas'), [])
+
+    def test_paginated_search(self):
+        """Test keyset pagination mengikuti urutan relevansi."""
+        first = self.search('kertas', limit=1)
+        second = self.client.get(first['next']).json()
+        self.assertEqual(
+            [first['results'][0]['id_produk'], second['results'][0]['id_produk']], [self.kertas.pk, self.tinta.pk]
+        )
+        self.assertIsNone(second['next'])
+
+    def test_reinstall_after_table_remake(self):
+        """Test post_migrate memasang ulang trigger FTS yang hilang dan membangun ulang index."""
+        with connection.cursor() as cursor:
+            for name in search_backend.SQLiteSearchBackend()._triggers():
+                cursor.execute(f'DROP TRIGGER {name}')
+        Product.objects.filter(pk=self.kertas.pk).update(nama_produk="Map Plastik")
+
+        search_backend.ensure_installed(sender=None, using='default')
+        self.assertEqual([r['nama_produk'] for r in self.search('map')], ['Map Plastik'])
+
+    @override_settings(PRODUCT_SEARCH_BACKEND='simple')
+    def test_simple_backend(self):
+        """Test fallback icontains dengan highlight di Python."""
+        results = self.search('kertas')
+        self.assertEqual([r['id_produk'] for r in results], [self.kertas.pk, self.tinta.pk])
+        self.assertEqual(results[0]['highlight'], '<mark>Kertas</mark> A4')
+
+    def test_web_search(self):
+        """Test pencarian di product_list."""
+        response = self.client.get('/', {'search': 'kertas'})
+        self.assertEqual([p.pk for p in response.context['products']], [self.kertas.pk, self.tinta.pk])
+        self.assertContains(response, '<mark>Kertas</mark> A4')
+
+
+class AutocompleteTest(TestCase):
+    """Test untuk index autocomplete in-memory."""
+
+    def setUp(self):
+        autocomplete.invalidate()
+        self.kategori = Kategori.objects.create(nama_kategori="ATK")
+        self.sellable = Status.objects.create(nama_status="bisa dijual")
+        self.other = Status.objects.create(nama_status="tidak bisa dijual")
+        for nama in ["Kertas HVS F4", "Kertas A4", "Tinta Kertas Foto"]:
+            Product.objects.create(nama_produk=nama, harga=1000, kategori=self.kategori, status=self.sellable)
+        Product.objects.create(nama_produk="Kertas Rusak", harga=1000, kategori=self.kategori, status=self.other)
+
+    def suggest(self, query):
+        return [r['nama_produk'] for r in self.client.get('/api/products/suggest/', {'q': query}).json()]
+
+    def test_prefix_ranking(self):
+        """Test nama berawalan query lebih dulu, produk tidak dijual diabaikan."""
+        self.assertEqual(self.suggest('ker'), ['Kertas A4', 'Kertas HVS F4', 'Tinta Kertas Foto'])
+        self.assertEqual(self.suggest('kertas f'), ['Kertas HVS F4', 'Tinta Kertas Foto'])
+        self.assertEqual(self.suggest(''), [])
+
+        with self.assertNumQueries(0):
+            autocomplete.suggest('tin')
+
+    def test_incremental_updates(self):
+        """Test save/delete Product memperbarui index tanpa rebuild."""
+        index = autocomplete.get_index()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pulpen = Product.objects.create(
+                nama_produk="Pulpen Kertas", harga=1000, kategori=self.kategori, status=self.sellable
+            )
+        self.assertIn('Pulpen Kertas', self.suggest('pul'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pulpen.status = self.other
+            pulpen.save()
+        self.assertEqual(self.suggest('pul'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.get(nama_produk="Kertas A4").delete()
+        self.assertNotIn('Kertas A4', self.suggest('ker'))
+        self.assertIs(autocomplete.get_index(), index)
+        self.assertEqual(index.vocab, sorted(index.postings))
+
+    def test_sync_invalidates(self):
+        """Test produk dari sync (bulk_create) masuk ke index."""
+        self.suggest('ker')
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductSyncEngine().run([
+                {'nama_produk': 'Map Plastik', 'harga': 2000, 'kategori': 'ATK', 'status': 'bisa dijual'},
+            ])
+        self.assertEqual(self.suggest('map'), ['Map Plastik'])
+
+    @override_settings(AUTOCOMPLETE_REFRESH_INTERVAL=0)
+    def test_changes_from_other_process(self):
+        """Test perubahan proses lain (tanpa signal di proses ini) diterapkan inkremental lewat ProductChange."""
+        index = autocomplete.get_index()
+        since = timezone.now()
+        Product.objects.bulk_create([
+            Product(nama_produk="Map Plastik", harga=2000, kategori=self.kategori, status=self.sellable),
+        ])
+        Product.objects.filter(nama_produk="Kertas A4").update(status=self.other, updated_at=timezone.now())
+        deleted = Product.objects.get(nama_produk="Kertas HVS F4").pk
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{Product._meta.db_table}" WHERE id_produk = %s', [deleted])
+        autocomplete.record_change(since=since, deleted=[deleted])
+
+        with mock.patch.object(autocomplete, '_build', wraps=autocomplete._build) as build:
+            self.assertEqual(self.suggest('map'), ['Map Plastik'])
+            self.assertEqual(self.suggest('ker'), ['Tinta Kertas Foto'])
+        build.assert_not_called()
+        self.assertIs(autocomplete.get_index(), index)
+
+        autocomplete.record_change(full=True)
+        with mock.patch.object(autocomplete, '_build', wraps=autocomplete._build) as build:
+            self.suggest('ker')
+        build.assert_called_once()
+
+    @override_settings(AUTOCOMPLETE_REFRESH_INTERVAL=0)
+    def test_single_edits_prune_change_log(self):
+        """Test save satu per satu juga memangkas ProductChange yang lebih tua dari CHANGE_RETENTION."""
+        product = Product.objects.get(nama_produk="Kertas A4")
+        for _ in range(3):
+            with self.captureOnCommitCallbacks(execute=True):
+                product.harga += 1
+                product.save()
+        ProductChange.objects.update(created_at=timezone.now() - autocomplete.CHANGE_RETENTION - timedelta(minutes=1))
+        # Jeda pemangkasan sudah lewat (setUp berjalan dengan interval default)
+        autocomplete._state['next_prune'] = 0.0
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.harga += 1
+            product.save()
+        self.assertEqual(ProductChange.objects.count(), 1)
+
+    @override_settings(AUTOCOMPLETE_REFRESH_INTERVAL=60)
+    def test_change_log_pruned_once_per_interval(self):
+        """Test pemangkasan ProductChange paling sering sekali per refresh interval."""
+        autocomplete._state['next_prune'] = 0.0
+        with CaptureQueriesContext(connection) as queries:
+            autocomplete.record_change(deleted=[1])
+            autocomplete.record_change(deleted=[2])
+        deletes = [q for q in queries if q['sql'].startswith(f'DELETE FROM "{ProductChange._meta.db_table}"')]
+        self.assertEqual(len(deletes), 1)
+
+    @override_settings(AUTOCOMPLETE_MAX_PRODUCTS=2)
+    def test_bounded_and_rebuild(self):
+        """Test jumlah produk di index dibatasi dan bisa dibangun ulang."""
+        stats = self.client.post('/api/products/suggest/rebuild/').json()
+        self.assertEqual((stats['built'], stats['products'], stats['full']), (True, 2, True))
+        self.assertGreater(stats['memory_bytes'], 0)
+
+
+class ResponseCacheTest(TransactionTestCase):
+    """Test untuk response cache API (butuh commit nyata, jadi TransactionTestCase)."""
+
+    def setUp(self):
+        self.kategori = Kategori.objects.create(nama_kategori="Kertas")
+        self.status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kategori, status=self.status)
+
+    def test_hit_and_normalized_key(self):
+        """Test request kedua dilayani dari cache, urutan/parameter kosong tidak mempengaruhi key."""
+        first = self.client.get('/api/products/?kategori=&search=kertas&limit=5')
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/products/?limit=5&search=kertas')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_etag_not_modified(self):
+        """Test If-None-Match yang cocok mendapat 304 tanpa body."""
+        etag = self.client.get('/api/kategoris/')['ETag']
+        response = self.client.get('/api/kategoris/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(self.client.get('/api/kategoris/', HTTP_IF_NONE_MATCH='"lain"').status_code, 200)
+
+    def test_invalidated_by_signals_and_sync(self):
+        """Test CRUD (signal) dan sync (bulk) membuang response lama."""
+        self.client.get('/api/products/')
+        Product.objects.create(nama_produk="Kertas F4", harga=60000, kategori=self.kategori, status=self.status)
+        response = self.client.get('/api/products/')
+        self.assertEqual((response['X-Cache'], len(response.json())), ('MISS', 2))
+
+        self.client.get('/api/products/')
+        ProductSyncEngine().run([
+            {'nama_produk': 'Kertas A3', 'harga': 70000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+        ])
+        self.assertEqual(len(self.client.get('/api/products/').json()), 3)
+
+        self.client.get('/api/kategoris/')
+        Kategori.objects.create(nama_kategori="Tinta")
+        self.assertEqual(len(self.client.get('/api/kategoris/').json()), 2)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'api': {'BACKEND': 'products.cache_backends.InMemoryRedisCache', 'LOCATION': 'memory://test-shared'},
+    })
+    def test_invalidation_from_other_process(self):
+        """Test invalidasi dari instance cache lain (proses worker) pada backend bersama."""
+        url = '/api/products/'
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        # Worker: koneksi cache sendiri ke store yang sama, tanpa signal
+        worker_cache = caches.create_connection('api')
+        self.assertIsNot(worker_cache, response_cache.get_cache())
+        Product.objects.update(harga=60000)
+        with mock.patch.object(response_cache, 'get_cache', return_value=worker_cache):
+            invalidation.products_changed()
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['harga'], '60000.00')
+
+    def test_process_local_cache_warning(self):
+        """Test check --deploy memperingatkan cache API per proses."""
+        api = {'BACKEND': 'products.cache_backends.AsyncLocMemCache'}
+        with override_settings(CACHES={'default': api, 'api': api}):
+            self.assertEqual([w.id for w in checks.check_api_cache(None)], ['products.W001'])
+        api = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': tempfile.mkdtemp()}
+        self.addCleanup(shutil.rmtree, api['LOCATION'])
+        with override_settings(CACHES={'default': api, 'api': api}):
+            self.assertEqual(checks.check_api_cache(None), [])
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'api': {'BACKEND': 'products.cache_backends.InMemoryRedisCache', 'LOCATION': 'memory://test-api'},
+    })
+    def test_redis_compatible_backend(self):
+        """Test response cache di atas stand-in Redis."""
+        self.assertEqual(self.client.get('/api/statuses/')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/api/statuses/')['X-Cache'], 'HIT')
+        before = response_cache.generation()
+        response_cache.invalidate()
+        self.assertEqual(response_cache.generation(), before + 1)
+        self.assertEqual(self.client.get('/api/statuses/')['X-Cache'], 'MISS')
+
+        client = InMemoryRedis('memory://test-raw')
+        client.set('key', b'value', ex=60)
+        self.assertIsNone(client.set('key', b'other', nx=True))
+        self.assertEqual(client.mget(['key', 'missing']), [b'value', None])
+        client.set('short', b'x', ex=0)
+        self.assertEqual(client.exists('short'), 0)
+
+
+class ConditionalGetTest(TestCase):
+    """Test untuk conditional GET (ETag/Last-Modified) pada detail dan API."""
+
+    def setUp(self):
+        self.kategori = Kategori.objects.create(nama_kategori="Kertas")
+        self.status = Status.objects.create(nama_status="bisa dijual")
+        self.product = Product.objects.create(
+            nama_produk="Kertas A4", harga=50000, kategori=self.kategori, status=self.status
+        )
+
+    def test_product_detail_not_modified(self):
+        """Test detail web menjawab 304 untuk If-None-Match dan If-Modified-Since."""
+        url = f'/products/{self.product.pk}/'
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('Last-Modified', first)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified']).status_code, 304)
+
+        self.product.harga = 55000
+        self.product.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+
+    def test_api_retrieve_not_modified(self):
+        """Test retrieve API: 304 tanpa serialisasi, 404 tetap 404."""
+        url = f'/api/products/{self.product.pk}/'
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+        self.assertEqual(self.client.get('/api/products/999/', HTTP_IF_NONE_MATCH='*').status_code, 404)
+
+    def test_list_validators_follow_writes(self):
+        """Test ETag list berubah setelah update dan delete."""
+        url = '/api/products/?limit=5'
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertNotEqual(self.client.get('/api/products/?limit=6')['ETag'], etag)
+
+        self.product.nama_produk = "Kertas A4 Plus"
+        self.product.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        Product.objects.filter(pk=self.product.pk).delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_validators_ignore_response_cache(self):
+        """Test ETag list dari database: penulisan proses lain (tanpa invalidasi cache) tetap terlihat."""
+        url = '/api/products/'
+        etag = self.client.get(url)['ETag']
+        # bulk update tidak mengirim signal, generation response cache tidak naik
+        Product.objects.filter(pk=self.product.pk).update(harga=60000, updated_at=timezone.now())
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        other = Kategori.objects.create(nama_kategori="Tinta")
+        etag = self.client.get(f'{url}?kategori={self.kategori.pk}')['ETag']
+        # Produk di luar filter tidak mengubah validator list yang difilter
+        Product.objects.create(nama_produk="Tinta Hitam", harga=1000, kategori=other, status=self.status)
+        response = self.client.get(f'{url}?kategori={self.kategori.pk}', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_ignores_if_modified_since(self):
+        """Test list tanpa Last-Modified: delete (max(updated_at) tetap) tidak menghasilkan 304 basi."""
+        Product.objects.create(nama_produk="Kertas F4", harga=1000, kategori=self.kategori, status=self.status)
+        url = '/api/products/'
+        first = self.client.get(url)
+        self.assertNotIn('Last-Modified', first)
+
+        # Nilai Last-Modified lama; produk terbaru (Kertas F4) tidak dihapus
+        since = http_date(Product.objects.latest('updated_at').updated_at.timestamp())
+        Product.objects.filter(pk=self.product.pk).delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Kertas A4"')
+
+    def test_list_etag_depends_on_format(self):
+        """Test ETag list berbeda per format renderer."""
+        json_etag = self.client.get('/api/products/?limit=5')['ETag']
+        html_etag = self.client.get('/api/products/?limit=5', HTTP_ACCEPT='text/html')['ETag']
+        self.assertNotEqual(json_etag, html_etag)
+
+
+class FastSerializerTest(TestCase):
+    """Test serializer cepat menghasilkan byte yang sama dengan ProductSerializer."""
+
+    def setUp(self):
+        kategori = Kategori.objects.create(nama_kategori="Kertas")
+        status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=kategori, status=status)
+        Product.objects.create(
+            nama_produk="Kertas “Folio” é ", harga='1234.5', kategori=kategori, status=status,
+            deskripsi="Kertas <b>folio</b> 70gsm",
+        )
+        self.kategori = kategori
+
+    def assertSameAsSerializer(self, url):
+        fast = self.client.get(url)
+        with override_settings(PRODUCT_API_FAST_SERIALIZER=False):
+            slow = self.client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+
+    def test_byte_compatible(self):
+        """Test list, pagination, search, dan by_kategori identik dengan jalur DRF."""
+        self.assertSameAsSerializer('/api/products/')
+        self.assertSameAsSerializer('/api/products/?limit=1')
+        self.assertSameAsSerializer('/api/products/?search=kertas')
+        self.assertSameAsSerializer('/api/products/?search=folio&limit=1')
+        self.assertSameAsSerializer(f'/api/products/by_kategori/?kategori_id={self.kategori.pk}')
+
+        cursor = self.client.get('/api/products/?limit=1').json()['next']
+        self.assertSameAsSerializer(cursor)
+
+    def test_renderer_fallback(self):
+        """Test float eksponen tetap ditulis seperti json stdlib."""
+        data = {'rank': 1e-07, 'items': [0.1, 1e20], 'text': 'é '}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class ProductExportTest(TestCase):
+    """Test untuk export katalog streaming."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        tinta = Kategori.objects.create(nama_kategori="Tinta")
+        status = Status.objects.create(nama_status="bisa dijual")
+        for i in range(5):
+            Product.objects.create(nama_produk=f"Kertas {i}", harga=1000 + i, kategori=self.kertas, status=status)
+        Product.objects.create(nama_produk="Tinta, Hitam", harga=2000, kategori=tinta, status=status,
+                               deskripsi='isi "ulang"')
+
+    def export(self, query):
+        response = self.client.get(f'/api/products/export/?{query}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    @override_settings(PRODUCT_EXPORT_CHUNK_SIZE=2)
+    def test_json_and_ndjson_match_list(self):
+        """Test JSON export sama dengan list API, NDJSON satu objek per baris."""
+        listing = self.client.get('/api/products/').content
+        response, body = self.export('format=json')
+        self.assertEqual(body, listing)
+        self.assertIn('products.json', response['Content-Disposition'])
+
+        response, body = self.export('format=ndjson&kategori=%d' % self.kertas.pk)
+        lines = body.decode().splitlines()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([json.loads(line)['nama_produk'] for line in lines], [f"Kertas {i}" for i in range(4, -1, -1)])
+
+    def test_csv(self):
+        """Test CSV export memakai header, quoting, dan nama kategori/status."""
+        response, body = self.export('format=csv')
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        rows = list(csv.DictReader(body.decode().splitlines()))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(
+            (rows[0]['nama_produk'], rows[0]['nama_kategori'], rows[0]['deskripsi'], rows[0]['harga']),
+            ('Tinta, Hitam', 'Tinta', 'isi "ulang"', '2000.00'),
+        )
+
+
+class BulkWriteTest(TestCase):
+    """Test untuk bulk write API produk."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        self.status = Status.objects.create(nama_status="bisa dijual")
+        self.a4 = Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kertas, status=self.status)
+        self.f4 = Product.objects.create(nama_produk="Kertas F4", harga=60000, kategori=self.kertas, status=self.status)
+
+    def post(self, items, content_type='application/json'):
+        body = json.dumps(items) if content_type == 'application/json' else items
+        return self.client.post('/api/products/bulk/', body, content_type=content_type)
+
+    def test_create_update_delete_in_one_transaction(self):
+        """Test semua operasi diterapkan dengan jumlah query konstan."""
+        items = [
+            {'op': 'update', 'id_produk': self.a4.pk, 'harga': '55000.5'},
+            {'op': 'delete', 'id_produk': self.f4.pk},
+            {'op': 'create', 'nama_produk': 'Kertas F4', 'harga': 61000, 'kategori': 'Kertas',
+             'status': self.status.pk},
+        ] + [
+            {'op': 'create', 'nama_produk': f'Kertas B{i}', 'harga': 1000, 'kategori': self.kertas.pk,
+             'status': 'bisa dijual'}
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(items)
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(len(queries), 20)
+        body = response.json()
+        self.assertEqual((body['created'], body['updated'], body['deleted']), (21, 1, 1))
+        self.assertEqual([r['index'] for r in body['results']], list(range(len(items))))
+
+        self.a4.refresh_from_db()
+        self.assertEqual(self.a4.harga, Decimal('55000.50'))
+        self.assertEqual(
+            self.a4.content_hash,
+            Product.compute_content_hash(self.a4.nama_produk, self.a4.harga, self.a4.kategori_id, self.a4.status_id),
+        )
+        self.assertFalse(Product.objects.filter(pk=self.f4.pk).exists())
+        self.assertEqual(Product.objects.get(nama_produk='Kertas F4').harga, Decimal('61000'))
+
+    def test_delete_without_per_object_signals(self):
+        """Test delete massal memakai satu DELETE tanpa signal per produk; statistik tetap benar."""
+        products = Product.objects.bulk_create([
+            Product(nama_produk=f'Kertas C{i}', harga=1000 + i, kategori=self.kertas, status=self.status)
+            for i in range(10)
+        ])
+        stats_module.refresh()
+
+        with mock.patch.object(stats_module, 'product_removed') as removed, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.post([{'op': 'delete', 'id_produk': product.pk} for product in products])
+        self.assertEqual(response.json()['deleted'], 10)
+        removed.assert_not_called()
+        deletes = [q for q in queries if q['sql'].startswith(f'DELETE FROM "{Product._meta.db_table}"')]
+        self.assertEqual(len(deletes), 1)
+        self.assertEqual(stats_module.verify(), [])
+
+    def test_digit_string_kategori_is_name(self):
+        """Test kategori berupa string angka di-resolve sebagai nama, integer sebagai id."""
+        angka = Kategori.objects.create(nama_kategori=str(self.kertas.pk))
+        other = Kategori.objects.create(nama_kategori="Tinta")
+        response = self.post([
+            {'op': 'update', 'id_produk': self.a4.pk, 'kategori': str(self.kertas.pk)},
+            {'op': 'update', 'id_produk': self.f4.pk, 'kategori': other.pk},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.a4.refresh_from_db()
+        self.f4.refresh_from_db()
+        self.assertEqual((self.a4.kategori_id, self.f4.kategori_id), (angka.pk, other.pk))
+
+    def test_errors_reported_per_index(self):
+        """Test item tidak valid dilaporkan dengan index dan tidak ada yang ditulis."""
+        response = self.post([
+            {'op': 'update', 'id_produk': self.a4.pk, 'harga': 1},
+            {'op': 'create', 'nama_produk': 'Kertas F4', 'harga': -5, 'kategori': 'Tidak Ada', 'status': 1},
+            {'op': 'delete', 'id_produk': 9999},
+            {'op': 'upsert'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        errors = {e['index']: e['errors'] for e in response.json()['errors']}
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertEqual(sorted(errors[1]), ['harga', 'kategori', 'nama_produk'])
+        self.assertIn('id_produk', errors[2])
+        self.a4.refresh_from_db()
+        self.assertEqual(self.a4.harga, Decimal('50000'))
+
+    def test_ndjson_body(self):
+        """Test body NDJSON, termasuk error parse dengan nomor baris."""
+        body = '{"op": "update", "id_produk": %d, "harga": 70000}\n\n{"op": "delete", "id_produk": %d}\n' % (
+            self.a4.pk, self.f4.pk
+        )
+        response = self.post(body, 'application/x-ndjson')
+        self.assertEqual((response.json()['updated'], response.json()['deleted']), (1, 1))
+
+        response = self.post('{"op": "delete"}\n{rusak\n', 'application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('baris 2', response.json()['detail'])
+
+
+class PriceAdjustmentTest(TestCase):
+    """Test untuk penyesuaian harga massal."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        tinta = Kategori.objects.create(nama_kategori="Tinta")
+        status = Status.objects.create(nama_status="bisa dijual")
+        self.a4 = Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kertas, status=status)
+        self.f4 = Product.objects.create(nama_produk="Kertas F4", harga='12345.67', kategori=self.kertas, status=status)
+        self.tinta = Product.objects.create(nama_produk="Tinta Hitam", harga=20000, kategori=tinta, status=status)
+
+    def adjust(self, **data):
+        return self.client.post('/api/products/adjust_prices/', data, content_type='application/json')
+
+    def test_dry_run_does_not_change_data(self):
+        """Test preview menghitung harga baru tanpa menulis."""
+        response = self.adjust(kategori='Kertas', operation='multiply', value='1.05', dry_run=True)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['affected'], 2)
+        self.assertEqual([row['harga_baru'] for row in body['sample']], ['52500.00', '12962.95'])
+        self.a4.refresh_from_db()
+        self.assertEqual(self.a4.harga, Decimal('50000'))
+        self.assertFalse(PriceAdjustment.objects.exists())
+
+    def test_apply_single_update_with_audit(self):
+        """Test operasi diterapkan dalam satu UPDATE dan tercatat di audit."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.adjust(kategori_id=self.kertas.pk, operation='multiply', value='1.05')
+        self.assertEqual(response.status_code, 200)
+        product_updates = [q for q in queries if q['sql'].startswith(f'UPDATE "{Product._meta.db_table}"')]
+        self.assertEqual(len(product_updates), 1)
+        self.assertEqual(response.json()['affected'], 2)
+
+        self.f4.refresh_from_db()
+        self.tinta.refresh_from_db()
+        self.assertEqual(self.f4.harga, Decimal('12962.95'))
+        self.assertEqual(self.tinta.harga, Decimal('20000'))
+        audit = PriceAdjustment.objects.get()
+        self.assertEqual((audit.operation, audit.affected, audit.filters), ('multiply', 2, {'kategori_id': self.kertas.pk}))
+
+        self.adjust(nama='kertas', operation='round', value='1000')
+        self.f4.refresh_from_db()
+        self.assertEqual(self.f4.harga, Decimal('13000'))
+
+    def test_digit_kategori_is_name(self):
+        """Test kategori selalu nama (juga jika hanya angka), id lewat kategori_id, sama seperti bulk API."""
+        angka = Kategori.objects.create(nama_kategori=str(self.kertas.pk + 100))
+        Product.objects.create(nama_produk="Kertas 2024", harga=1000, kategori=angka, status=self.a4.status)
+
+        response = self.adjust(kategori=angka.nama_kategori, operation='add', value='1', dry_run=True)
+        self.assertEqual(response.json()['affected'], 1)
+        response = self.adjust(kategori=str(self.kertas.pk), operation='add', value='1', dry_run=True)
+        self.assertEqual(response.json()['affected'], 0)
+        response = self.adjust(kategori_id=self.kertas.pk, operation='add', value='1', dry_run=True)
+        self.assertEqual(response.json()['affected'], 2)
+
+    def test_bounds_checked_in_update(self):
+        """Test baris yang keluar batas setelah preview tidak ikut di-UPDATE dan semuanya dibatalkan."""
+        original = pricing.preview
+
+        def stale_preview(*args, **kwargs):
+            summary = original(*args, **kwargs)
+            Product.objects.filter(pk=self.a4.pk).update(harga=MAX_HARGA)
+            return summary
+
+        with mock.patch.object(pricing, 'preview', side_effect=stale_preview):
+            with self.assertRaisesMessage(pricing.PriceAdjustmentError, '1 dari 2'):
+                pricing.apply(pricing.filter_products(kategori='Kertas'), 'add', Decimal('1'))
+
+        self.f4.refresh_from_db()
+        self.assertEqual(self.f4.harga, Decimal('12345.67'))
+        self.assertFalse(PriceAdjustment.objects.exists())
+
+    def test_invalid_result_rejected(self):
+        """Test harga hasil <= 0 dan request tanpa filter ditolak."""
+        response = self.adjust(kategori='Tinta', operation='add', value='-20000')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.adjust(operation='set', value='1000').status_code, 400)
+        self.tinta.refresh_from_db()
+        self.assertEqual(self.tinta.harga, Decimal('20000'))
+
+    def test_command(self):
+        """Test management command adjust_prices."""
+        out = StringIO()
+        call_command('adjust_prices', '--nama', 'tinta', '--add', '2500', stdout=out)
+        self.tinta.refresh_from_db()
+        self.assertEqual(self.tinta.harga, Decimal('22500'))
+        self.assertIn('1 produk diubah', out.getvalue())
+
+        call_command('adjust_prices', '--all', '--set', '1', '--dry-run', stdout=out)
+        self.tinta.refresh_from_db()
+        self.assertEqual(self.tinta.harga, Decimal('22500'))
+
+
+class ImportProductsCommandTest(TestCase):
+    """Test untuk management command import_products (engine batch di SQLite)."""
+
+    def setUp(self):
+        kertas = Kategori.objects.create(nama_kategori="Kertas")
+        status = Status.objects.create(nama_status="bisa dijual")
+        Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=kertas, status=status)
+
+    def write(self, name, content):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_csv_and_ndjson(self):
+        """Test CSV/NDJSON di-upsert, baris terakhir menang, baris tidak valid dilewati."""
+        path = self.write('produk.csv', (
+            'nama_produk,harga,kategori,status\n'
+            'Kertas A4,50000,Kertas,bisa dijual\n'
+            'Tinta Hitam,20000,Tinta,bisa dijual\n'
+            'Tinta Hitam,21000.5,Tinta,bisa dijual\n'
+            ',1000,Kertas,bisa dijual\n'
+            'Pulpen,abc,ATK,bisa dijual\n'
+        ))
+        out = StringIO()
+        call_command('import_products', path, stdout=out)
+        self.assertIn('1 baru, 0 diperbarui, 1 tidak berubah, 2 dilewati', out.getvalue())
+        self.assertEqual(Product.objects.get(nama_produk='Tinta Hitam').harga, Decimal('21000.50'))
+        self.assertTrue(Kategori.objects.filter(nama_kategori='Tinta').exists())
+
+        path = self.write('produk.ndjson', '{"nama_produk": "Kertas A4", "harga": 55000, '
+                                           '"kategori": "Kertas", "status": "bisa dijual"}\n')
+        call_command('import_products', path, stdout=out)
+        self.assertEqual(Product.objects.get(nama_produk='Kertas A4').harga, Decimal('55000'))
+
+    def test_invalid_values_skipped(self):
+        """Test nama bukan teks, nama terlalu panjang, dan harga di luar batas dilewati, bukan menggagalkan import."""
+        rows = [
+            {'nama_produk': 12345, 'harga': 1000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': ['Kertas B5'], 'harga': 1000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': {'x': 1}, 'harga': 1000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'K' * 256, 'harga': 1000, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'Kertas Mahal', 'harga': '1e20', 'kategori': 'Kertas', 'status': 'bisa dijual'},
+            {'nama_produk': 'Kertas Bool', 'harga': True, 'kategori': 'Kertas', 'status': 'bisa dijual'},
+        ]
+        path = self.write('produk.ndjson', ''.join(json.dumps(row) + '\n' for row in rows))
+        out = StringIO()
+        call_command('import_products', path, stdout=out)
+
+        self.assertIn('1 baru, 0 diperbarui, 0 tidak berubah, 5 dilewati', out.getvalue())
+        self.assertTrue(Product.objects.filter(nama_produk='12345').exists())
+        self.assertEqual(normalize_record({**rows[4], 'harga': str(MAX_HARGA)})['harga'], MAX_HARGA)
+
+    def test_api_dump(self):
+        """Test dump JSON response API dan format yang tidak dikenal."""
+        path = self.write('dump.json', json.dumps({'error': 0, 'data': [
+            {'id_produk': '1', 'nama_produk': 'Map Plastik', 'harga': '3000', 'kategori': 'ATK', 'status': 'bisa dijual'},
+        ]}))
+        call_command('import_products', path, stdout=StringIO())
+        self.assertTrue(Product.objects.filter(nama_produk='Map Plastik').exists())
+
+        with self.assertRaises(CommandError):
+            call_command('import_products', self.write('produk.txt', ''), stdout=StringIO())
+
+    def test_copy_merge_uses_model_hash_expression(self):
+        """Test content_hash di merge COPY dibangun dari Product.content_hash_expression atas kolom staging."""
+        with mock.patch.object(Product, 'content_hash_expression', wraps=Product.content_hash_expression) as expr:
+            sql, params = ProductImporter._content_hash_sql()
+
+        expr.assert_called_once()
+        for column in ('s.nama_produk', 's.harga', 'k.id_kategori', 'st.id_status'):
+            self.assertIn(column, sql)
+        self.assertNotIn(Product._meta.db_table, sql)
+        self.assertIn('|', params)
+
+
+class DedupeProductNamesTest(TestCase):
+    """Test command dedupe_product_names (persiapan unique constraint nama_produk)."""
+
+    def test_plan_avoids_existing_names(self):
+        """Test nama baru tidak bentrok dengan nama yang sudah ada atau nama baru lain."""
+        taken = {'Kertas', 'Kertas #5', 'Tinta'}
+        renames = dedupe_product_names.plan_renames({'Kertas': [1, 5, 9], 'Tinta': [2, 3]}, taken)
+
+        self.assertEqual(renames, [
+            (5, 'Kertas', 'Kertas #5-2'),
+            (9, 'Kertas', 'Kertas #9'),
+            (3, 'Tinta', 'Tinta #3'),
+        ])
+        long_name = 'x' * 255
+        (_, _, new), = dedupe_product_names.plan_renames({long_name: [1, 42]}, {long_name})
+        self.assertEqual((len(new), new[-4:]), (255, ' #42'))
+
+    def test_dry_run_does_not_write(self):
+        """Test --dry-run hanya menampilkan rencana."""
+        out = StringIO()
+        with mock.patch.object(dedupe_product_names, 'find_duplicates', return_value={'Kertas': [1, 2]}):
+            call_command('dedupe_product_names', '--dry-run', stdout=out)
+        self.assertIn("#2: 'Kertas' -> 'Kertas #2'", out.getvalue())
+
+        out = StringIO()
+        call_command('dedupe_product_names', stdout=out)
+        self.assertIn('Tidak ada nama_produk ganda', out.getvalue())
+
+
+class ReplayTransportTest(TestCase):
+    """Test untuk FASTPRINT_API['TRANSPORT'] record/replay dan fixture sintetis."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.fixture = os.path.join(self.tmp, 'feed.json')
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def api_settings(self, transport, url='http://fixture.invalid/api'):
+        reset_session()
+        return override_settings(FASTPRINT_API={
+            'URL': url, 'MAX_RETRIES': 0, 'TRANSPORT': transport, 'FIXTURE': self.fixture,
+        })
+
+    def test_record_then_replay(self):
+        """Test response yang direkam diputar ulang tanpa jaringan, termasuk 304."""
+        with StubAPIServer([(200, FEED_BODY, {'ETag': '"v1"'}, 0)]) as server:
+            with self.api_settings('record', server.url):
+                self.assertEqual(FastPrintAPIService.fetch_products('user')['data'][0]['nama_produk'], 'Kertas A4')
+        self.assertEqual(len(server.requests), 1)
+        with open(self.fixture) as f:
+            self.assertEqual(f.read(), FEED_BODY)
+
+        with self.api_settings('replay'):
+            self.assertEqual(FastPrintAPIService.fetch_products('user'), json.loads(FEED_BODY))
+            with FastPrintAPIService.open_feed('user') as feed:
+                self.assertEqual(feed.etag, '"v1"')
+                self.assertEqual(len(list(feed.iter_products())), 1)
+                feed.save_validators()
+            with FastPrintAPIService.open_feed('user') as feed:
+                self.assertTrue(feed.not_modified)
+
+    def test_record_command_uses_own_session(self):
+        """Test api_fixture record memakai session record sendiri tanpa mengubah settings/session bersama."""
+        with StubAPIServer([(200, FEED_BODY, None, 0)]) as server, self.api_settings('live', server.url):
+            shared = get_session()
+            call_command('api_fixture', 'record', '--username', 'user', '--fixture', self.fixture, stdout=StringIO())
+            self.assertIs(get_session(), shared)
+            self.assertEqual(settings.FASTPRINT_API['TRANSPORT'], 'live')
+
+        self.assertEqual(len(server.requests), 1)
+        with open(self.fixture) as f:
+            self.assertEqual(f.read(), FEED_BODY)
+
+    def test_synthetic_feed_sync(self):
+        """Test fixture sintetis N produk disinkronkan lewat replay oleh run_job."""
+        call_command('api_fixture', 'synthetic', '--products', '250', '--fixture', self.fixture, stdout=StringIO())
+
+        with self.api_settings('replay'):
+            job = run_job(claim_job(enqueue_sync(force=True)[0].pk))
+
+        self.assertEqual(job.status, SyncJob.STATUS_SUCCESS)
+        self.assertEqual(job.created, 250)
+        self.assertEqual(Product.objects.filter(nama_produk__startswith='SYN PRODUK').count(), 250)
+
+    def test_replay_without_fixture(self):
+        """Test replay tanpa fixture menghasilkan connection error yang jelas."""
+        with self.api_settings('replay'):
+            with self.assertRaises(FastPrintAPIError):
+                FastPrintAPIService.fetch_products('user')
+
+
+class KategoriStatsTest(TestCase):
+    """Test untuk statistik kategori (KategoriStats) dan endpoint /api/kategoris/stats/."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        self.tinta = Kategori.objects.create(nama_kategori="Tinta")
+        self.dijual = Status.objects.create(nama_status="bisa dijual")
+        self.habis = Status.objects.create(nama_status="tidak bisa dijual")
+        self.a4 = Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kertas, status=self.dijual)
+        Product.objects.create(nama_produk="Kertas F4", harga=60000, kategori=self.kertas, status=self.dijual)
+        Product.objects.create(nama_produk="Kertas Foto", harga=90000, kategori=self.kertas, status=self.habis)
+
+    def kertas_stats(self):
+        data = self.client.get('/api/kategoris/stats/').json()
+        return next(row for row in data if row['nama_kategori'] == 'Kertas')
+
+    def test_signals_keep_stats_in_sync(self):
+        """Test create/update/pindah kategori/delete lewat model memperbarui ringkasan."""
+        row = self.kertas_stats()
+        self.assertEqual(row['product_count'], 3)
+        self.assertEqual((row['min_harga'], row['max_harga'], row['avg_harga']), ('50000.00', '90000.00', '66666.67'))
+        self.assertEqual([s['product_count'] for s in row['per_status']], [2, 1])
+
+        self.a4.harga = 70000
+        self.a4.save()
+        self.assertEqual(self.kertas_stats()['min_harga'], '60000.00')
+        self.assertEqual(stats_module.verify(), [])
+
+        self.a4.kategori = self.tinta
+        self.a4.save()
+        self.assertEqual(self.kertas_stats()['product_count'], 2)
+        self.a4.delete()
+        self.assertEqual(stats_module.verify(), [])
+
+        detail = self.client.get(f'/api/kategoris/{self.tinta.pk}/').json()
+        self.assertEqual((detail['product_count'], detail['avg_harga'], detail['per_status']), (0, None, []))
+
+    def test_save_reuses_loaded_values(self):
+        """Test pre_save memakai nilai dari from_db, tanpa SELECT tambahan per save."""
+        product = Product.objects.get(pk=self.a4.pk)
+        with CaptureQueriesContext(connection) as queries:
+            product.harga = 55000
+            product.save()
+            product.kategori = self.tinta
+            product.save()
+        selects = [
+            q['sql'] for q in queries.captured_queries
+            if 'FROM "products_product" WHERE "products_product"."id_produk" =' in q['sql']
+        ]
+        self.assertEqual(selects, [])
+        self.assertEqual(stats_module.verify(), [])
+
+        # Instance yang dibaca tanpa field statistik tetap membaca nilai lama
+        product = Product.objects.only('nama_produk').get(pk=self.a4.pk)
+        product.harga = 65000
+        product.save()
+        self.assertEqual(stats_module.verify(), [])
+
+    def test_product_removed_locks_stats_row(self):
+        """Test product_removed mengunci baris ringkasan sebelum membaca min/max."""
+        Product.objects.create(nama_produk="Kertas B5", harga=55000, kategori=self.kertas, status=self.dijual)
+        manager = KategoriStats.objects
+        with mock.patch.object(manager, 'select_for_update', wraps=manager.select_for_update) as lock:
+            Product.objects.get(nama_produk="Kertas B5").delete()
+
+        lock.assert_called_once_with()
+        self.assertEqual(stats_module.verify(), [])
+
+    def test_bulk_paths_refresh_stats(self):
+        """Test sync, bulk API, dan penyesuaian harga memperbarui ringkasan."""
+        ProductSyncEngine().run([
+            {'nama_produk': 'Kertas A4', 'harga': 10000, 'kategori': 'Tinta', 'status': 'bisa dijual'},
+            {'nama_produk': 'Tinta Biru', 'harga': 30000, 'kategori': 'Tinta', 'status': 'bisa dijual'},
+        ])
+        self.assertEqual(stats_module.verify(), [])
+
+        BulkProductWriter().run([
+            {'op': 'delete', 'id_produk': self.a4.pk},
+            {'op': 'create', 'nama_produk': 'Tinta Merah', 'harga': 5000, 'kategori': 'Tinta', 'status': 'bisa dijual'},
+        ])
+        self.assertEqual(stats_module.verify(), [])
+
+        pricing.apply(pricing.filter_products(kategori='Tinta'), 'multiply', Decimal('2'))
+        self.assertEqual(stats_module.verify(), [])
+
+        with self.assertNumQueries(2):
+            self.client.get('/api/kategoris/stats/')
+
+    def test_command_verify_and_rebuild(self):
+        """Test kategori_stats verify mendeteksi selisih dan rebuild memperbaikinya."""
+        KategoriStats.objects.filter(kategori=self.kertas, status=self.dijual).update(product_count=99)
+
+        with self.assertRaises(CommandError):
+            call_command('kategori_stats', 'verify', stdout=StringIO())
+
+        out = StringIO()
+        call_command('kategori_stats', 'rebuild', stdout=out)
+        self.assertIn('1 kelompok diperbaiki', out.getvalue())
+        call_command('kategori_stats', 'verify', stdout=StringIO())
+
+
+class FacetTest(TestCase):
+    """Test untuk facet kategori/status di list API dan product_list."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        self.tinta = Kategori.objects.create(nama_kategori="Tinta")
+        Kategori.objects.create(nama_kategori="Kosong")
+        dijual = Status.objects.create(nama_status="bisa dijual")
+        habis = Status.objects.create(nama_status="tidak bisa dijual")
+        Product.objects.create(nama_produk="Kertas A4", harga=50000, kategori=self.kertas, status=dijual)
+        Product.objects.create(nama_produk="Kertas F4", harga=60000, kategori=self.kertas, status=habis)
+        Product.objects.create(nama_produk="Tinta Kertas Foto", harga=90000, kategori=self.tinta, status=dijual)
+        Product.objects.create(nama_produk="Tinta Hitam", harga=20000, kategori=self.tinta, status=dijual)
+
+    def counts(self, facet, field):
+        return {item[f'nama_{field}']: item['count'] for item in facet}
+
+    def test_api_facets(self):
+        """Test ?facets=1 membungkus hasil dan menghitung facet untuk filter aktif."""
+        self.assertIsInstance(self.client.get('/api/products/').json(), list)
+
+        body = self.client.get('/api/products/', {'facets': '1'}).json()
+        self.assertEqual(len(body['results']), 3)
+        self.assertEqual(self.counts(body['facets']['kategori'], 'kategori'), {'Kertas': 1, 'Tinta': 2})
+        self.assertEqual(self.counts(body['facets']['status'], 'status'), {'bisa dijual': 3, 'tidak bisa dijual': 1})
+
+        body = self.client.get('/api/products/', {'facets': '1', 'search': 'kertas', 'kategori': self.tinta.pk,
+                                                  'limit': 10}).json()
+        self.assertEqual([p['nama_produk'] for p in body['results']], ['Tinta Kertas Foto'])
+        self.assertEqual(self.counts(body['facets']['kategori'], 'kategori'), {'Kertas': 1, 'Tinta': 1})
+        self.assertEqual(self.counts(body['facets']['status'], 'status'), {'bisa dijual': 1})
+
+    def test_web_dropdown_counts(self):
+        """Test dropdown product_list hanya berisi kategori yang punya hasil, dengan jumlah."""
+        response = self.client.get('/', {'search': 'tinta'})
+        self.assertEqual(self.counts(response.context['kategoris'], 'kategori'), {'Tinta': 2})
+        self.assertContains(response, 'Tinta (2)')
+
+
+class PriceFilterOrderingTest(TestCase):
+    """Test untuk min_harga/max_harga dan ordering di list API dan product_list."""
+
+    def setUp(self):
+        kertas = Kategori.objects.create(nama_kategori="Kertas")
+        status = Status.objects.create(nama_status="bisa dijual")
+        self.prices = [15000, 5000, 25000, 5000, 30000, 12000, 8000]
+        for i, harga in enumerate(self.prices):
+            Product.objects.create(nama_produk=f"Produk {chr(ord('G') - i)}", harga=harga, kategori=kertas, status=status)
+
+    def walk(self, params):
+        """Ikuti semua halaman keyset, kembalikan (nama, harga) berurutan."""
+        body = self.client.get('/api/products/', params).json()
+        rows = body['results']
+        while body['next']:
+            body = self.client.get(body['next']).json()
+            rows += body['results']
+        return [(row['nama_produk'], row['harga']) for row in rows]
+
+    def test_price_range_and_ordering(self):
+        """Test rentang harga dan ordering harga/nama pada list tanpa pagination."""
+        rows = self.client.get('/api/products/', {'min_harga': '8000', 'max_harga': '25000', 'ordering': 'harga'}).json()
+        self.assertEqual([row['harga'] for row in rows], ['8000.00', '12000.00', '15000.00', '25000.00'])
+
+        rows = self.client.get('/api/products/', {'ordering': '-nama_produk'}).json()
+        self.assertEqual(rows[0]['nama_produk'], 'Produk G')
+
+    @override_settings(PRODUCT_API_FAST_SERIALIZER=False)
+    def test_keyset_pages_follow_sort_key(self):
+        """Test keyset pagination mengikuti ordering harga (dengan harga kembar), kedua serializer."""
+        expected = [f'{harga}.00' for harga in sorted(self.prices, reverse=True)]
+        drf_rows = self.walk({'ordering': '-harga', 'limit': 2})
+        with override_settings(PRODUCT_API_FAST_SERIALIZER=True):
+            fast_rows = self.walk({'ordering': '-harga', 'limit': 2})
+
+        self.assertEqual(drf_rows, fast_rows)
+        self.assertEqual([row[1] for row in drf_rows], expected)
+        self.assertEqual(len({row[0] for row in drf_rows}), len(self.prices))
+
+        previous = self.client.get(self.client.get('/api/products/', {'ordering': 'harga', 'limit': 3}).json()['next'])
+        back = self.client.get(previous.json()['previous']).json()['results']
+        self.assertEqual([row['harga'] for row in back], ['5000.00', '5000.00', '8000.00'])
+
+    def test_invalid_params(self):
+        """Test parameter tidak valid: 400 di API, diabaikan di halaman web."""
+        response = self.client.get('/api/products/', {'min_harga': 'abc', 'ordering': 'deskripsi'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {'min_harga', 'ordering'})
+
+        response = self.client.get('/', {'min_harga': 'abc', 'max_harga': '10000', 'ordering': 'harga'})
+        self.assertEqual([p.harga for p in response.context['products']], [5000, 5000, 8000])
+        self.assertEqual(response.context['filter_query'], 'max_harga=10000&ordering=harga')
+
+
+class TemplateFragmentTest(TestCase):
+    """Test untuk filter rupiah dan cache fragment product_list/product_detail."""
+
+    def setUp(self):
+        cache.clear()
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        self.dijual = Status.objects.create(nama_status="bisa dijual")
+        self.product = Product.objects.create(
+            nama_produk="Kertas A4", harga=Decimal('1250000.50'), kategori=self.kertas, status=self.dijual
+        )
+
+    def test_rupiah_filter(self):
+        """Test format rupiah: dibulatkan, pemisah ribuan titik, nilai tidak valid kosong."""
+        self.assertEqual(rupiah(Decimal('1250000.50')), 'Rp 1.250.001')
+        self.assertEqual(rupiah(Decimal('12962.49')), 'Rp 12.962')
+        self.assertEqual(rupiah(500), 'Rp 500')
+        self.assertEqual(rupiah('0'), 'Rp 0')
+        self.assertEqual(rupiah(None), '')
+        self.assertEqual(rupiah('abc'), '')
+
+    def test_list_fragments_cached_and_refreshed(self):
+        """Test render kedua memakai fragment (tanpa query facet), perubahan produk tampil."""
+        with CaptureQueriesContext(connection) as cold:
+            response = self.client.get('/')
+        self.assertContains(response, 'Rp 1.250.001')
+        self.assertContains(response, 'Kertas (1)')
+
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get('/')
+        self.assertContains(response, 'Kertas (1)')
+        self.assertLess(len(warm.captured_queries), len(cold.captured_queries))
+        self.assertFalse(any('products_kategoristats' in q['sql'] for q in warm.captured_queries))
+
+        self.product.harga = Decimal('20000')
+        self.product.save()
+        Product.objects.create(nama_produk="Kertas F4", harga=30000, kategori=self.kertas, status=self.dijual)
+        response = self.client.get('/')
+        self.assertContains(response, 'Rp 20.000')
+        self.assertNotContains(response, 'Rp 1.250.001')
+        self.assertContains(response, 'Kertas (2)')
+
+    def test_detail_fragment_follows_lookup_names(self):
+        """Test fragment detail memakai key baru saat produk atau nama kategori berubah."""
+        url = f'/products/{self.product.pk}/'
+        self.assertContains(self.client.get(url), 'Rp 1.250.001')
+
+        self.kertas.nama_kategori = "Kertas HVS"
+        self.kertas.save()
+        self.assertContains(self.client.get(url), 'Kertas HVS')
+
+    @override_settings(PRODUCT_TEMPLATE_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_cache(self):
+        """Test PRODUCT_TEMPLATE_CACHE_TIMEOUT = 0: facet dihitung setiap request."""
+        self.client.get('/')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/')
+        self.assertTrue(any('products_kategoristats' in q['sql'] for q in queries.captured_queries))
+
+
+class AsyncURLConf:
+    """URLconf dengan endpoint async di depan router (seperti PRODUCT_API_ASYNC = True)."""
+    urlpatterns = product_urls.async_api_urlpatterns + [path('', include('fastprint_project.urls'))]
+
+
+class AsyncAPITest(TestCase):
+    """Test untuk view async products/async_views.py dibanding ViewSet DRF."""
+
+    def setUp(self):
+        self.kertas = Kategori.objects.create(nama_kategori="Kertas")
+        self.tinta = Kategori.objects.create(nama_kategori="Tinta")
+        dijual = Status.objects.create(nama_status="bisa dijual")
+        Status.objects.create(nama_status="tidak bisa dijual")
+        self.products = [
+            Product.objects.create(nama_produk=f"Kertas A{i}", harga=1000 * i, kategori=self.kertas, status=dijual,
+                                   deskripsi="Kertas putih")
+            for i in range(1, 5)
+        ] + [Product.objects.create(nama_produk="Tinta Hitam", harga=25000, kategori=self.tinta, status=dijual)]
+        self.async_client = AsyncClient()
+
+    def get_async(self, url, params=None, headers=None):
+        with override_settings(ROOT_URLCONF=AsyncURLConf):
+            return async_to_sync(self.async_client.get)(url, params or {}, headers=headers)
+
+    def test_views_are_async(self):
+        """Test endpoint yang dipasang adalah coroutine function."""
+        for pattern in product_urls.async_api_urlpatterns:
+            self.assertTrue(asyncio.iscoroutinefunction(pattern.callback), pattern.pattern)
+
+    def test_bodies_match_viewsets(self):
+        """Test status dan body view async identik dengan ViewSet DRF."""
+        cases = [
+            ('/api/products/', {}),
+            ('/api/products/', {'search': 'kertas', 'facets': '1'}),
+            ('/api/products/', {'ordering': 'harga', 'limit': '2', 'min_harga': '2000'}),
+            ('/api/products/', {'min_harga': 'abc'}),
+            ('/api/products/', {'cursor': 'rusak'}),
+            ('/api/products/by_kategori/', {'kategori_id': self.kertas.pk}),
+            ('/api/products/by_kategori/', {'kategori_id': self.kertas.pk, 'limit': '3'}),
+            ('/api/products/by_kategori/', {}),
+            (f'/api/products/{self.products[0].pk}/', {}),
+            ('/api/products/999999/', {}),
+            ('/api/kategoris/', {}),
+            ('/api/statuses/', {}),
+        ]
+        for url, params in cases:
+            with self.subTest(url=url, params=params):
+                expected = self.client.get(url, params)
+                response = self.get_async(url, params)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+
+        page = self.get_async('/api/products/', {'ordering': 'harga', 'limit': '2'}).json()
+        self.assertEqual([p['harga'] for p in page['results']], ['1000.00', '2000.00'])
+        self.assertEqual(self.get_async(page['next']).json()['results'][0]['harga'], '3000.00')
+
+    def test_conditional_get(self):
+        """Test ETag view async sama dengan ViewSet dan If-None-Match dijawab 304."""
+        url = f'/api/products/{self.products[0].pk}/'
+        etag = self.get_async(url)['ETag']
+        self.assertEqual(etag, self.client.get(url)['ETag'])
+        self.assertEqual(self.get_async(url, headers={'If-None-Match': etag}).status_code, 304)
+
+        etag = self.get_async('/api/products/')['ETag']
+        self.assertEqual(self.get_async('/api/products/', headers={'If-None-Match': etag}).status_code, 304)
+
+    def test_other_requests_use_viewsets(self):
+        """Test write dan browsable API tetap dilayani ViewSet DRF."""
+        response = self.get_async('/api/products/', headers={'Accept': 'text/html'})
+        self.assertContains(response, 'Django REST framework', status_code=200)
+
+        with override_settings(ROOT_URLCONF=AsyncURLConf):
+            response = async_to_sync(self.async_client.delete)(f'/api/products/{self.products[0].pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Product.objects.filter(pk=self.products[0].pk).exists())
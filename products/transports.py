@@ -0,0 +1,246 @@
+"""
+Transport HTTP alternatif untuk FastPrintAPIService (settings.FASTPRINT_API['TRANSPORT']).
+
+- 'live' (default): request ke API sungguhan.
+- 'record': request ke API sungguhan, response 200 disimpan ke FIXTURE lalu
+  dilayani dari file tersebut.
+- 'replay': tanpa jaringan, semua request dilayani dari FIXTURE (termasuk
+  304 jika If-None-Match cocok dengan ETag rekaman).
+
+Fixture terdiri dari body (`FIXTURE`) dan metadata `FIXTURE.meta.json`
+(status + header penting). write_synthetic_feed() membuat fixture sintetis
+berisi N produk untuk benchmark/load test; `manage.py api_fixture serve`
+melayani fixture lewat HTTP lokal.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import shutil
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional
+
+from django.conf import settings
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ('live', 'record', 'replay')
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'X-Credentials-Username')
+WRITE_CHUNK_SIZE = 64 * 1024
+
+SYNTHETIC_KATEGORIS = [
+    'L QUEENLY', 'L MTH AKSESORIS (IM)', 'L MTH TABUNG (LK)', 'CI MTH TINTA LAIN (IM)', 'S MTH STEMPEL (IM)',
+    'L MTH AKSESORIS (LK)', 'SP MTH SPAREPART (LK)', 'CI MTH TINTA BOTOL (IM)', 'S MTH KERTAS (LK)',
+]
+SYNTHETIC_STATUSES = ['bisa dijual', 'tidak bisa dijual']
+SYNTHETIC_PREFIX = 'SYN PRODUK'
+
+
+def fixture_path(path: str = None) -> str:
+    """Path fixture absolut (relatif terhadap BASE_DIR jika tidak absolut)."""
+    from .services import api_setting
+
+    path = str(path or api_setting('FIXTURE'))
+    if not os.path.isabs(path):
+        path = os.path.join(settings.BASE_DIR, path)
+    return path
+
+
+def meta_path(path: str) -> str:
+    return f'{path}.meta.json'
+
+
+def load_meta(path: str) -> Dict:
+    try:
+        with open(meta_path(path), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'status': 200, 'headers': {'Content-Type': 'application/json'}}
+
+
+def save_fixture(path: str, chunks: Iterator[bytes], headers: Dict[str, str]) -> str:
+    """
+    Tulis body dan metadata fixture. ETag dibuat dari SHA-256 body jika
+    response asli tidak punya, supaya replay mendukung conditional fetch.
+
+    Returns:
+        str: ETag fixture
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    body_hash = hashlib.sha256()
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            body_hash.update(chunk)
+            f.write(chunk)
+
+    headers = {name: headers[name] for name in RECORDED_HEADERS if headers.get(name)}
+    headers.setdefault('Content-Type', 'application/json')
+    headers.setdefault('ETag', f'"{body_hash.hexdigest()}"')
+    with open(meta_path(path), 'w', encoding='utf-8') as f:
+        json.dump({'status': 200, 'headers': headers}, f, indent=2)
+    return headers['ETag']
+
+
+def iter_synthetic_feed(count: int, seed: int = 42) -> Iterator[bytes]:
+    """Body JSON bergaya response API dengan `count` produk, dibuat per chunk."""
+    rng = random.Random(seed)
+    yield b'{"error":0,"version":"synthetic","data":['
+    buffer = []
+    size = 0
+    for i in range(count):
+        item = json.dumps({
+            'id_produk': str(i + 1),
+            'nama_produk': f'{SYNTHETIC_PREFIX} {i:07d}',
+            'kategori': rng.choice(SYNTHETIC_KATEGORIS),
+            'harga': str(rng.randrange(1000, 500000, 500)),
+            'status': SYNTHETIC_STATUSES[0] if rng.random() < 0.8 else SYNTHETIC_STATUSES[1],
+        }).encode()
+        buffer.append(item if i == 0 else b',' + item)
+        size += len(item) + 1
+        if size >= WRITE_CHUNK_SIZE:
+            yield b''.join(buffer)
+            buffer, size = [], 0
+    buffer.append(b']}')
+    yield b''.join(buffer)
+
+
+def write_synthetic_feed(count: int, path: str = None, seed: int = 42) -> str:
+    """Buat fixture sintetis dengan `count` produk. Return path fixture."""
+    path = fixture_path(path)
+    save_fixture(path, iter_synthetic_feed(count, seed), {'X-Synthetic-Products': str(count)})
+    logger.info(f"Synthetic feed with {count} products written to {path}")
+    return path
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header or not etag:
+        return False
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+class ReplayAdapter(BaseAdapter):
+    """Layani semua request dari fixture di disk, tanpa jaringan."""
+
+    def __init__(self, path: str = None):
+        super().__init__()
+        self.path = fixture_path(path)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if not os.path.exists(self.path):
+            from requests.exceptions import ConnectionError
+            raise ConnectionError(f"Fixture {self.path} tidak ada (rekam dulu: manage.py api_fixture record)",
+                                  request=request)
+
+        meta = load_meta(self.path)
+        headers = CaseInsensitiveDict(meta.get('headers', {}))
+
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.connection = self
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+
+        if _etag_matches(request.headers.get('If-None-Match'), headers.get('ETag', '')):
+            response.status_code = 304
+            response.reason = 'Not Modified'
+            response.raw = io.BytesIO()
+            response._content = b''
+            return response
+
+        response.status_code = meta.get('status', 200)
+        response.reason = 'OK'
+        response.raw = open(self.path, 'rb')
+        headers['Content-Length'] = str(os.path.getsize(self.path))
+        if not stream:
+            response.content  # baca sekarang, file ditutup
+            response.raw.close()
+        return response
+
+    def close(self):
+        pass
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Request ke API sungguhan; response 200 disimpan sebagai fixture lalu di-replay."""
+
+    def __init__(self, path: str = None, **kwargs):
+        super().__init__(**kwargs)
+        self.replay = ReplayAdapter(path)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        response = super().send(request, stream=True, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        if response.status_code != 200:
+            if not stream:
+                response.content
+            return response
+
+        with response:
+            etag = save_fixture(self.replay.path, response.iter_content(WRITE_CHUNK_SIZE), response.headers)
+        logger.info(f"Recorded API response to {self.replay.path} (ETag {etag})")
+        return self.replay.send(request, stream=stream)
+
+
+def build_adapter(transport: str, fixture: str = None, **kwargs) -> BaseAdapter:
+    """
+    Adapter requests untuk mode transport.
+
+    Args:
+        transport (str): live, record, atau replay
+        fixture (str): Path fixture record/replay. Default FASTPRINT_API['FIXTURE']
+
+    Raises:
+        ValueError: Jika transport tidak dikenal
+    """
+    if transport == 'live':
+        return HTTPAdapter(**kwargs)
+    if transport == 'record':
+        return RecordingAdapter(fixture, **kwargs)
+    if transport == 'replay':
+        return ReplayAdapter(fixture)
+    raise ValueError(f"FASTPRINT_API['TRANSPORT'] tidak dikenal: {transport} (pilih {', '.join(TRANSPORTS)})")
+
+
+def fixture_server(path: str = None, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """
+    HTTP server lokal yang melayani fixture untuk semua POST/GET (dengan
+    ETag/304), sebagai pengganti API untuk test beban lewat jaringan.
+    Jalankan dengan serve_forever(); URL-nya http://host:server_port/.
+    """
+    path = fixture_path(path)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self.do_GET()
+
+        def do_GET(self):
+            headers = load_meta(path).get('headers', {})
+            if _etag_matches(self.headers.get('If-None-Match'), headers.get('ETag', '')):
+                self.send_response(304)
+                self.send_header('ETag', headers['ETag'])
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(os.path.getsize(path)))
+            self.end_headers()
+            with open(path, 'rb') as f:
+                shutil.copyfileobj(f, self.wfile, WRITE_CHUNK_SIZE)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
@@ -5,13 +5,14 @@ Includes REST API endpoints dan web views.
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 # Initialize router untuk REST API viewsets
 router = DefaultRouter()
 router.register(r'products', views.ProductViewSet, basename='api-product')
 router.register(r'kategoris', views.KategoriViewSet, basename='api-kategori')
 router.register(r'statuses', views.StatusViewSet, basename='api-status')
+router.register(r'sync-jobs', views.SyncJobViewSet, basename='api-sync-job')
 
 # Web URLs
 urlpatterns = [
@@ -30,3 +31,16 @@ urlpatterns = [
 urlpatterns += [
     path('api/', include(router.urls)),
 ]
+
+# Endpoint baca API versi async (products/async_views.py), didahulukan dari
+# router jika PRODUCT_API_ASYNC aktif; request lain diteruskan ke ViewSet.
+async_api_urlpatterns = [
+    path('api/products/', async_views.product_list),
+    path('api/products/by_kategori/', async_views.product_by_kategori),
+    path('api/products/<int:pk>/', async_views.product_detail),
+    path('api/kategoris/', async_views.kategori_list),
+    path('api/statuses/', async_views.status_list),
+]
+
+if async_views.is_enabled():
+    urlpatterns = async_api_urlpatterns + urlpatterns
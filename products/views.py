@@ -4,26 +4,98 @@ Menggunakan class-based views dan function-based views.
 Display hanya produk dengan status "bisa dijual".
 """
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.views.decorators.http import condition
 from django.contrib import messages
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.core.paginator import Paginator
+from django.utils.functional import SimpleLazyObject
 from django.db.models import Q
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import BrowsableAPIRenderer
 import logging
+from urllib.parse import urlencode
 
-from .models import Product, Kategori, Status
-from .serializers import ProductSerializer, ProductCreateUpdateSerializer, KategoriSerializer, StatusSerializer
-from .services import FastPrintAPIService
+from .models import Product, Kategori, Status, SyncJob
+from .serializers import (
+    ProductSerializer, ProductCreateUpdateSerializer, KategoriSerializer, StatusSerializer, SyncJobSerializer,
+    PriceAdjustmentRequestSerializer, PriceAdjustmentSerializer, KategoriStatsSerializer,
+)
+from . import (
+    autocomplete, conditional, export, facets, fast_serializers, filters, fragments, lookups, pricing, search, stats,
+)
+from .bulk import BulkProductWriter, BulkValidationError
+from .parsers import NDJSONParser
+from .response_cache import cached_response, normalize_params
+from .renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer
+from .pagination import DEFAULT_ORDERING, KeysetPagination, estimate_count, seek_page
+from .jobs import enqueue_sync, get_progress
 from .forms import ProductForm
 
 logger = logging.getLogger(__name__)
 
 
+def _list_validators(view, request):
+    """
+    Validator conditional GET untuk list produk dan by_kategori dari queryset
+    yang sudah difilter (lihat products/conditional.py).
+    """
+    queryset = view.filter_queryset(view.get_queryset())
+    if view.action == 'by_kategori':
+        kategori_id = request.query_params.get('kategori_id')
+        if not kategori_id:
+            return None, None
+        queryset = queryset.filter(kategori_id=kategori_id)
+    renderer = getattr(request, 'accepted_renderer', None)
+    return conditional.list_validators(
+        queryset, normalize_params(request.query_params), getattr(renderer, 'format', '')
+    )
+
+
+def product_queryset(params, sellable_id, listing: filters.ListingFilters):
+    """
+    Queryset list produk API: status "bisa dijual" plus filter kategori,
+    search, rentang harga, dan ordering dari query params. Dipakai
+    ProductViewSet dan view async (products/async_views.py).
+
+    Args:
+        params: request.query_params / request.GET
+        sellable_id: id status "bisa dijual" dari cache lookup (None = tidak ada)
+        listing (ListingFilters): Hasil filters.parse()
+
+    Returns:
+        tuple: (queryset, ordering keyset atau None untuk urutan default)
+    """
+    if sellable_id is None:
+        return Product.objects.none(), None
+    # id status dari cache lookup, tanpa JOIN
+    queryset = Product.objects.filter(status_id=sellable_id)
+    ordering = None
+
+    kategori = params.get('kategori')
+    if kategori:
+        queryset = queryset.filter(kategori_id=kategori)
+
+    search_query = params.get('search')
+    if search_query:
+        queryset = search.search(queryset, search_query)
+        ordering = search.SEARCH_ORDERING
+
+    # Rentang harga dan ordering eksplisit (menggantikan urutan relevansi)
+    queryset = listing.apply(queryset)
+    if listing.ordering:
+        ordering = listing.ordering
+    return queryset, ordering
+
+
 # ============================================================================
 # API Views (REST Framework)
 # ============================================================================
@@ -32,99 +104,250 @@ class ProductViewSet(viewsets.ModelViewSet):
     """
     ViewSet untuk REST API endpoint.
     Menyediakan list, create, retrieve, update, delete operations.
+
+    List mendukung keyset pagination opt-in: ?limit=20 (atau page_size)
+    lalu ikuti URL `next`/`previous` (?cursor=...). Tanpa parameter
+    tersebut response tetap list penuh.
+
+    ?search=... memakai full-text search (products/search.py): hasil urut
+    relevansi dengan field tambahan search_rank dan highlight.
+
+    list dan by_kategori di-cache (products/response_cache.py). list,
+    by_kategori, dan retrieve mendukung conditional GET (ETag/Last-Modified,
+    products/conditional.py): If-None-Match/If-Modified-Since yang cocok
+    dijawab 304 tanpa serialisasi.
+
+    list dan by_kategori diserialisasi lewat products/fast_serializers.py
+    (output sama dengan ProductSerializer) jika PRODUCT_API_FAST_SERIALIZER aktif.
+
+    ?min_harga=/?max_harga= membatasi rentang harga dan ?ordering= (harga,
+    nama_produk, created_at, awali "-" untuk turun) mengganti urutan, juga
+    untuk keyset pagination (products/filters.py).
+
+    ?facets=1 pada list menambahkan jumlah produk per kategori dan status untuk
+    filter yang aktif (products/facets.py); list tanpa pagination dibungkus
+    menjadi {"results": [...], "facets": {...}}.
     """
     permission_classes = [AllowAny]
-    queryset = Product.objects.all().select_related('kategori', 'status')
+    queryset = Product.objects.all()
     serializer_class = ProductSerializer
-    pagination_class = None
+    pagination_class = KeysetPagination
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         """
         Filter hanya produk dengan status "bisa dijual".
         Support filtering by kategori dan status.
         """
-        queryset = super().get_queryset()
-        
-        # Filter by status "bisa dijual"
-        queryset = queryset.filter(status__nama_status='bisa dijual')
-        
-        # Optional filters
-        kategori = self.request.query_params.get('kategori')
-        if kategori:
-            queryset = queryset.filter(kategori__id_kategori=kategori)
-        
-        search = self.request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(nama_produk__icontains=search)
-        
+        queryset, ordering = product_queryset(
+            self.request.query_params, lookups.sellable_status_id(), self.listing_filters()
+        )
+        if ordering:
+            self.keyset_ordering = ordering
         return queryset
 
+    def listing_filters(self) -> filters.ListingFilters:
+        """min_harga/max_harga/ordering dari query params; 400 jika tidak valid."""
+        try:
+            return filters.parse(self.request.query_params)
+        except filters.ListingFilterError as e:
+            raise ValidationError(e.errors)
+
+    def get_serializer(self, *args, **kwargs):
+        """Isi kategori/status dari cache lookup sebelum serialisasi."""
+        if args and isinstance(args[0], Product):
+            lookups.attach([args[0]])
+        elif args and kwargs.get('many'):
+            products = lookups.attach(args[0])
+            search_query = self.request.query_params.get('search')
+            if search_query:
+                products = search.attach_highlights(products, search_query)
+            args = (products,) + args[1:]
+        return super().get_serializer(*args, **kwargs)
+
+    def serialize_list(self, queryset):
+        """
+        Serialisasi list produk, dengan keyset pagination jika diminta.
+
+        Returns:
+            tuple: (data, paginated)
+        """
+        fast = fast_serializers.is_enabled()
+        rows = fast_serializers.product_values(queryset) if fast else queryset
+
+        page = self.paginate_queryset(rows)
+        items = rows if page is None else page
+        if fast:
+            data = fast_serializers.serialize_products(items, self.request.query_params.get('search'))
+        else:
+            data = self.get_serializer(items, many=True).data
+        return data, page is not None
+
+    @cached_response(validators=_list_validators)
+    def list(self, request, *args, **kwargs):
+        data, paginated = self.serialize_list(self.filter_queryset(self.get_queryset()))
+        with_facets = facets.is_requested(request.query_params)
+        if paginated:
+            response = self.get_paginated_response(data)
+        else:
+            response = Response({'results': data} if with_facets else data)
+        if with_facets:
+            response.data['facets'] = facets.facet_counts(
+                request.query_params.get('search', ''),
+                kategori=request.query_params.get('kategori'),
+                status=lookups.sellable_status_id(),
+                listing=self.listing_filters(),
+            )
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        """Detail produk; 304 jika validator client masih sama (satu query updated_at)."""
+        pk = kwargs[self.lookup_field]
+        try:
+            updated_at = self.get_queryset().filter(pk=pk).values_list('updated_at', flat=True).first()
+        except (TypeError, ValueError):
+            updated_at = None
+        etag, last_modified = conditional.object_validators(pk, updated_at)
+
+        not_modified = conditional.conditional_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        return conditional.set_validators(response, etag, last_modified)
+
     def get_serializer_class(self):
         """Gunakan ProductCreateUpdateSerializer untuk create/update operations."""
         if self.action in ['create', 'update', 'partial_update']:
             return ProductCreateUpdateSerializer
         return ProductSerializer
 
+    @action(detail=False, methods=['get'], renderer_classes=[FastJSONRenderer, NDJSONRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Export semua produk "bisa dijual" secara streaming (products/export.py).
+        Filter sama dengan list (kategori, search); tanpa pagination dan cache.
+        
+        GET /api/products/export/?format=json|ndjson|csv&kategori=1
+        """
+        export_format = request.accepted_renderer.format
+        response = StreamingHttpResponse(
+            export.stream(self.filter_queryset(self.get_queryset()), export_format,
+                          request.query_params.get('search')),
+            content_type=export.CONTENT_TYPES[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="products.{export_format}"'
+        return response
+
+    @action(detail=False, methods=['post'], parser_classes=[JSONParser, NDJSONParser])
+    def bulk(self, request):
+        """
+        Create/update/delete banyak produk dalam satu request dan satu transaksi
+        (products/bulk.py). Body: array JSON atau NDJSON (application/x-ndjson).
+        Jika ada item tidak valid, tidak ada yang ditulis dan error dilaporkan per index.
+        
+        POST /api/products/bulk/
+        [{"op": "update", "id_produk": 1, "harga": 55000}, {"op": "delete", "id_produk": 2}]
+        """
+        try:
+            result = BulkProductWriter().run(request.data)
+        except BulkValidationError as e:
+            return Response({'errors': e.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result.as_dict(), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'])
+    def adjust_prices(self, request):
+        """
+        Penyesuaian harga massal dalam satu UPDATE (products/pricing.py),
+        dicatat di PriceAdjustment. dry_run=true hanya menampilkan preview.
+        
+        POST /api/products/adjust_prices/
+        {"kategori": "Kertas", "operation": "multiply", "value": "1.05", "dry_run": true}
+        {"kategori_id": 3, "operation": "add", "value": "500"}
+        """
+        serializer = PriceAdjustmentRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        filters = {name: params[name] for name in pricing.FILTER_FIELDS if params.get(name)}
+
+        try:
+            queryset = pricing.filter_products(all_products=params['all'], **filters)
+            if params['dry_run']:
+                summary = pricing.preview(queryset, params['operation'], params['value'])
+                return Response({'dry_run': True, **summary.as_dict()})
+
+            audit = pricing.apply(
+                queryset, params['operation'], params['value'], filters=filters,
+                performed_by=f'api:{request.user}' if request.user.is_authenticated else 'api',
+            )
+        except pricing.PriceAdjustmentError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(PriceAdjustmentSerializer(audit).data)
+
     @action(detail=False, methods=['get'])
     def fetch_from_api(self, request):
         """
-        Endpoint custom untuk fetch data dari API eksternal.
+        Endpoint custom untuk enqueue sinkronisasi dari API eksternal.
+        Sinkronisasi dijalankan oleh worker (manage.py run_sync_worker);
+        pantau progress di /api/sync-jobs/<job_id>/. Gunakan force=1 untuk
+        import ulang walaupun feed tidak berubah.
         
-        GET /api/products/fetch_from_api/?username=user
+        GET /api/products/fetch_from_api/?username=user&force=1
         """
         try:
             username = request.query_params.get('username', 'user')
+            force = request.query_params.get('force') in ('1', 'true')
             
-            # Fetch data dari API eksternal
-            api_response = FastPrintAPIService.fetch_products(username)
-            
-            # Parse data produk
-            products_data = FastPrintAPIService.parse_product_data(api_response)
-            
-            # Save ke database
-            saved_count = 0
-            for prod_data in products_data:
-                # Get atau create kategori
-                kategori, _ = Kategori.objects.get_or_create(
-                    nama_kategori=prod_data['kategori']
-                )
-                
-                # Get atau create status
-                status_obj, _ = Status.objects.get_or_create(
-                    nama_status=prod_data['status']
-                )
-                
-                # Create atau update produk
-                Product.objects.update_or_create(
-                    nama_produk=prod_data['nama_produk'],
-                    defaults={
-                        'harga': prod_data['harga'],
-                        'kategori': kategori,
-                        'status': status_obj,
-                    }
-                )
-                saved_count += 1
+            job, created = enqueue_sync(username, force=force)
             
             return Response({
                 'success': True,
-                'message': f'Berhasil menyimpan {saved_count} produk',
-                'count': saved_count,
-                'api_response': api_response
-            }, status=status.HTTP_200_OK)
+                'message': 'Sinkronisasi dijadwalkan' if created else 'Sinkronisasi sedang berjalan',
+                'job_id': job.pk,
+                'status': job.status,
+                'status_url': request.build_absolute_uri(f'/api/sync-jobs/{job.pk}/'),
+            }, status=status.HTTP_202_ACCEPTED)
         
         except Exception as e:
-            logger.error(f"Error fetching products from API: {str(e)}")
+            logger.error(f"Error enqueueing API sync: {str(e)}")
             return Response({
                 'success': False,
                 'error': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        """
+        Autocomplete nama produk "bisa dijual" dari index in-memory
+        (products/autocomplete.py), tanpa query database.
+        
+        GET /api/products/suggest/?q=ker&limit=10
+        """
+        query = request.query_params.get('q', '')
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            limit = 10
+        
+        return Response(autocomplete.suggest(query, limit) if query.strip() else [])
+
+    @action(detail=False, methods=['post'], url_path='suggest/rebuild')
+    def rebuild_suggest(self, request):
+        """
+        Bangun ulang index autocomplete (proses lain membangun ulang saat refresh berikutnya).
+        
+        POST /api/products/suggest/rebuild/
+        """
+        return Response(autocomplete.rebuild())
+
+    @action(detail=False, methods=['get'])
+    @cached_response(validators=_list_validators)
     def by_kategori(self, request):
         """
         Endpoint untuk get produk berdasarkan kategori.
         
-        GET /api/products/by_kategori/?kategori_id=1
+        GET /api/products/by_kategori/?kategori_id=1&limit=20
         """
         kategori_id = request.query_params.get('kategori_id')
         if not kategori_id:
@@ -133,22 +356,56 @@ class ProductViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset().filter(kategori__id_kategori=kategori_id)
-        serializer = self.get_serializer(queryset, many=True)
+        queryset = self.get_queryset().filter(kategori_id=kategori_id)
+
+        data, paginated = self.serialize_list(queryset)
+        if paginated:
+            return self.get_paginated_response(data)
         
         return Response({
-            'count': len(serializer.data),
-            'results': serializer.data
+            'count': len(data),
+            'results': data
         }, status=status.HTTP_200_OK)
 
 
 class KategoriViewSet(viewsets.ReadOnlyModelViewSet):
-    """ReadOnly ViewSet untuk Kategori."""
+    """
+    ReadOnly ViewSet untuk Kategori.
+
+    Detail kategori dan /api/kategoris/stats/ menyertakan statistik produk
+    (jumlah, harga min/max/rata-rata, per status) dari tabel ringkasan
+    KategoriStats (lihat products/stats.py).
+    """
     queryset = Kategori.objects.all()
     serializer_class = KategoriSerializer
     permission_classes = [AllowAny]
     pagination_class = None
 
+    def get_serializer_class(self):
+        if self.action in ('retrieve', 'stats'):
+            return KategoriStatsSerializer
+        return super().get_serializer_class()
+
+    @cached_response()
+    def list(self, request, *args, **kwargs):
+        """List dari cache lookup (lihat products/lookups.py)."""
+        return Response(lookups.kategori_data())
+
+    def retrieve(self, request, *args, **kwargs):
+        kategori, = stats.attach([self.get_object()])
+        return Response(self.get_serializer(kategori).data)
+
+    @action(detail=False, methods=['get'])
+    @cached_response()
+    def stats(self, request):
+        """
+        Statistik semua kategori: GET /api/kategoris/stats/
+
+        Dua query (kategori + tabel ringkasan), tidak bergantung jumlah produk.
+        """
+        kategoris = stats.attach(self.get_queryset())
+        return Response(self.get_serializer(kategoris, many=True).data)
+
 
 class StatusViewSet(viewsets.ReadOnlyModelViewSet):
     """ReadOnly ViewSet untuk Status."""
@@ -157,6 +414,18 @@ class StatusViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [AllowAny]
     pagination_class = None
 
+    @cached_response()
+    def list(self, request, *args, **kwargs):
+        """List dari cache lookup (lihat products/lookups.py)."""
+        return Response(lookups.status_data())
+
+
+class SyncJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """ReadOnly ViewSet untuk memantau status SyncJob."""
+    queryset = SyncJob.objects.all()
+    serializer_class = SyncJobSerializer
+    permission_classes = [AllowAny]
+
 
 # ============================================================================
 # Web Views (Template Based)
@@ -166,54 +435,120 @@ def product_list(request):
     """
     View untuk display daftar produk dengan status "bisa dijual".
     Support pagination dan filtering.
+
+    PRODUCT_LIST_PAGINATION = 'seek' memakai keyset pagination (?cursor=...)
+    dengan jumlah produk perkiraan, tanpa COUNT(*) dan OFFSET; 'page'
+    memakai Paginator biasa (?page=N).
+
+    Dropdown kategori hanya berisi kategori yang punya hasil untuk pencarian
+    saat ini, beserta jumlahnya (products/facets.py).
+
+    Kartu produk dan dropdown di-cache sebagai fragment template
+    (products/fragments.py); facet baru dihitung jika fragment dropdown
+    tidak ada di cache.
     
     Template: products/product_list.html
     """
     
-    # Filter hanya produk dengan status "bisa dijual"
-    products = Product.objects.filter(
-        status__nama_status='bisa dijual'
-    ).select_related('kategori', 'status')
+    # Filter hanya produk dengan status "bisa dijual" (id dari cache lookup, tanpa JOIN)
+    products = Product.objects.filter(status_id=lookups.sellable_status_id())
     
-    # Filter by search
+    # Filter by search (full-text, urut relevansi)
     search_query = request.GET.get('search', '')
+    ordering = DEFAULT_ORDERING
     if search_query:
-        products = products.filter(nama_produk__icontains=search_query)
+        products = search.search(products, search_query)
+        ordering = search.SEARCH_ORDERING
     
     # Filter by kategori
     kategori_filter = request.GET.get('kategori')
     if kategori_filter:
-        products = products.filter(kategori__id_kategori=kategori_filter)
+        products = products.filter(kategori_id=kategori_filter)
+
+    # Rentang harga dan urutan (nilai tidak valid diabaikan)
+    listing = filters.parse(request.GET, strict=False)
+    products = listing.apply(products)
+    if listing.ordering:
+        ordering = listing.ordering
     
     # Pagination
-    paginator = Paginator(products, 10)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_size = getattr(settings, 'PRODUCT_LIST_PAGE_SIZE', 10)
+    seek_obj = None
+    estimated_count = None
     
-    # Get all kategoris untuk dropdown filter
-    kategoris = Kategori.objects.all()
+    if getattr(settings, 'PRODUCT_LIST_PAGINATION', 'page') == 'seek':
+        try:
+            seek_obj = seek_page(products, request.GET.get('cursor'), page_size, ordering)
+        except ValueError:
+            seek_obj = seek_page(products, None, page_size, ordering)
+        page_obj = None
+        object_list = seek_obj.object_list
+        estimated_count = estimate_count(products)
+    else:
+        paginator = Paginator(products, page_size)
+        page_number = request.GET.get('page')
+        page_obj = paginator.get_page(page_number)
+        object_list = page_obj.object_list
+    
+    object_list = lookups.attach(object_list)
+    if search_query:
+        object_list = search.attach_highlights(object_list, search_query)
+    
+    # Dropdown kategori dengan jumlah produk untuk filter yang aktif (satu query,
+    # hanya dijalankan jika fragment dropdown tidak ada di cache)
+    kategoris = SimpleLazyObject(lambda: facets.facet_counts(
+        search_query, kategori=kategori_filter, status=lookups.sellable_status_id(), listing=listing
+    )['kategori'])
+
+    # Query string filter aktif untuk link pagination
+    active_filters = {
+        'search': search_query,
+        'kategori': kategori_filter or '',
+        'min_harga': '' if listing.min_harga is None else listing.min_harga,
+        'max_harga': '' if listing.max_harga is None else listing.max_harga,
+        'ordering': listing.ordering_param,
+    }
+    filter_query = urlencode({name: value for name, value in active_filters.items() if value != ''})
     
     context = {
         'page_obj': page_obj,
-        'products': page_obj.object_list,
+        'seek_page': seek_obj,
+        'estimated_count': estimated_count,
+        'products': object_list,
         'kategoris': kategoris,
         'search_query': search_query,
         'kategori_filter': kategori_filter,
+        'min_harga': active_filters['min_harga'],
+        'max_harga': active_filters['max_harga'],
+        'ordering': listing.ordering_param,
+        'ordering_options': filters.ORDERING_LABELS.items(),
+        'filter_query': filter_query,
+        **fragments.context(),
     }
     
     return render(request, 'products/product_list.html', context)
 
 
+@condition(
+    etag_func=lambda request, pk: conditional.product_validators(request, pk)[0],
+    last_modified_func=lambda request, pk: conditional.product_validators(request, pk)[1],
+)
 def product_detail(request, pk):
     """
     View untuk detail produk.
     
+    Mendukung conditional GET: ETag/Last-Modified dari updated_at produk,
+    request dengan validator yang masih cocok dijawab 304 tanpa render.
+    Isi kartu detail di-cache sebagai fragment (products/fragments.py).
+    
     Template: products/product_detail.html
     """
     product = get_object_or_404(Product, id_produk=pk)
+    lookups.attach([product])
     
     context = {
         'product': product,
+        **fragments.context(),
     }
     
     return render(request, 'products/product_detail.html', context)
@@ -305,42 +640,34 @@ def product_delete(request, pk):
 
 def fetch_api_data(request):
     """
-    View untuk trigger fetch data dari API eksternal.
+    View untuk enqueue sinkronisasi dari API eksternal dan menampilkan statusnya.
     
     Template: products/fetch_api.html
     """
     if request.method == 'POST':
         try:
             username = request.POST.get('username', None)
+            force = bool(request.POST.get('force'))
             
-            # Fetch data dari API (akan generate username otomatis jika tidak diberikan)
-            api_response = FastPrintAPIService.fetch_products(username)
-            products_data = FastPrintAPIService.parse_product_data(api_response)
-            
-            # Save ke database
-            saved_count = 0
-            for prod_data in products_data:
-                kategori, _ = Kategori.objects.get_or_create(
-                    nama_kategori=prod_data['kategori']
-                )
-                status_obj, _ = Status.objects.get_or_create(
-                    nama_status=prod_data['status']
-                )
-                Product.objects.update_or_create(
-                    nama_produk=prod_data['nama_produk'],
-                    defaults={
-                        'harga': prod_data['harga'],
-                        'kategori': kategori,
-                        'status': status_obj,
-                    }
-                )
-                saved_count += 1
+            # Sinkronisasi dijalankan worker, request langsung kembali dengan job id
+            job, created = enqueue_sync(username, force=force)
             
-            messages.success(request, f'Berhasil menyimpan {saved_count} produk dari API.')
-            return redirect('product_list')
+            if created:
+                messages.success(request, f'Sinkronisasi dijadwalkan (job #{job.pk}).')
+            else:
+                messages.info(request, f'Sinkronisasi sedang berjalan (job #{job.pk}).')
+            return redirect(f"{reverse('fetch_api')}?job={job.pk}")
         
         except Exception as e:
             messages.error(request, f'Error: {str(e)}')
     
-    context = {}
+    job = None
+    job_id = request.GET.get('job')
+    if job_id and job_id.isdigit():
+        job = SyncJob.objects.filter(pk=job_id).first()
+    
+    context = {
+        'job': job,
+        'progress': get_progress(job) if job else None,
+    }
     return render(request, 'products/fetch_api.html', context)
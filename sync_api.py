@@ -7,6 +7,7 @@ django.setup()
 
 from products.services import FastPrintAPIService
 from products.models import Product, Kategori, Status
+from products.sync import ProductSyncEngine
 
 print("Fetching API data...")
 api_service = FastPrintAPIService()
@@ -21,32 +22,13 @@ print(f"Type of products_data: {type(products_data)}")
 if products_data:
     print(f"Type of first item: {type(products_data[0])}")
 
-# Save products to database
-saved_count = 0
-for i, product_data in enumerate(products_data):
-    if not isinstance(product_data, dict):
-        print(f"ERROR at index {i}: product_data is {type(product_data)}, value: {product_data}")
-        continue
-    
-    # Get or create kategori
-    kategori, _ = Kategori.objects.get_or_create(nama_kategori=product_data['kategori'])
-    
-    # Get or create status
-    status, _ = Status.objects.get_or_create(nama_status=product_data['status'])
-    
-    # Create or update product
-    product, created = Product.objects.update_or_create(
-        nama_produk=product_data['nama_produk'],
-        defaults={
-            'harga': int(product_data['harga']),
-            'kategori': kategori,
-            'status': status
-        }
-    )
-    if created:
-        saved_count += 1
-
-print(f'Successfully saved {saved_count} new products')
+# Save products to database (bulk upsert)
+result = ProductSyncEngine(source=FastPrintAPIService.get_api_url(), detect_removed=True).run(products_data)
+saved_count = result.created
+
+print(f'Successfully saved {saved_count} new products ({result.updated} updated, {result.unchanged} unchanged)')
+if result.removed:
+    print(f'{result.removed} products disappeared from the feed: {result.removed_names[:10]}')
 print(f'\nDatabase stats:')
 print(f'  Products: {Product.objects.count()}')
 print(f'  Categories: {Kategori.objects.count()}')